@@ -0,0 +1,16 @@
+from .import_time import bench_import_time
+from .hot_paths import bench_hot_paths
+from .baseline import load_baseline, save_baseline, missing, compare
+
+SUITES = {
+    'import_time': bench_import_time,
+    'hot_paths': bench_hot_paths
+}
+
+# Suites taking channel sizes (`bench --sizes`)
+SIZED_SUITES = ('hot_paths',)
+
+__all__ = [
+    'SUITES', 'SIZED_SUITES', 'bench_import_time', 'bench_hot_paths',
+    'load_baseline', 'save_baseline', 'missing', 'compare'
+]
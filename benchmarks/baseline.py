@@ -0,0 +1,67 @@
+import json
+import os
+from typing import Dict, List, Any
+
+# Measurements compared against the baseline, with the absolute change below which a difference is noise
+TRACKED = {'ms': 1.0, 'peak_kib': 64.0}
+
+
+def load_baseline(path: str) -> Dict[str, Dict[str, Any]]:
+    """Stored suite results, or {} when no baseline was saved yet."""
+    if not os.path.exists(path):
+        return {}
+    with open(path) as f:
+        return json.load(f)
+
+
+def save_baseline(path: str, results: Dict[str, Dict[str, Any]]) -> None:
+    """Merge results into the baseline file, replacing the suites that were run."""
+    baseline = load_baseline(path)
+    baseline.update(results)
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    with open(path, 'w') as f:
+        json.dump(baseline, f, indent=2, sort_keys=True)
+        f.write('\n')
+
+
+def missing(results: Dict[str, Dict[str, Any]], baseline: Dict[str, Dict[str, Any]]) -> List[str]:
+    """Suites and suite/case names in results that the baseline has no measurements for."""
+    names = []
+    for suite, cases in results.items():
+        if suite not in baseline:
+            names.append(suite)
+            continue
+        names.extend(f"{suite}/{case}" for case in cases if not isinstance(baseline[suite].get(case), dict))
+    return names
+
+
+def compare(results: Dict[str, Dict[str, Any]], baseline: Dict[str, Dict[str, Any]],
+            threshold: float = 0.25) -> List[Dict[str, Any]]:
+    """
+    Cases that got slower or allocate more than the baseline allows.
+
+    A measurement regresses when it exceeds the baseline by more than
+    `threshold` (relative) and by more than its noise floor in TRACKED
+    (absolute), so sub-millisecond cases do not flap. Cases missing from
+    the baseline are not compared; `missing` lists them.
+    """
+    regressions = []
+    for suite, cases in results.items():
+        for case, measured in cases.items():
+            stored = baseline.get(suite, {}).get(case)
+            if not isinstance(stored, dict) or not isinstance(measured, dict):
+                continue
+            for metric, floor in TRACKED.items():
+                before, after = stored.get(metric), measured.get(metric)
+                if before is None or after is None:
+                    continue
+                if after > before * (1 + threshold) and after - before > floor:
+                    regressions.append({
+                        'suite': suite,
+                        'case': case,
+                        'metric': metric,
+                        'baseline': before,
+                        'measured': after,
+                        'change_pct': round((after - before) / before * 100, 1) if before else None
+                    })
+    return regressions
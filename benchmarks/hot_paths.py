@@ -0,0 +1,193 @@
+import gc
+import time
+import tracemalloc
+from typing import Dict, List, Any, Callable, Sequence
+from .synthetic import synthetic_channel
+
+# Channel sizes (videos) every case runs at; `bench --sizes` overrides them
+SIZES = (100, 1000, 10000)
+
+
+def _indexes(videos: List[Dict]) -> Dict[str, Any]:
+    """The trend indexes gather fills video by video."""
+    from src.analytics import RankingIndex, GeographyCube, ContentIndex, DescriptionIndex
+
+    ranking, geography, content, descriptions = RankingIndex(), GeographyCube(), ContentIndex(), DescriptionIndex()
+    for video in videos:
+        ranking.add(video)
+        geography.add_rows(video.get('geography', []), video['id'])
+        content.add(video)
+        descriptions.add(video)
+    return {'ranking': ranking, 'geography': geography, 'content': content, 'descriptions': descriptions}
+
+
+def _trend_cases(data: Dict[str, Any], indexes: Dict[str, Any]) -> Dict[str, Callable[[], Any]]:
+    from src.analytics import trend_analysis as trends
+
+    videos = data['videos']
+    return {
+        'trends.indexes': lambda: _indexes(videos),
+        'trends.analyze_trends': lambda: trends.analyze_trends(videos, **indexes),
+        'trends.view_trend': lambda: trends._calculate_view_trend(videos),
+        'trends.engagement_trend': lambda: trends._calculate_engagement_trend(videos),
+        'trends.watch_time_trend': lambda: trends._calculate_watch_time_trend(videos),
+        'trends.top_videos': lambda: trends._find_top_videos(indexes['ranking']),
+        'trends.bottom_videos': lambda: trends._find_bottom_videos(indexes['ranking']),
+        'trends.content_types': lambda: trends._analyze_content_types(videos, indexes['content']),
+        'trends.descriptions': lambda: trends._analyze_descriptions(videos, indexes['descriptions']),
+        'trends.demographic_changes': lambda: trends._track_demographic_changes(videos),
+        'trends.geographic_growth': lambda: trends._analyze_geographic_growth(videos, indexes['geography'])
+    }
+
+
+def _section_payloads(data: Dict[str, Any]) -> Dict[str, Any]:
+    """anomalies, forecasts and cohorts payloads, computed by the analytics code gather runs."""
+    from src.analytics import AnomalyDetector, ForecastIndex, CohortMatrix
+    from src.api.rows import to_epoch_day
+    from .synthetic import END_DATE
+
+    videos = data['videos']
+    forecaster = ForecastIndex()
+    # Curves as long as the synthetic history, which stands in for each video's first days
+    cohorts = CohortMatrix(days=60)
+    end_day = to_epoch_day(END_DATE.strftime('%Y-%m-%d'))
+    for video in videos:
+        forecaster.add(video)
+        published_day = video['published_ts'] // 86400
+        window = cohorts.pending(video['id'], published_day, end_day)
+        if window:
+            first, last, settled = window
+            views = video['history']['views']
+            days = [published_day + column for column in range(first, last + 1)]
+            cohorts.update(video['id'], video['title'], published_day, first, last, settled,
+                           days, views[first:last + 1])
+    return {
+        'anomalies': AnomalyDetector().analyze(data['period_stats'], videos),
+        'forecasts': forecaster.analyze(data['period_stats']['history']),
+        'cohorts': cohorts.analyze()
+    }
+
+
+def _formatter_cases(data: Dict[str, Any], indexes: Dict[str, Any]) -> Dict[str, Callable[[], Any]]:
+    from src.analytics import analyze_trends
+    from src.report import GDocsReporter
+    from src.report.formatters import (
+        ChannelFormatter, VideoFormatter, GeographyFormatter, PeakViewingFormatter,
+        TrendFormatter, GenderFormatter, AgeRangeFormatter, AnomalyFormatter,
+        CommentFormatter, ForecastFormatter, CohortFormatter
+    )
+
+    videos = data['videos']
+    trend_data = analyze_trends(videos, **indexes)
+    descriptions = trend_data['content_insights']['description_similarity']
+    expansion = trend_data['audience_trends']['geographic_expansion']
+    audiences = [audience for audience in trend_data['audience_trends']['demographic_shifts'] if audience]
+    channel, video, geography = ChannelFormatter(), VideoFormatter(), GeographyFormatter()
+    sections = _section_payloads(data)
+    reporter = GDocsReporter()
+
+    return {
+        'formatters.overview': lambda: channel.format_overview(data['channel_stats']),
+        'formatters.period_stats': lambda: channel.format_period_stats(data['period_stats']),
+        'formatters.videos': lambda: video.format_videos_section(videos, descriptions),
+        'formatters.peak_viewing': lambda: PeakViewingFormatter().format_peak_viewing(data['peak_viewing']),
+        'formatters.geography': lambda: geography.format_geography(data['geo_distribution']),
+        'formatters.geographic_expansion': lambda: geography.format_geographic_expansion(expansion),
+        'formatters.trends': lambda: TrendFormatter().format_trends(trend_data),
+        'formatters.gender': lambda: GenderFormatter().format_gender_breakdown(audiences),
+        'formatters.age': lambda: AgeRangeFormatter().format_age_breakdown(audiences),
+        'formatters.anomalies': lambda: AnomalyFormatter().format_anomalies(sections['anomalies']),
+        'formatters.comments': lambda: CommentFormatter().format_comments(data['comments']),
+        'formatters.forecasts': lambda: ForecastFormatter().format_forecasts(sections['forecasts']),
+        'formatters.cohorts': lambda: CohortFormatter().format_cohorts(sections['cohorts']),
+        # The whole report through the DocumentBuilder, as render --dry-run does
+        'formatters.build_requests': lambda: reporter.build_requests(
+            data['channel_stats'], data['period_stats'], videos, data['peak_viewing'],
+            data['geo_distribution'], trend_data, anomalies=sections['anomalies'],
+            comments=data['comments'], forecasts=sections['forecasts'], cohorts=sections['cohorts']
+        )
+    }
+
+
+def _utility_cases(data: Dict[str, Any], indexes: Dict[str, Any]) -> Dict[str, Callable[[], Any]]:
+    from src.utils import DataFormatter, DateHelper
+
+    videos = data['videos']
+    views = [video['stats']['views'] for video in videos]
+    rates = [video['impressions']['click_through_rate'] for video in videos]
+    changes = [video['comparison']['7d']['views']['change_pct'] for video in videos]
+    minutes = [video['performance']['watch_time'] for video in videos]
+    sources = [row['source'] for video in videos for row in video['demographics']['traffic']]
+    descriptions = [video['description'] for video in videos]
+    durations = [f"PT{video['duration_seconds'] // 60}M{video['duration_seconds'] % 60}S" for video in videos]
+    seconds = [video['duration_seconds'] for video in videos]
+    timestamps = [video['published_at'] for video in videos]
+    epochs = [video['published_ts'] for video in videos]
+
+    return {
+        'data_formatter.format_number': lambda: [DataFormatter.format_number(value) for value in views],
+        'data_formatter.format_percentage': lambda: [DataFormatter.format_percentage(value) for value in rates],
+        'data_formatter.format_change': lambda: [DataFormatter.format_change(value) for value in changes],
+        'data_formatter.format_time': lambda: [DataFormatter.format_time(value) for value in minutes],
+        'data_formatter.format_traffic_source': lambda: [
+            DataFormatter.format_traffic_source(source) for source in sources
+        ],
+        'data_formatter.split_paragraphs': lambda: [DataFormatter.split_paragraphs(text) for text in descriptions],
+        'date_helper.format_duration': lambda: [DateHelper.format_duration(value) for value in durations],
+        'date_helper.parse_duration': lambda: [DateHelper.parse_duration(value) for value in durations],
+        'date_helper.format_seconds': lambda: [DateHelper.format_seconds(value) for value in seconds],
+        'date_helper.format_timestamp': lambda: [DateHelper.format_timestamp(value) for value in timestamps],
+        'date_helper.parse_timestamp': lambda: [DateHelper.parse_timestamp(value) for value in timestamps],
+        'date_helper.format_epoch': lambda: [DateHelper.format_epoch(value) for value in epochs]
+    }
+
+
+CASE_GROUPS = (_trend_cases, _formatter_cases, _utility_cases)
+
+
+def measure(function: Callable[[], Any], repeat: int = 3) -> Dict[str, float]:
+    """
+    Best-of-N wall time, then one traced run for allocations.
+
+    Timed runs go without tracemalloc (it slows allocation-heavy code several
+    times over); the traced run reports the peak memory the call needed on
+    top of what was live before it and the memory its result still holds.
+    """
+    timings = []
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        result = function()
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del result
+    return {
+        'ms': round(min(timings) * 1000, 3),
+        'peak_kib': round((peak - before) / 1024, 1),
+        'retained_kib': round((current - before) / 1024, 1)
+    }
+
+
+def bench_hot_paths(repeat: int = 3, sizes: Sequence[int] = SIZES) -> Dict[str, Dict[str, float]]:
+    """
+    Timings and allocations of every trend function, formatter and helper, keyed 'case@videos'.
+
+    Each size gets a fresh synthetic channel; 100k videos take a few GB and several minutes.
+    """
+    results = {}
+    for size in sizes:
+        data = synthetic_channel(size)
+        indexes = _indexes(data['videos'])
+        for group in CASE_GROUPS:
+            for name, function in group(data, indexes).items():
+                results[f"{name}@{size}"] = measure(function, repeat)
+        del data, indexes
+    return results
@@ -0,0 +1,50 @@
+import sys
+import json
+import subprocess
+from pathlib import Path
+from typing import Dict, List, Any
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Modules whose cold import cost we track; the CLI must stay cheap to import.
+IMPORT_TARGETS = [
+    'main',
+    'src',
+    'src.analytics',
+    'src.report',
+    'src.report.formatters',
+    'src.analytics.trend_analysis',
+    'googleapiclient.discovery'
+]
+
+_PROBE = (
+    "import sys, time, json\n"
+    "start = time.perf_counter()\n"
+    "import {module}\n"
+    "elapsed = time.perf_counter() - start\n"
+    "print(json.dumps({{'seconds': elapsed, "
+    "'google_client_loaded': 'googleapiclient.discovery' in sys.modules}}))\n"
+)
+
+def _measure(module: str) -> Dict[str, Any]:
+    """Import a module in a fresh interpreter and report its cold import time."""
+    result = subprocess.run(
+        [sys.executable, '-c', _PROBE.format(module=module)],
+        cwd=ROOT, capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        return {'seconds': None, 'google_client_loaded': None, 'error': result.stderr.strip().splitlines()[-1]}
+    return json.loads(result.stdout)
+
+def bench_import_time(repeat: int = 3, targets: List[str] = None) -> Dict[str, Dict[str, Any]]:
+    """Best-of-N cold import time per target module, in milliseconds."""
+    results = {}
+    for module in targets or IMPORT_TARGETS:
+        runs = [_measure(module) for _ in range(repeat)]
+        timings = [run['seconds'] for run in runs if run['seconds'] is not None]
+        results[module] = {
+            'ms': round(min(timings) * 1000, 2) if timings else None,
+            'google_client_loaded': runs[0]['google_client_loaded'],
+            'error': runs[0].get('error')
+        }
+    return results
@@ -0,0 +1,205 @@
+import random
+from array import array
+from datetime import datetime, timedelta
+from typing import Dict, List, Any
+from src.api.rows import ReportTable, to_epoch_day
+from src.analytics.comparison import PeriodComparison, HORIZONS
+
+COUNTRIES = ['US', 'IN', 'BR', 'GB', 'DE', 'FR', 'CA', 'MX', 'JP', 'ID', 'PH', 'ES', 'IT', 'AU', 'KR', 'TR']
+AGE_GROUPS = ['13-17', '18-24', '25-34', '35-44', '45-54', '55-64', '65-']
+TRAFFIC_SOURCES = ['Search', 'Suggested', 'Channel', 'Shorts', 'Other']
+TOPICS = ['python', 'cooking', 'travel', 'fitness', 'music', 'gaming', 'finance', 'review']
+FORMATS = ['tutorial', 'vlog', 'review', 'livestream', 'shorts', 'podcast']
+WORDS = (
+    'quick easy guide beginner advanced tips tricks best worst ultimate complete honest first '
+    'week day year new old cheap budget pro setup build recipe trip workout update'
+).split()
+
+# Paragraphs that real channels paste under every video, so description templates show up
+BOILERPLATE = [
+    "Subscribe for new videos every week and turn on notifications so you never miss one.",
+    "Merch, memberships and sponsors: shop.example.com. Business enquiries: team@example.com.",
+    "Follow along on social media for behind the scenes clips and polls on upcoming videos."
+]
+
+# Synthetic channels end on a fixed day, so every run benchmarks identical data
+END_DATE = datetime(2026, 1, 31)
+
+
+def _table(columns: Dict[str, Any], date_columns: List[str] = ()) -> ReportTable:
+    return ReportTable(columns, date_columns)
+
+
+def _comparison(rng: random.Random, views: int) -> Dict[str, Dict[str, Dict[str, float]]]:
+    comparison = {}
+    for horizon in HORIZONS:
+        current = int(views * horizon / 365 * rng.uniform(0.5, 1.5))
+        previous = int(views * horizon / 365 * rng.uniform(0.5, 1.5))
+        comparison[f"{horizon}d"] = {
+            'views': {
+                'current': current,
+                'previous': previous,
+                'delta': current - previous,
+                'change_pct': (current - previous) / previous * 100 if previous else None
+            }
+        }
+    return comparison
+
+
+def synthetic_video(rng: random.Random, index: int) -> Dict[str, Any]:
+    """One enriched video shaped like gather's output, with every per-video payload."""
+    topic = rng.choice(TOPICS)
+    video_format = rng.choice(FORMATS)
+    published = END_DATE - timedelta(days=index * 0.7 + rng.random(), seconds=rng.randrange(86400))
+    views = int(rng.paretovariate(1.2) * 500)
+    watch_time = views * rng.uniform(1.0, 6.0)
+    countries = rng.sample(COUNTRIES, rng.randint(3, 10))
+    country_views = [int(views * share) for share in sorted((rng.random() for _ in countries), reverse=True)]
+    sources = rng.sample(TRAFFIC_SOURCES, rng.randint(2, 5))
+    end_day = to_epoch_day(END_DATE.strftime('%Y-%m-%d'))
+    duration = rng.randint(30, 3600)
+
+    description = "\n\n".join(
+        [f"{' '.join(rng.choices(WORDS, k=rng.randint(8, 30)))} {topic} {video_format}."]
+        + rng.sample(BOILERPLATE, rng.randint(0, len(BOILERPLATE)))
+    )
+    audience = [(age, gender) for age in rng.sample(AGE_GROUPS, 3) for gender in ('Female', 'Male')]
+
+    return {
+        'title': f"{' '.join(rng.choices(WORDS, k=3)).title()} {topic} {video_format} #{index}",
+        'id': f"vid{index:07d}",
+        'stats': {
+            'views': views,
+            'likes': int(views * rng.uniform(0.01, 0.08)),
+            'comments': int(views * rng.uniform(0.0, 0.01))
+        },
+        'published_at': published.strftime('%Y-%m-%dT%H:%M:%SZ'),
+        'published_ts': int((published - datetime(1970, 1, 1)).total_seconds()),
+        'duration_seconds': duration,
+        'duration': f"{duration // 60}:{duration % 60:02d}",
+        'description': description,
+        'tags': [topic, video_format] + rng.sample(WORDS, rng.randint(0, 4)),
+        'comments_activity': {'stored_threads': 0, 'recent_threads': 0, 'velocity': 0.0},
+        'performance': {
+            'watch_time': round(watch_time, 1),
+            'avg_view_duration': round(watch_time * 60 / views, 1) if views else 0.0,
+            'avg_percentage_watched': round(rng.uniform(20, 80), 1)
+        },
+        'impressions': {
+            'impressions': views * rng.randint(5, 20),
+            'click_through_rate': round(rng.uniform(1, 12), 2)
+        },
+        'geography': _table({
+            'country': countries,
+            'watch_time_minutes': array('d', (value * watch_time / max(views, 1) for value in country_views)),
+            'views': array('q', country_views)
+        }),
+        'retention': {
+            'retention_points': _table({
+                'position': array('d', (step / 20 for step in range(21))),
+                'retention_percentage': array('d', (rng.uniform(0.2, 1.0) for _ in range(21)))
+            })
+        },
+        'engagement': {
+            'views': views,
+            'watch_time': round(watch_time, 1),
+            'avg_view_duration': round(watch_time * 60 / views, 1) if views else 0.0
+        },
+        'real_time': {
+            'daily_views': _table({
+                'date': array('l', (end_day - offset for offset in (2, 1, 0))),
+                'views': array('q', (rng.randint(0, views // 30 + 1) for _ in range(3)))
+            }, ['date'])
+        },
+        'demographics': {
+            'audience': _table({
+                'age_group': [age for age, _ in audience],
+                'gender': [gender for _, gender in audience],
+                'percentage': array('d', (rng.uniform(1, 30) for _ in audience))
+            }),
+            'traffic': _table({
+                'source': sources,
+                'views': array('q', sorted((rng.randint(0, views) for _ in sources), reverse=True))
+            })
+        },
+        'comparison': _comparison(rng, views),
+        # Seeded apart from rng, so the other payloads do not change with it
+        'history': _history(views, end_day, random.Random(f"{index}:{views}"))
+    }
+
+
+def _history(views: int, end_day: int, rng: random.Random, days: int = 60) -> ReportTable:
+    """Daily views of the forecast window, with a weekly rhythm."""
+    return _table({
+        'day': array('l', range(end_day - days + 1, end_day + 1)),
+        'views': array('q', (
+            int(views / 365 * (1.3 if day % 7 in (2, 3) else 0.9) * rng.uniform(0.7, 1.3))
+            for day in range(end_day - days + 1, end_day + 1)
+        ))
+    }, ['day'])
+
+
+def synthetic_channel(videos: int, seed: int = 0) -> Dict[str, Any]:
+    """A gathered-data dict (as gather returns it, before trend analysis) for a channel of `videos` videos."""
+    rng = random.Random(seed)
+    end_day = to_epoch_day(END_DATE.strftime('%Y-%m-%d'))
+    history_days = 2 * max(HORIZONS)
+    daily_views = [rng.randint(videos, videos * 20) for _ in range(history_days)]
+    # A few viral days, so the anomalies section has alerts to list
+    for offset in (5, 12, 20):
+        daily_views[-offset] *= 8
+    history = _table({
+        'day': array('l', range(end_day - history_days + 1, end_day + 1)),
+        'watch_time_minutes': array('d', (views * rng.uniform(1, 5) for views in daily_views)),
+        'views': array('q', daily_views),
+        'avg_view_duration': array('d', (rng.uniform(60, 600) for _ in daily_views)),
+        'likes': array('q', (views // rng.randint(15, 60) for views in daily_views)),
+        'subscribers_gained': array('q', (views // rng.randint(50, 200) for views in daily_views))
+    }, ['day'])
+    daily = history[-30:]
+    total_views = sum(daily['views'])
+
+    video_list = [synthetic_video(rng, index) for index in range(videos)]
+    geo_views = sorted((rng.randint(100, videos * 1000) for _ in COUNTRIES), reverse=True)
+    authors = [f"{rng.choice(WORDS).title()}{number}" for number in range(10)]
+    return {
+        'sections': None,
+        'channel_stats': {
+            'subscriber_count': videos * 150,
+            'view_count': sum(video['stats']['views'] for video in video_list),
+            'video_count': videos
+        },
+        'period_stats': {
+            'total_views': total_views,
+            'watch_time_hours': round(sum(daily['watch_time_minutes']) / 60, 2),
+            'avg_daily_views': round(total_views / len(daily), 2),
+            'daily_data': daily,
+            'history': history,
+            'comparison': PeriodComparison(history, end_day).summary(HORIZONS)
+        },
+        'videos': video_list,
+        'peak_viewing': {
+            'peak_times': _table({
+                'date': array('l', sorted(rng.sample(range(end_day - 29, end_day + 1), 10))),
+                'watch_time': array('d', (rng.uniform(100, 1000) for _ in range(10))),
+                'views': array('q', sorted((rng.randint(100, 1000) for _ in range(10)), reverse=True))
+            }, ['date'])
+        },
+        'geo_distribution': _table({
+            'country': list(COUNTRIES),
+            'watch_time_minutes': array('d', (views * rng.uniform(1, 5) for views in geo_views)),
+            'views': array('q', geo_views)
+        }),
+        'comments': {
+            'videos_synced': videos,
+            'videos_skipped': videos // 10,
+            'full_syncs': videos // 7,
+            'threads_changed': videos * 3,
+            'threads_removed': videos // 50,
+            'total_threads': videos * 40,
+            'top_commenters': [
+                {'author': author, 'threads': videos // (rank + 1), 'likes': videos * 2 // (rank + 1)}
+                for rank, author in enumerate(authors)
+            ]
+        }
+    }
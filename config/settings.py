@@ -1,5 +1,5 @@
 import os
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional
 
 class Settings:
     DEFAULT_CONFIG = {
@@ -7,7 +7,18 @@ class Settings:
         'token_path': 'token.pickle',
         'report_period_days': 30,
         'max_videos': 50,
-        'log_level': 'INFO'
+        'log_level': 'INFO',
+        'state_dir': '.analytics_state',
+        'report_sections': None,
+        'streaming': False,
+        'comment_workers': 4,
+        'max_concurrency': 16,
+        'comparison_horizons': [7, 28, 90],
+        'work_queue': None,
+        'local_workers': 0,
+        'queue_stall_timeout': 600,
+        'cohort_days': 90,
+        'output_mode': 'docs'
     }
 
     @classmethod
@@ -18,5 +29,28 @@ class Settings:
             'token_path': os.getenv('YT_TOKEN_PATH', cls.DEFAULT_CONFIG['token_path']),
             'report_period_days': int(os.getenv('YT_REPORT_PERIOD', cls.DEFAULT_CONFIG['report_period_days'])),
             'max_videos': int(os.getenv('YT_MAX_VIDEOS', cls.DEFAULT_CONFIG['max_videos'])),
-            'log_level': os.getenv('YT_LOG_LEVEL', cls.DEFAULT_CONFIG['log_level'])
-        }
\ No newline at end of file
+            'log_level': os.getenv('YT_LOG_LEVEL', cls.DEFAULT_CONFIG['log_level']),
+            'state_dir': os.getenv('YT_STATE_DIR', cls.DEFAULT_CONFIG['state_dir']),
+            'report_sections': cls.parse_list(os.getenv('YT_REPORT_SECTIONS')),
+            'streaming': os.getenv('YT_STREAMING', str(cls.DEFAULT_CONFIG['streaming'])).lower() in ('1', 'true', 'yes'),
+            'comment_workers': int(os.getenv('YT_COMMENT_WORKERS', cls.DEFAULT_CONFIG['comment_workers'])),
+            'max_concurrency': int(os.getenv('YT_MAX_CONCURRENCY', cls.DEFAULT_CONFIG['max_concurrency'])),
+            'comparison_horizons': [
+                int(days) for days in cls.parse_list(os.getenv('YT_COMPARISON_HORIZONS'))
+                or cls.DEFAULT_CONFIG['comparison_horizons']
+            ],
+            'work_queue': os.getenv('YT_WORK_QUEUE', cls.DEFAULT_CONFIG['work_queue']),
+            'local_workers': int(os.getenv('YT_LOCAL_WORKERS', cls.DEFAULT_CONFIG['local_workers'])),
+            'queue_stall_timeout': float(
+                os.getenv('YT_QUEUE_STALL_TIMEOUT', cls.DEFAULT_CONFIG['queue_stall_timeout'])
+            ),
+            'cohort_days': int(os.getenv('YT_COHORT_DAYS', cls.DEFAULT_CONFIG['cohort_days'])),
+            'output_mode': os.getenv('YT_OUTPUT_MODE', cls.DEFAULT_CONFIG['output_mode']).lower()
+        }
+
+    @staticmethod
+    def parse_list(value: Optional[str]) -> Optional[List[str]]:
+        """Parse a comma separated setting; None keeps the default."""
+        if value is None:
+            return None
+        return [item.strip() for item in value.split(',') if item.strip()]
\ No newline at end of file
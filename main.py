@@ -1,95 +1,765 @@
 import os
+import sys
+import csv
+import json
 import logging
+import argparse
+import subprocess
 from pathlib import Path
-from typing import Dict, Any
-from src.auth import SetAuth
-from dotenv import load_dotenv
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Dict, Any, List, Optional
 from config.settings import Settings
-from googleapiclient.discovery import build
-from src.report import GDocsReporter
-from src.analytics import (
-    ChannelAnalytics, 
-    VideoAnalytics, 
-    analyze_trends,
-    GeographyAnalytics,
-    EngagementAnalytics,
-    ImpressionAnalytics
-)
-
-def initialize_apis(config: Dict[str, Any]):
-    """Initialize YouTube API clients."""
-    auth = SetAuth(config['credentials_path'])
-    credentials = auth.get_credentials()
+
+def initialize_apis(config: Dict[str, Any], profiler=None, meter=None):
+    """
+    Initialize YouTube API clients over a shared TransportPool.
+
+    Returns the Data and Analytics clients and the pool, which builds any
+    other client (Docs) on the same per-thread keep-alive transports. The
+    clients can be shared by worker threads.
+    """
+    from src.api import TransportPool
+    from src.utils import StageProfiler
+
+    profiler = profiler or StageProfiler()
+    with profiler.stage('auth'):
+        credentials = get_credentials(config)
     
     if not credentials:
         logging.error("Failed to obtain credentials")
-        return None, None
-        
-    youtube = build('youtube', 'v3', credentials=credentials)
-    youtube_analytics = build('youtubeAnalytics', 'v2', credentials=credentials)
+        return None, None, None
+
+    with profiler.stage('client_build'):
+        transports = TransportPool(credentials, meter)
+        youtube = transports.client('youtube', 'v3')
+        youtube_analytics = transports.client('youtubeAnalytics', 'v2')
     
-    return youtube, youtube_analytics, credentials
+    return youtube, youtube_analytics, transports
+
+def get_credentials(config: Dict[str, Any]):
+    """Load or create OAuth credentials."""
+    from src.auth import SetAuth
+
+    return SetAuth(config['credentials_path']).get_credentials()
+
+def build_fetch_plan(config: Dict[str, Any], sections: Optional[List[str]] = None,
+                     exports: Optional[List[str]] = None):
+    """Resolve the configured report sections and exports into API calls."""
+    from src.pipeline import FetchPlanner
+
+    return FetchPlanner(sections or config.get('report_sections'), exports).plan()
+
+def make_run_key(config: Dict[str, Any], plan) -> str:
+    """Key of a gather run: the same plan, limits and day resume each other."""
+    from src.pipeline import RunJournal
+
+    return RunJournal.make_key(
+        sections=plan.sections,
+        exports=plan.exports,
+        max_videos=config['max_videos'],
+        days=config['report_period_days'],
+        horizons=config.get('comparison_horizons'),
+        streaming=config.get('streaming', False),
+        day=datetime.now().strftime('%Y-%m-%d')
+    )
+
+def open_journal(config: Dict[str, Any], plan, resume: bool = False):
+    """Checkpoint journal for a gather run; resume picks up an interrupted run of the same plan today."""
+    from src.pipeline import RunJournal
+
+    os.makedirs(config['state_dir'], exist_ok=True)
+    return RunJournal(
+        os.path.join(config['state_dir'], 'journal.sqlite'), make_run_key(config, plan), resume=resume
+    )
+
+def work_queue_url(config: Dict[str, Any]) -> str:
+    """Configured work queue, defaulting to a SQLite queue in the state directory."""
+    if config.get('work_queue'):
+        return config['work_queue']
+    os.makedirs(config['state_dir'], exist_ok=True)
+    return os.path.join(config['state_dir'], 'work_queue.sqlite')
+
+@contextmanager
+def open_coordinator(config: Dict[str, Any], plan, resume: bool = False):
+    """
+    Coordinator handing per-video enrichment to queue workers, or None for
+    an in-process run. Distributed runs need a configured work queue or
+    local workers; local workers are started here and stopped on exit.
+    """
+    from src.pipeline import Coordinator, open_queue
+
+    if not config.get('work_queue') and not config.get('local_workers'):
+        yield None
+        return
+
+    queue_url = work_queue_url(config)
+    coordinator = Coordinator(
+        open_queue(queue_url),
+        make_run_key(config, plan),
+        plan.calls,
+        config.get('comparison_horizons') or (7, 28, 90),
+        resume=resume,
+        stall_timeout=config.get('queue_stall_timeout') or None
+    )
+    workers = start_local_workers(queue_url, config.get('local_workers', 0))
+    try:
+        yield coordinator
+    finally:
+        for process in workers:
+            process.terminate()
+        for process in workers:
+            process.wait()
+        coordinator.close()
+
+def start_local_workers(queue_url: str, count: int) -> List[subprocess.Popen]:
+    """Worker processes on this host; each exits once the queue has been idle for a minute."""
+    return [
+        subprocess.Popen([
+            sys.executable, os.path.abspath(__file__), '--queue', queue_url,
+            'worker', '--idle-exit', '60'
+        ])
+        for _ in range(count)
+    ]
+
+def gather_analytics_data(youtube, youtube_analytics, config: Dict[str, Any], plan=None,
+                          youtube_factory=None, profiler=None, journal=None,
+                          coordinator=None, analytics_factory=None, renderer=None) -> Dict[str, Any]:
+    """
+    Gather the analytics data required by the fetch plan.
+
+    youtube_factory and analytics_factory build extra Data and Analytics API
+    clients for worker threads; without them the given clients are shared,
+    which is safe for clients from a TransportPool. A StageProfiler, when given, is charged
+    with the listing, enrichment and trends stages. A RunJournal, when given,
+    records channel fetches, listing pages and enriched videos as they
+    complete and replays whatever an interrupted run already finished. A
+    Coordinator, when given, has queue workers enrich the listed videos. A
+    StreamRenderer, when given, writes each video as soon as it is enriched
+    and each channel-level section as soon as its data is in.
+    """
+    from src.analytics import (
+        ChannelAnalytics, 
+        VideoAnalytics, 
+        analyze_trends,
+        GeographyAnalytics,
+        EngagementAnalytics,
+        ImpressionAnalytics,
+        AnomalyDetector,
+        RankingIndex,
+        GeographyCube,
+        ContentIndex,
+        DescriptionIndex,
+        ForecastIndex,
+        StreamingAggregator,
+        CommentAnalytics,
+        CommentStore,
+        CohortAnalytics,
+        CohortMatrix
+    )
+    from src.api import QueryMerger, AdaptiveLimiter, ConditionalCache
+    from src.pipeline import VideoEnricher
+    from src.utils import VideoSpool, StageProfiler
+
+    profiler = profiler or StageProfiler()
+    if plan is None:
+        plan = build_fetch_plan(config)
+    days = config['report_period_days']
+    horizons = config.get('comparison_horizons') or (7, 28, 90)
+    streaming = config.get('streaming', False)
+
+    # Every request runs under a per-endpoint adaptive concurrency window with retries
+    limiter = AdaptiveLimiter(
+        initial_limit=config.get('comment_workers', 4),
+        max_limit=config.get('max_concurrency', 16)
+    )
+    client_factory = youtube_factory or (lambda client=youtube: client)
+    youtube_factory = lambda: limiter.wrap(client_factory())
+    youtube = limiter.wrap(youtube)
+    analytics_client_factory = analytics_factory or (lambda client=youtube_analytics: client)
+    analytics_factory = lambda: limiter.wrap(analytics_client_factory())
+
+    # Answer compatible Analytics queries from one merged query
+    youtube_analytics = QueryMerger(limiter.wrap(youtube_analytics))
+
+    # Data API resources are re-fetched with If-None-Match and served from here on a 304
+    os.makedirs(config['state_dir'], exist_ok=True)
+    etag_cache = ConditionalCache(os.path.join(config['state_dir'], 'etags.sqlite'))
 
-def gather_analytics_data(youtube, youtube_analytics, config: Dict[str, Any]) -> Dict[str, Any]:
-    """Gather all analytics data."""
     # Initialize analytics components
-    channel = ChannelAnalytics(youtube, youtube_analytics)
-    video = VideoAnalytics(youtube, youtube_analytics)
+    channel = ChannelAnalytics(youtube, youtube_analytics, cache=etag_cache)
+    video = VideoAnalytics(youtube, youtube_analytics, cache=etag_cache)
     geography = GeographyAnalytics(youtube_analytics)
     engagement = EngagementAnalytics(youtube_analytics)
     impressions = ImpressionAnalytics(youtube_analytics)
     
+    def checkpoint(name, compute):
+        """Channel-level fetch result, journaled when a journal is given."""
+        return journal.step(name, compute) if journal else compute()
+
     # Gather channel data
-    channel_stats = channel.get_basic_stats()
-    period_stats = channel.get_period_analytics(config['report_period_days'])
+    with profiler.stage('enrichment'):
+        channel_stats = (
+            checkpoint('channel_stats', channel.get_basic_stats)
+            if plan.includes('channel.basic_stats') else {}
+        )
+        period_stats = (
+            checkpoint('period_stats', lambda: channel.get_period_analytics(days, horizons))
+            if plan.includes('channel.period_analytics') else {}
+        )
+    if renderer:
+        renderer.update({'sections': plan.sections, 'channel_stats': channel_stats, 'period_stats': period_stats})
+
+    detector, alerts = None, []
+    if plan.has_section('anomalies'):
+        detector = AnomalyDetector.load(os.path.join(config['state_dir'], 'anomaly_state.json'))
+        with profiler.stage('trends'):
+            alerts = detector.analyze_channel(period_stats)
     
-    # Gather video data
-    videos = video.get_recent_videos(config['max_videos'])
+    # Gather video data; listing pages are charged to their own stage
+    resumed = journal.enriched_count() if journal else 0
+    video_items = iter(())
+    if plan.includes('video.details'):
+        if journal:
+            # Listing continues after the videos an interrupted run already enriched
+            listing = journal.iter_listing(
+                lambda remaining, page_token: video.iter_video_pages(
+                    remaining, with_performance=False, with_impressions=False, page_token=page_token
+                ),
+                config['max_videos'],
+                start=resumed
+            )
+        else:
+            listing = video.iter_recent_videos(
+                config['max_videos'], with_performance=False, with_impressions=False
+            )
+        video_items = profiler.iterate('listing', listing)
+
+    comment_store, comment_sync = None, None
+    if plan.includes('video.comments'):
+        comment_store = CommentStore(os.path.join(config['state_dir'], 'comments.sqlite'))
+        comment_sync = CommentAnalytics(
+            youtube_factory,
+            comment_store,
+            # The limiter decides how many of these are actually calling at once
+            workers=config.get('max_concurrency', 16),
+            days=days
+        )
+        # Comment pages are fetched concurrently while videos stream past
+        video_items = comment_sync.iter_sync(video_items)
+
+    cohort_path = os.path.join(config['state_dir'], 'cohorts.npz')
+    cohort_sync = None
+    if plan.includes('video.cohort'):
+        cohort_sync = CohortAnalytics(
+            analytics_factory,
+            CohortMatrix.load(cohort_path, config.get('cohort_days', 90)),
+            workers=config.get('max_concurrency', 16)
+        )
+        # Daily views since publish are fetched (only the unsettled days) while videos stream past
+        video_items = cohort_sync.iter_sync(video_items)
+
+    enricher = VideoEnricher(youtube, youtube_analytics, plan.calls, horizons)
+
+    videos: List[Dict[str, Any]] = []
+    ranking = RankingIndex()
+    geo_cube = GeographyCube()
+    content = ContentIndex()
+    descriptions = DescriptionIndex()
+    forecaster = ForecastIndex() if plan.has_section('forecasts') else None
+    aggregator = StreamingAggregator() if streaming else None
+    spool = VideoSpool(os.path.join(config['state_dir'], 'videos.jsonl')) if streaming else None
+    spool_writer = spool.writer() if streaming else None
     
+    def collect(video_data):
+        """Local processing of an enriched video."""
+        if detector:
+            alerts.extend(detector.analyze_video(video_data))
+        if forecaster is not None:
+            forecaster.add(video_data)
+
+        if streaming:
+            # Fold into the aggregates, spool to disk and let the dict go
+            aggregator.add(video_data)
+            spool_writer.write(video_data)
+        else:
+            videos.append(video_data)
+            ranking.add(video_data)
+            geo_cube.add_rows(video_data.get('geography', []), video_data['id'])
+            content.add(video_data)
+            descriptions.add(video_data)
+        if renderer:
+            renderer.video(video_data)
+
     # For each video, gather additional metrics
-    for video_data in videos:
-        video_id = video_data['id']
-        video_data.update({
-            'geography': geography.get_watch_time_by_country(video_id),
-            'retention': video.get_audience_retention(video_id),
-            'engagement': engagement.get_video_engagement(video_id),
-            'real_time': engagement.get_real_time_metrics(video_id),
-            'impressions': impressions.get_impression_metrics(video_id)
-        })
+    try:
+        with profiler.stage('enrichment'):
+            if journal:
+                # Videos enriched before an interruption are replayed without API calls
+                for video_data in journal.iter_enriched():
+                    collect(video_data)
+
+            listed = enumerate(video_items, start=resumed)
+            if coordinator:
+                # Queue workers enrich the listed videos; they come back in listing order
+                enriched = coordinator.run(listed)
+            else:
+                enriched = ((position, enricher.enrich(video_data)) for position, video_data in listed)
+
+            for position, video_data in enriched:
+                if journal:
+                    journal.record_video(position, video_data)
+                collect(video_data)
+    finally:
+        if spool_writer:
+            spool_writer.close()
+        if cohort_sync:
+            # Whatever was fetched is kept, even when the run fails
+            cohort_sync.matrix.save(cohort_path)
+        etag_cache.close()
+
+    comments = None
+    if comment_sync:
+        comments = comment_sync.summary()
+        comment_store.close()
     
     # Gather channel-wide metrics
-    peak_viewing = engagement.get_peak_viewing_times(config['report_period_days'])
-    geo_distribution = geography.get_watch_time_by_country()
-    trend_data = analyze_trends(videos)
+    with profiler.stage('enrichment'):
+        peak_viewing = {'peak_times': []}
+        if plan.includes('channel.peak_viewing'):
+            peak_viewing = checkpoint('peak_viewing', lambda: engagement.get_peak_viewing_times(days))
+
+        geo_distribution = []
+        add_geography = aggregator.add_channel_geography if streaming else geo_cube.add_rows
+        # Every country of both periods, so growth and new markets compare like with like
+        if plan.includes('channel.geography'):
+            geo_distribution = checkpoint(
+                'geo_distribution', lambda: geography.get_watch_time_by_country(days=days, limit=None)
+            )
+            add_geography(geo_distribution)
+        if plan.includes('channel.geography_previous'):
+            add_geography(
+                checkpoint(
+                    'geo_previous',
+                    lambda: geography.get_watch_time_by_country(days=days, offset_days=days, limit=None)
+                ),
+                period='previous'
+            )
+    if renderer:
+        renderer.update({
+            'sections': plan.sections, 'peak_viewing': peak_viewing,
+            'geo_distribution': geo_distribution, 'comments': comments
+        })
+
+    logging.info(
+        "Analytics queries: %(requested)d requested, %(issued)d issued, %(merged)d merged",
+        youtube_analytics.stats
+    )
+    logging.info(f"Conditional fetches: {etag_cache.describe()}")
+    for line in limiter.describe():
+        logging.info(f"API limits: {line}")
+
+    with profiler.stage('trends'):
+        if streaming:
+            trend_data = aggregator.trend_analysis()
+        else:
+            trend_data = analyze_trends(videos, ranking, geo_cube, content, descriptions)
+
+        anomalies = None
+        if detector:
+            anomalies = detector.summarize(alerts)
+            detector.save(os.path.join(config['state_dir'], 'anomaly_state.json'))
+            detector.write_alerts(anomalies, os.path.join(config['state_dir'], 'alerts.jsonl'))
+
+        forecasts = forecaster.analyze(period_stats.get('history')) if forecaster is not None else None
+        cohorts = cohort_sync.summary() if cohort_sync else None
     
-    return {
+    data = {
+        'sections': plan.sections,
         'channel_stats': channel_stats,
         'period_stats': period_stats,
-        'videos': videos,
+        'videos': spool if streaming else videos,
         'peak_viewing': peak_viewing,
         'geo_distribution': geo_distribution,
-        'trend_analysis': trend_data
+        'trend_analysis': trend_data,
+        'anomalies': anomalies,
+        'comments': comments,
+        'forecasts': forecasts,
+        'cohorts': cohorts
     }
+    if renderer:
+        renderer.update(data)
+    return data
 
-def generate_report(data: Dict[str, Any], credentials) -> None:
+def generate_report(data: Dict[str, Any], transports, profiler=None) -> None:
     """Generate analytics report in Google Docs."""
-    reporter = GDocsReporter(credentials)
+    from dotenv import load_dotenv
+    from src.api import AdaptiveLimiter
+    from src.report import GDocsReporter
+    from src.utils import StageProfiler
+
+    profiler = profiler or StageProfiler()
+    with profiler.stage('client_build'):
+        reporter = GDocsReporter(transports, limiter=AdaptiveLimiter(initial_limit=1, max_limit=1))
 
     env_path = Path(__file__).parent / '.env'
     load_dotenv(dotenv_path=env_path)
     
     doc_id = os.getenv('YOUTUBE_ANALYSIS_DOCS_ID')
-    reporter.create_report(
-        data['channel_stats'],
-        data['period_stats'],
-        data['videos'],
-        data['peak_viewing'],
-        data['geo_distribution'],
-        data.get('trend_analysis')
-    )
+    if not doc_id:
+        raise ValueError("YOUTUBE_ANALYSIS_DOCS_ID not found in environment variables")
+
+    with profiler.stage('rendering'):
+        requests = reporter.build_requests(
+            data['channel_stats'],
+            data['period_stats'],
+            data['videos'],
+            data['peak_viewing'],
+            data['geo_distribution'],
+            data.get('trend_analysis'),
+            data.get('anomalies'),
+            document_id=doc_id,
+            sections=data.get('sections'),
+            comments=data.get('comments'),
+            forecasts=data.get('forecasts'),
+            cohorts=data.get('cohorts')
+        )
+    with profiler.stage('docs_publish'):
+        reporter.publish(doc_id, requests)
     print(f"Report updated: https://docs.google.com/document/d/{doc_id}")
 
-def main():
+def render_dry_run(data: Dict[str, Any], profiler=None) -> List[Dict]:
+    """Build the Docs requests for gathered data without touching the network."""
+    from src.report import GDocsReporter
+    from src.utils import StageProfiler
+
+    with (profiler or StageProfiler()).stage('rendering'):
+        return GDocsReporter().build_requests(
+            data['channel_stats'],
+            data['period_stats'],
+            data['videos'],
+            data['peak_viewing'],
+            data['geo_distribution'],
+            data.get('trend_analysis'),
+            data.get('anomalies'),
+            sections=data.get('sections'),
+            comments=data.get('comments'),
+            forecasts=data.get('forecasts'),
+            cohorts=data.get('cohorts')
+        )
+
+def export_videos(data: Dict[str, Any], output: str, fmt: str = 'csv') -> None:
+    """Export per-video metrics from gathered data to CSV or JSON."""
+    rows = [
+        {
+            'id': video.get('id'),
+            'title': video.get('title'),
+            'published_at': video.get('published_at'),
+            'duration': video.get('duration'),
+            'views': video.get('stats', {}).get('views', 0),
+            'likes': video.get('stats', {}).get('likes', 0),
+            'comments': video.get('stats', {}).get('comments', 0),
+            'watch_time': video.get('performance', {}).get('watch_time', 0),
+            'avg_percentage_watched': video.get('performance', {}).get('avg_percentage_watched', 0)
+        }
+        for video in data.get('videos', [])
+    ]
+
+    stream = open(output, 'w', newline='') if output != '-' else sys.stdout
+    try:
+        if fmt == 'json':
+            json.dump(rows, stream, indent=2)
+            stream.write('\n')
+        else:
+            fieldnames = list(rows[0]) if rows else ['id']
+            writer = csv.DictWriter(stream, fieldnames=fieldnames)
+            writer.writeheader()
+            writer.writerows(rows)
+    finally:
+        if stream is not sys.stdout:
+            stream.close()
+
+def run_backfill(config: Dict[str, Any], args: argparse.Namespace, meter=None) -> None:
+    """Backfill report history into the local store and optionally export it."""
+    from src.api import AdaptiveLimiter, TransportPool
+    from src.pipeline import BackfillEngine, BackfillStore
+
+    credentials = get_credentials(config)
+    if not credentials:
+        logging.error("Failed to obtain credentials")
+        return
+
+    os.makedirs(os.path.dirname(args.store) or '.', exist_ok=True)
+    transports = TransportPool(credentials, meter)
+    store = BackfillStore(args.store)
+    try:
+        limiter = AdaptiveLimiter(initial_limit=min(4, args.workers), max_limit=args.workers)
+        engine = BackfillEngine(
+            lambda: limiter.wrap(transports.client('youtubeAnalytics', 'v2')),
+            store,
+            chunk_days=args.chunk_days,
+            workers=args.workers
+        )
+        try:
+            query_key = engine.run(args.start, args.end, args.metrics, args.dimensions, args.filters)
+        finally:
+            for line in limiter.describe():
+                logging.info(f"API limits: {line}")
+
+        if args.output:
+            with open(args.output, 'w', newline='') as f:
+                writer = csv.writer(f)
+                writer.writerow([header['name'] for header in store.headers(query_key)])
+                writer.writerows(store.iter_rows(query_key))
+            print(f"Backfill exported: {args.output}")
+    finally:
+        store.close()
+
+def run_worker(config: Dict[str, Any], args: argparse.Namespace, meter=None) -> None:
+    """Enrich videos leased from the work queue until it stays idle (or forever)."""
+    from src.api import AdaptiveLimiter, QueryMerger
+    from src.pipeline import Worker, VideoEnricher, open_queue
+
+    youtube, youtube_analytics, transports = initialize_apis(config, meter=meter)
+    if not youtube or not youtube_analytics:
+        return
+
+    # Each worker process retries and backs off on its own; quota is shared by all of them
+    limiter = AdaptiveLimiter(max_limit=config.get('max_concurrency', 16))
+    youtube_analytics = QueryMerger(limiter.wrap(youtube_analytics))
+    queue = open_queue(work_queue_url(config))
+    try:
+        worker = Worker(
+            queue,
+            lambda calls, horizons: VideoEnricher(youtube, youtube_analytics, calls, horizons),
+            worker_id=args.worker_id,
+            lease_seconds=args.lease,
+            idle_exit=args.idle_exit
+        )
+        worker.run()
+    finally:
+        for line in limiter.describe():
+            logging.info(f"API limits: {line}")
+        queue.close()
+
+def build_parser(config: Dict[str, Any]) -> argparse.ArgumentParser:
+    """Build the command line interface."""
+    default_snapshot = os.path.join(config['state_dir'], 'snapshot.json')
+
+    parser = argparse.ArgumentParser(description="YouTube channel analytics reports.")
+    parser.add_argument('--resume', action='store_true',
+                        help="continue an interrupted run from its checkpoint journal")
+    parser.add_argument('--profile', action='store_true',
+                        help="profile each pipeline stage (wall vs CPU time, sampled stacks); cheap "
+                             "enough for production runs")
+    parser.add_argument('--profile-full', action='store_true',
+                        help="profile with cProfile as well (exact per-function times and .pstats "
+                             "files); roughly doubles CPU time")
+    parser.add_argument('--profile-memory', action='store_true',
+                        help="with --profile, also trace allocations per stage (peak memory, top "
+                             "allocators); makes allocation-heavy stages several times slower")
+    parser.add_argument('--profile-interval', type=float, default=0.05,
+                        help="seconds between --profile stack samples (default 0.05)")
+    parser.add_argument('--profile-dir', default=os.path.join(config['state_dir'], 'profile'),
+                        help="where --profile writes collapsed stacks, pstats and the summary")
+    parser.add_argument('--queue', default=config.get('work_queue'),
+                        help="work queue URL (sqlite:///path or a path); gather and report hand "
+                             "per-video enrichment to its workers")
+    parser.add_argument('--local-workers', type=int, default=config.get('local_workers', 0),
+                        help="worker processes to start on this host for a distributed run")
+    parser.add_argument('--output-mode', choices=['docs', 'console', 'jsonl'],
+                        default=config.get('output_mode', 'docs'),
+                        help="where the report goes: Google Docs, or streamed to stdout as a terminal "
+                             "table or JSON Lines while the run is going")
+    commands = parser.add_subparsers(dest='command')
+
+    gather = commands.add_parser('gather', help="fetch analytics data and save a snapshot")
+    gather.add_argument('--output', default=default_snapshot, help="snapshot path")
+    gather.add_argument('--sections', help="comma separated report sections to fetch for")
+    gather.add_argument('--export', action='append', default=[], help="export to fetch data for")
+    gather.add_argument('--dry-run', action='store_true',
+                        help="print the API call plan and estimated quota cost")
+
+    render = commands.add_parser('render', help="publish a saved snapshot (to Google Docs or --output-mode)")
+    render.add_argument('--input', default=default_snapshot, help="snapshot path")
+    render.add_argument('--dry-run', action='store_true',
+                        help="print the Docs requests instead of publishing")
+
+    export = commands.add_parser('export', help="export per-video metrics from a snapshot")
+    export.add_argument('--input', default=default_snapshot, help="snapshot path")
+    export.add_argument('--format', choices=['csv', 'json'], default='csv')
+    export.add_argument('--output', default='-', help="output path ('-' for stdout)")
+
+    backfill = commands.add_parser('backfill', help="fetch full report history in date chunks")
+    backfill.add_argument('--start', required=True, help="first day (YYYY-MM-DD)")
+    backfill.add_argument('--end', default=datetime.now().strftime('%Y-%m-%d'), help="last day (YYYY-MM-DD)")
+    backfill.add_argument('--metrics', default='views,estimatedMinutesWatched,averageViewDuration')
+    backfill.add_argument('--dimensions', default='day')
+    backfill.add_argument('--filters', default='')
+    backfill.add_argument('--chunk-days', type=int, default=90)
+    backfill.add_argument('--workers', type=int, default=16,
+                          help="maximum parallel chunk fetches; the limiter adapts below it")
+    backfill.add_argument('--store', default=os.path.join(config['state_dir'], 'backfill.sqlite'))
+    backfill.add_argument('--output', help="write stitched rows to this CSV file")
+
+    worker = commands.add_parser('worker', help="enrich videos leased from the work queue")
+    worker.add_argument('--worker-id', help="name in leases and logs (default: host:pid)")
+    worker.add_argument('--lease', type=float, default=300,
+                        help="seconds before an unfinished task is handed to another worker")
+    worker.add_argument('--idle-exit', type=float,
+                        help="exit after this many seconds without tasks (default: run until stopped)")
+
+    bench = commands.add_parser('bench', help="run the benchmark suite")
+    bench.add_argument('--suite', action='append', help="suite to run (default: all)")
+    bench.add_argument('--repeat', type=int, default=3)
+    bench.add_argument('--sizes', help="comma separated channel sizes for the hot path suite (default: 100,1000,10000)")
+    bench.add_argument('--baseline', default=str(Path(__file__).parent / 'benchmarks' / 'baseline.json'),
+                       help="stored results to compare against; regressions exit with status 1")
+    bench.add_argument('--threshold', type=float, default=0.25,
+                       help="allowed slowdown or allocation growth over the baseline (0.25 = 25%%)")
+    bench.add_argument('--save-baseline', action='store_true', help="store these results as the new baseline")
+    bench.add_argument('--require-baseline', action='store_true',
+                       help="exit with status 1 when the baseline is missing or lacks a suite or case that was run")
+
+    return parser
+
+def run_report(config: Dict[str, Any], profiler=None, resume: bool = False,
+               meter=None) -> Optional[Dict[str, Any]]:
+    """Gather analytics data and publish the Docs report, or stream it in console/jsonl mode."""
+    from src.report import open_renderer
+
+    youtube, youtube_analytics, transports = initialize_apis(config, profiler, meter)
+    if not youtube or not youtube_analytics:
+        return None
+
+    plan = build_fetch_plan(config)
+    renderer = open_renderer(config.get('output_mode', 'docs'))
+    journal = open_journal(config, plan, resume)
+    try:
+        with open_coordinator(config, plan, resume) as coordinator:
+            analytics_data = gather_analytics_data(
+                youtube, youtube_analytics, config, plan,
+                profiler=profiler, journal=journal, coordinator=coordinator, renderer=renderer
+            )
+        if not renderer:
+            generate_report(analytics_data, transports, profiler)
+    except BaseException:
+        # Keep the journal so --resume skips the work done so far
+        journal.close()
+        raise
+    finally:
+        # A stream always ends, so a consumer can tell a failed run from a cut-off pipe
+        if renderer:
+            renderer.close()
+    journal.finish()
+    return analytics_data
+
+def run_command(config: Dict[str, Any], args: argparse.Namespace, profiler, meter=None) -> None:
+    """Dispatch a parsed command line."""
+    if args.command == 'gather':
+        from src.report import open_renderer
+        from src.utils import Snapshot
+
+        sections = Settings.parse_list(args.sections) if args.sections else None
+        plan = build_fetch_plan(config, sections, args.export)
+        if args.dry_run:
+            print(plan.describe(config['max_videos']))
+            return
+
+        youtube, youtube_analytics, transports = initialize_apis(config, profiler, meter)
+        if not youtube or not youtube_analytics:
+            return
+        renderer = open_renderer(config.get('output_mode', 'docs'))
+        journal = open_journal(config, plan, args.resume)
+        try:
+            with open_coordinator(config, plan, args.resume) as coordinator:
+                data = gather_analytics_data(
+                    youtube, youtube_analytics, config, plan,
+                    profiler=profiler, journal=journal, coordinator=coordinator, renderer=renderer
+                )
+            Snapshot.save(data, args.output)
+        except BaseException:
+            # Keep the journal so --resume skips the work done so far
+            journal.close()
+            raise
+        finally:
+            # The end record is written even when gathering or saving the snapshot fails
+            if renderer:
+                renderer.close()
+        journal.finish()
+        # A streamed report owns stdout
+        print(f"Snapshot saved: {args.output}", file=sys.stderr if renderer else sys.stdout)
+
+    elif args.command == 'render':
+        from src.api import TransportPool
+        from src.report import open_renderer
+        from src.utils import Snapshot
+
+        data = Snapshot.load(args.input)
+        if args.dry_run:
+            print(json.dumps(render_dry_run(data, profiler), indent=2))
+            return
+        renderer = open_renderer(config.get('output_mode', 'docs'))
+        if renderer:
+            with profiler.stage('rendering'):
+                renderer.replay(data)
+            return
+        with profiler.stage('auth'):
+            credentials = get_credentials(config)
+        if not credentials:
+            logging.error("Failed to obtain credentials")
+            return
+        generate_report(data, TransportPool(credentials, meter), profiler)
+
+    elif args.command == 'export':
+        from src.utils import Snapshot
+
+        export_videos(Snapshot.load(args.input), args.output, args.format)
+
+    elif args.command == 'backfill':
+        run_backfill(config, args, meter)
+
+    elif args.command == 'worker':
+        run_worker(config, args, meter)
+
+    elif args.command == 'bench':
+        from benchmarks import SUITES, SIZED_SUITES, load_baseline, save_baseline, missing, compare
+
+        options = {'sizes': [int(size) for size in Settings.parse_list(args.sizes)]} if args.sizes else {}
+        results = {
+            name: SUITES[name](repeat=args.repeat, **(options if name in SIZED_SUITES else {}))
+            for name in (args.suite or SUITES)
+        }
+        print(json.dumps(results, indent=2))
+
+        if args.save_baseline:
+            save_baseline(args.baseline, results)
+            print(f"Baseline saved: {args.baseline}", file=sys.stderr)
+            return
+        baseline = load_baseline(args.baseline)
+        unmatched = missing(results, baseline)
+        if not baseline:
+            print(f"WARNING no baseline at {args.baseline}; nothing was compared", file=sys.stderr)
+        else:
+            for name in unmatched:
+                print(f"WARNING {name} is not in the baseline and was not compared", file=sys.stderr)
+        regressions = compare(results, baseline, args.threshold)
+        for regression in regressions:
+            # A zero baseline has no relative change
+            change = regression['change_pct']
+            change = f"{change:+}%" if change is not None else "new"
+            print(
+                f"REGRESSION {regression['suite']} {regression['case']} {regression['metric']}: "
+                f"{regression['baseline']} -> {regression['measured']} ({change})",
+                file=sys.stderr
+            )
+        if regressions or (args.require_baseline and unmatched):
+            sys.exit(1)
+
+    else:
+        run_report(config, profiler, args.resume, meter)
+
+def main(argv: Optional[List[str]] = None):
     """Run YouTube Analytics report generation."""
     try:
         # Load settings
@@ -97,21 +767,36 @@ def main():
         
         # Setup logging
         logging.basicConfig(level=config['log_level'])
-        
-        # Initialize APIs
-        youtube, youtube_analytics, credentials = initialize_apis(config)
-        if not youtube or not youtube_analytics:
-            return
-            
-        # Gather all analytics data
-        analytics_data = gather_analytics_data(youtube, youtube_analytics, config)
-        
-        # Generate report
-        generate_report(analytics_data, credentials)
+
+        args = build_parser(config).parse_args(argv)
+        config.update(work_queue=args.queue, local_workers=args.local_workers, output_mode=args.output_mode)
+
+        from src.api import TransportMeter
+        from src.utils import StageProfiler
+
+        meter = TransportMeter()
+        profiling = args.profile or args.profile_full
+        profiler = StageProfiler(
+            enabled=profiling, output_dir=args.profile_dir,
+            sample_interval=args.profile_interval, memory=args.profile_memory,
+            deterministic=args.profile_full
+        )
+        profiler.start()
+        try:
+            run_command(config, args, profiler, meter)
+        finally:
+            for line in meter.describe():
+                logging.info(f"Transfer: {line}")
+            profiler.stop()
+            if profiling:
+                profiler.write()
+                # stderr keeps JSON printed on stdout (e.g. render --dry-run) clean
+                print(profiler.summary(), file=sys.stderr)
+                print(f"Profile written: {args.profile_dir}", file=sys.stderr)
             
     except Exception as e:
         logging.error(f"Error running analytics: {e}")
         raise
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
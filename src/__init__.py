@@ -1,4 +1,11 @@
-from .auth import SetAuth
-from .report import GDocsReporter
-from .utils import DataFormatter, DateHelper
-from .analytics import ChannelAnalytics, DemographicsAnalytics, VideoAnalytics
\ No newline at end of file
+from ._lazy import lazy_exports
+
+__all__, __getattr__, __dir__ = lazy_exports(__name__, {
+    'SetAuth': '.auth',
+    'GDocsReporter': '.report',
+    'DataFormatter': '.utils',
+    'DateHelper': '.utils',
+    'ChannelAnalytics': '.analytics',
+    'DemographicsAnalytics': '.analytics',
+    'VideoAnalytics': '.analytics'
+})
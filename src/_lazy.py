@@ -0,0 +1,27 @@
+import sys
+from importlib import import_module
+from typing import Any, Callable, Dict, List, Tuple
+
+
+def lazy_exports(package: str, exports: Dict[str, str]) -> Tuple[List[str], Callable[[str], Any], Callable[[], List[str]]]:
+    """
+    __all__, __getattr__ and __dir__ for a package whose exports load on first access.
+
+    exports maps each exported name to the (relative) module defining it;
+    an imported name is cached in the package namespace, so later lookups
+    skip __getattr__.
+    """
+    names = list(exports)
+
+    def __getattr__(name: str) -> Any:
+        """Import exported names on first access so heavy modules load lazily."""
+        if name not in exports:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(import_module(exports[name], package), name)
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(vars(sys.modules[package])) | set(names))
+
+    return names, __getattr__, __dir__
@@ -1,17 +1,22 @@
-from .video import VideoAnalytics
-from .channel import ChannelAnalytics
-from .geography import GeographyAnalytics
-from .trend_analysis import analyze_trends
-from .engagement import EngagementAnalytics
-from .impressions import ImpressionAnalytics
-from .demographics import DemographicsAnalytics
+from src._lazy import lazy_exports
 
-__all__ = [
-    'analyze_trends', 
-    'VideoAnalytics', 
-    'ChannelAnalytics', 
-    'GeographyAnalytics', 
-    'ImpressionAnalytics', 
-    'EngagementAnalytics', 
-    'DemographicsAnalytics'
-]
\ No newline at end of file
+__all__, __getattr__, __dir__ = lazy_exports(__name__, {
+    'analyze_trends': '.trend_analysis',
+    'VideoAnalytics': '.video',
+    'ChannelAnalytics': '.channel',
+    'GeographyAnalytics': '.geography',
+    'ImpressionAnalytics': '.impressions',
+    'EngagementAnalytics': '.engagement',
+    'DemographicsAnalytics': '.demographics',
+    'AnomalyDetector': '.anomaly',
+    'RankingIndex': '.ranking',
+    'GeographyCube': '.geo_cube',
+    'ContentIndex': '.content_index',
+    'DescriptionIndex': '.similarity',
+    'ForecastIndex': '.forecast',
+    'CohortMatrix': '.cohorts',
+    'CohortAnalytics': '.cohorts',
+    'StreamingAggregator': '.aggregation',
+    'CommentAnalytics': '.comments',
+    'CommentStore': '.comments'
+})
@@ -0,0 +1,646 @@
+import heapq
+import numpy as np
+from array import array
+from collections import deque, OrderedDict
+from typing import Dict, List, Any, Optional, Tuple
+from src.api.rows import ReportTable
+from src.utils.formatters import DataFormatter
+from .ranking import RankingIndex
+from .geo_cube import GeographyCube
+from .content_index import ContentIndex, PLACEHOLDER_DESCRIPTIONS, content_keys
+from .similarity import LSHIndex, MinHasher, shingle_hashes
+
+class QuantileSketch:
+    """Fixed-bin histogram sketch giving approximate quantiles in O(bins) memory."""
+
+    def __init__(self, low: float = 0.0, high: float = 1.0, bins: int = 100):
+        self.low = low
+        self.high = high
+        self.bins = bins
+        self.counts = array('l', [0] * bins)
+        self.total = 0
+
+    def add(self, value: float) -> None:
+        position = int((value - self.low) / (self.high - self.low) * self.bins)
+        self.counts[min(max(position, 0), self.bins - 1)] += 1
+        self.total += 1
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Approximate value at quantile q (bin midpoint)."""
+        if not self.total:
+            return None
+        target = q * self.total
+        seen = 0
+        width = (self.high - self.low) / self.bins
+        for position, count in enumerate(self.counts):
+            seen += count
+            if seen >= target and count:
+                return self.low + (position + 0.5) * width
+        return self.high
+
+
+class TopK:
+    """Bounded heaps keeping the k highest and k lowest entries seen."""
+
+    def __init__(self, k: int = 5):
+        self.k = k
+        self._top: List = []
+        self._bottom: List = []
+        self._seq = 0
+
+    def add(self, value: float, item: Any) -> None:
+        # Ties resolve to the earlier item, matching a stable sort
+        self._seq += 1
+        self._push(self._top, (value, -self._seq), item)
+        self._push(self._bottom, (-value, -self._seq), item)
+
+    def top(self) -> List[Any]:
+        return [item for _, item in sorted(self._top, key=lambda e: e[0], reverse=True)]
+
+    def bottom(self) -> List[Any]:
+        return [item for _, item in sorted(self._bottom, key=lambda e: e[0], reverse=True)]
+
+    def top_with_values(self) -> List[tuple]:
+        return [(key[0], item) for key, item in sorted(self._top, key=lambda e: e[0], reverse=True)]
+
+    def _push(self, heap: List, key: tuple, item: Any) -> None:
+        if len(heap) < self.k:
+            heapq.heappush(heap, (key, item))
+        elif key > heap[0][0]:
+            heapq.heapreplace(heap, (key, item))
+
+
+class RollingTrend:
+    """First/last values and rolling average of a series, fed one value at a time; keeps the last `history` averages."""
+
+    def __init__(self, window: int = 3, history: int = 100):
+        self.window = window
+        self.first: Optional[float] = None
+        self.last: Optional[float] = None
+        self.count = 0
+        self._recent: deque = deque(maxlen=window + 1)
+        self.rolling: deque = deque(maxlen=history)
+
+    def add(self, value: float) -> None:
+        if self.first is None:
+            self.first = value
+        self.last = value
+        self.count += 1
+        self._recent.append(value)
+        self.rolling.append(sum(self._recent) / min(self.window, self.count))
+
+    def percentage_change(self) -> float:
+        if self.count < 2 or not self.first:
+            return 0
+        return ((self.last - self.first) / self.first) * 100
+
+    def summary(self) -> Dict[str, Any]:
+        if self.count < 2 or not self.first:
+            return {'total_trend': 0, 'rolling_average': []}
+        return {
+            'total_trend': self.percentage_change(),
+            'rolling_average': list(self.rolling)
+        }
+
+
+class ViewsDistribution:
+    """
+    Values kept exactly up to `exact` of them, then as a log-spaced histogram.
+
+    Medians are exact for small groups and within half a bin (about 5%)
+    above, in at most BINS counters whatever the number of values.
+    """
+
+    BINS = 256
+    # Histogram range in log10(1 + value): 0 to 10 billion
+    DECADES = 10.0
+
+    def __init__(self, exact: int = 32):
+        self.exact = exact
+        self.count = 0
+        self.values = array('d')
+        self.histogram: Optional[array] = None
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        if self.histogram is None:
+            self.values.append(value)
+            if len(self.values) > self.exact:
+                self._to_histogram()
+        else:
+            self.histogram[self._bin(value)] += 1
+
+    def merge(self, other: 'ViewsDistribution') -> None:
+        if other.histogram is None:
+            for value in other.values:
+                self.add(value)
+            return
+        if self.histogram is None:
+            self._to_histogram()
+        for position, count in enumerate(other.histogram):
+            self.histogram[position] += count
+        self.count += other.count
+
+    def median(self) -> float:
+        if self.histogram is None:
+            return float(np.median(self.values)) if self.values else 0.0
+        target, seen = self.count / 2, 0
+        for position, count in enumerate(self.histogram):
+            seen += count
+            if count and seen >= target:
+                return 10 ** ((position + 0.5) * self.DECADES / self.BINS) - 1
+        return 10 ** self.DECADES - 1
+
+    def _bin(self, value: float) -> int:
+        return min(int(np.log10(1 + max(value, 0)) / self.DECADES * self.BINS), self.BINS - 1)
+
+    def _to_histogram(self) -> None:
+        self.histogram = array('l', [0] * self.BINS)
+        for value in self.values:
+            self.histogram[self._bin(value)] += 1
+        self.values = array('d')
+
+
+class GroupStats:
+    """Count, metric sums and the views distribution of a group of videos: group_stats in bounded memory."""
+
+    __slots__ = ('count', 'views', 'likes', 'watch_time', 'distribution')
+
+    def __init__(self, exact: int = 32):
+        self.count = 0
+        self.views = 0.0
+        self.likes = 0.0
+        self.watch_time = 0.0
+        self.distribution = ViewsDistribution(exact)
+
+    def add(self, views: float, likes: float, watch_time: float) -> None:
+        self.count += 1
+        self.views += views
+        self.likes += likes
+        self.watch_time += watch_time
+        self.distribution.add(views)
+
+    def merge(self, other: 'GroupStats') -> None:
+        self.count += other.count
+        self.views += other.views
+        self.likes += other.likes
+        self.watch_time += other.watch_time
+        self.distribution.merge(other.distribution)
+
+    def median_views(self) -> float:
+        return self.distribution.median()
+
+    def summary(self) -> Dict[str, Any]:
+        if not self.count:
+            return {'videos': 0, 'median_views': 0.0, 'engagement_rate': 0.0, 'avg_watch_time': 0.0}
+        return {
+            'videos': self.count,
+            'median_views': self.median_views(),
+            'engagement_rate': self.likes / self.views * 100 if self.views else 0.0,
+            'avg_watch_time': self.watch_time / self.count
+        }
+
+
+def _metrics(video: Dict) -> Tuple[float, float, float]:
+    stats = video.get('stats', {})
+    return stats.get('views', 0), stats.get('likes', 0), video.get('performance', {}).get('watch_time', 0)
+
+
+class ContentSketch:
+    """
+    Bounded stand-in for ContentIndex in streaming runs, with the same analyze() output.
+
+    Each tag and term keeps a GroupStats, so group medians are exact up to
+    32 videos and read from a log histogram above. At most
+    max_groups groups per kind are tracked: when full, the oldest group seen
+    in a single video makes room, and a new group is skipped when every
+    tracked one already has several videos. Memory is O(max_groups) (about
+    2 KB per large group) whatever the number of videos.
+    """
+
+    def __init__(self, max_share: float = 0.5, max_groups: int = 5000):
+        self.max_share = max_share
+        self.max_groups = max_groups
+        self.baseline = GroupStats(exact=1024)
+        self.groups_by_kind: Dict[str, Dict[str, GroupStats]] = {kind: {} for kind in ContentIndex.KINDS}
+        self.singles: Dict[str, OrderedDict] = {kind: OrderedDict() for kind in ContentIndex.KINDS}
+        self.skipped = 0
+
+    def __len__(self) -> int:
+        return self.baseline.count
+
+    def add(self, video: Dict) -> None:
+        metrics = _metrics(video)
+        self.baseline.add(*metrics)
+        for kind, keys in content_keys(video).items():
+            for key in keys:
+                group = self._group(kind, key)
+                if group is not None:
+                    group.add(*metrics)
+
+    def groups(self, kind: str = 'tag', min_videos: int = 3, limit: Optional[int] = 10) -> List[Dict[str, Any]]:
+        baseline_median = self.baseline.median_views()
+        max_videos = max(min_videos, int(len(self) * self.max_share))
+
+        results = []
+        for key, stats in self.groups_by_kind[kind].items():
+            if not min_videos <= stats.count <= max_videos:
+                continue
+            group = stats.summary()
+            group['group'] = key
+            group['lift'] = group['median_views'] / baseline_median if baseline_median else 0.0
+            results.append(group)
+
+        results.sort(key=lambda group: (-group['lift'], -group['videos'], group['group']))
+        return results[:limit] if limit is not None else results
+
+    def analyze(self, min_videos: int = 3, limit: int = 10) -> Dict[str, Any]:
+        """content_type_performance section, as ContentIndex.analyze."""
+        if not len(self):
+            return {}
+        return {
+            'baseline': self.baseline.summary(),
+            'tags': self.groups('tag', min_videos, limit),
+            'terms': self.groups('term', min_videos, limit)
+        }
+
+    def _group(self, kind: str, key: str) -> Optional[GroupStats]:
+        groups, singles = self.groups_by_kind[kind], self.singles[kind]
+        group = groups.get(key)
+        if group is not None:
+            singles.pop(key, None)
+            return group
+        if len(groups) >= self.max_groups:
+            if not singles:
+                self.skipped += 1
+                return None
+            evicted, _ = singles.popitem(last=False)
+            del groups[evicted]
+        group = groups[key] = GroupStats()
+        singles[key] = None
+        return group
+
+
+class _Cluster:
+    __slots__ = ('representatives', 'text', 'videos', 'last', 'stats')
+
+    def __init__(self, text: str):
+        self.representatives: List[int] = []
+        self.text = text
+        self.videos = 0
+        self.last = -1
+        self.stats = GroupStats()
+
+
+class LeaderClusters:
+    """
+    Online clustering of MinHash signatures in bounded memory.
+
+    A cluster is matched through up to `representatives` member signatures
+    (its leader first) bucketed by LSH bands. A signature joins the cluster
+    of a representative it matches at threshold or above, and leads a new
+    cluster when none matches. With link, a signature matching several
+    clusters merges them, approximating the single-link clusters of
+    DescriptionIndex; without it cluster ids stay stable, so they can be
+    stored on videos. At most `capacity` clusters are kept: when full, the
+    oldest cluster with a single video is evicted, and when none is left
+    new clusters are skipped. Cluster ids are never reused.
+    """
+
+    def __init__(self, threshold: float, capacity: int, bands: int, rows: int,
+                 representatives: int = 1, link: bool = False):
+        self.threshold = threshold
+        self.capacity = capacity
+        self.representatives = representatives
+        self.link = link
+        self.lsh = LSHIndex(bands, rows)
+        self.clusters: Dict[int, _Cluster] = {}
+        # Representative id -> (cluster id, signature)
+        self.signatures: Dict[int, Tuple[int, np.ndarray]] = {}
+        self.singles: OrderedDict = OrderedDict()
+        self.next_id = 0
+        self.skipped = 0
+
+    def assign(self, signature: np.ndarray, text: str, position: int,
+               metrics: Tuple[float, float, float]) -> Optional[int]:
+        """Cluster id of a signature seen in the video at position (None when skipped)."""
+        similarities: Dict[int, float] = {}
+        for key in self.lsh.query(signature):
+            owner, stored = self.signatures[key]
+            similarity = MinHasher.similarity(stored, signature)
+            if similarity >= self.threshold and similarity > similarities.get(owner, -1.0):
+                similarities[owner] = similarity
+
+        if not similarities:
+            target = self._create(text)
+            if target is None:
+                return None
+        elif self.link:
+            target = min(similarities)
+            for other in sorted(similarities):
+                if other != target:
+                    self._merge(target, other)
+        else:
+            target = max(similarities, key=lambda owner: (similarities[owner], -owner))
+
+        cluster = self.clusters[target]
+        if len(cluster.representatives) < self.representatives and (not similarities or self.link):
+            self._represent(target, signature)
+        if cluster.last != position:
+            # A paragraph repeated within one description counts its video once
+            if cluster.videos == 1:
+                self.singles.pop(target, None)
+            cluster.videos += 1
+            cluster.last = position
+            cluster.stats.add(*metrics)
+        return target
+
+    def shared(self, min_videos: int) -> List[Tuple[int, _Cluster]]:
+        """Clusters with at least min_videos videos, largest (then oldest) first."""
+        clusters = [(key, cluster) for key, cluster in self.clusters.items() if cluster.videos >= min_videos]
+        clusters.sort(key=lambda entry: (-entry[1].videos, entry[0]))
+        return clusters
+
+    def _create(self, text: str) -> Optional[int]:
+        if len(self.clusters) >= self.capacity:
+            if not self.singles:
+                self.skipped += 1
+                return None
+            evicted, _ = self.singles.popitem(last=False)
+            for key in self.clusters.pop(evicted).representatives:
+                self.lsh.remove(key, self.signatures.pop(key)[1])
+        cluster_id = self.next_id
+        self.next_id += 1
+        self.clusters[cluster_id] = _Cluster(text)
+        self.singles[cluster_id] = None
+        return cluster_id
+
+    def _represent(self, cluster_id: int, signature: np.ndarray) -> None:
+        key = self.next_id
+        self.next_id += 1
+        self.signatures[key] = (cluster_id, signature)
+        self.lsh.add(key, signature)
+        self.clusters[cluster_id].representatives.append(key)
+
+    def _merge(self, target: int, other: int) -> None:
+        cluster, merged = self.clusters[target], self.clusters.pop(other)
+        self.singles.pop(other, None)
+        if cluster.videos + merged.videos > 1:
+            self.singles.pop(target, None)
+        cluster.videos += merged.videos
+        cluster.last = max(cluster.last, merged.last)
+        cluster.stats.merge(merged.stats)
+        for key in merged.representatives:
+            if len(cluster.representatives) < self.representatives:
+                self.signatures[key] = (target, self.signatures[key][1])
+                cluster.representatives.append(key)
+            else:
+                self.lsh.remove(key, self.signatures.pop(key)[1])
+
+
+class DescriptionSketch:
+    """
+    Bounded stand-in for DescriptionIndex in streaming runs.
+
+    Whole descriptions and their paragraphs go through LeaderClusters
+    (max_templates and max_blocks leaders) instead of being kept for batch
+    clustering. Each video's paragraph cluster ids are written into its dict
+    as 'description_blocks' before it is spooled, and analyze() returns
+    the labels of the shared clusters ('block_labels') rather than a
+    per-video map, which the video section resolves video by video. Memory is
+    O(max_templates + max_blocks) (signatures, counters and the leaders'
+    texts), whatever the number of videos.
+    """
+
+    def __init__(self, threshold: float = 0.5, duplicate_threshold: float = 0.8, min_videos: int = 3,
+                 num_perm: int = 64, bands: int = 16, max_templates: int = 2000, max_blocks: int = 5000):
+        self.min_videos = min_videos
+        self.hasher = MinHasher(num_perm)
+        rows = num_perm // bands
+        self.baseline = GroupStats(exact=1024)
+        # Templates merge transitively like DescriptionIndex; block ids are stored on videos, so they stay put
+        self.templates = LeaderClusters(threshold, max_templates, bands, rows, representatives=4, link=True)
+        self.blocks = LeaderClusters(duplicate_threshold, max_blocks, bands, rows)
+
+    def __len__(self) -> int:
+        return self.baseline.count
+
+    def add(self, video: Dict) -> None:
+        """Cluster a video's description and paragraphs; sets video['description_blocks']."""
+        position = len(self)
+        metrics = _metrics(video)
+        self.baseline.add(*metrics)
+
+        description = video.get('description') or ''
+        if description in PLACEHOLDER_DESCRIPTIONS:
+            description = ''
+        paragraphs = DataFormatter.split_paragraphs(description)
+        video['description_blocks'] = [
+            self.blocks.assign(self.hasher.signature(shingle_hashes(paragraph)), paragraph, position, metrics)
+            for paragraph in paragraphs
+        ]
+        if paragraphs:
+            self.templates.assign(
+                self.hasher.signature(shingle_hashes(description)), video.get('title', 'Untitled'),
+                position, metrics
+            )
+
+    def analyze(self, limit: int = 10) -> Dict[str, Any]:
+        """description_similarity section, with block_labels (cluster id -> label) in place of video_blocks."""
+        if not len(self):
+            return {}
+        baseline_median = self.baseline.median_views()
+
+        def group(cluster: _Cluster) -> Dict[str, Any]:
+            stats = cluster.stats.summary()
+            stats['lift'] = stats['median_views'] / baseline_median if baseline_median else 0.0
+            return stats
+
+        templates = []
+        for number, (_, cluster) in enumerate(self.templates.shared(2)[:limit], 1):
+            templates.append(dict(group(cluster), template=f"T{number}", sample_title=cluster.text))
+
+        boilerplate, labels = [], {}
+        for number, (key, cluster) in enumerate(self.blocks.shared(self.min_videos), 1):
+            label = f"B{number}"
+            boilerplate.append(dict(group(cluster), block=label, text=cluster.text))
+            labels[str(key)] = label
+
+        return {
+            'templates': templates,
+            'boilerplate': boilerplate,
+            'video_blocks': {},
+            'block_labels': labels
+        }
+
+
+class StreamingAggregator:
+    """
+    Online aggregation of enriched videos for memory-bounded runs.
+
+    Each video is folded into trend sums, bounded top-k heaps, demographic
+    and country histograms, retention quantile sketches and the bounded
+    content and description sketches, after which the caller can spool it
+    to disk and drop it. The summaries have the same shape as analyze_trends
+    so the existing formatters render them; medians of large groups and the
+    description clusters are approximate.
+
+    Memory does not grow with the number of videos: it is bounded by the
+    top-k heaps, the rolling-average tails, one entry per country and
+    demographic bucket, and the caps of ContentSketch (max_groups per
+    kind) and DescriptionSketch (max_templates and max_blocks clusters).
+    At the default caps that is about 45 MB, reached after a few thousand
+    videos with distinct tags and descriptions and flat from there.
+    """
+
+    RETENTION_POINTS = 20
+
+    def __init__(self, k: int = 5, leaderboard_k: int = 3):
+        self.count = 0
+        self.views = RollingTrend()
+        self.watch_time = RollingTrend()
+        self.engagement = RollingTrend()
+        self.engagement_sum = 0.0
+
+        self.best = TopK(k)
+        self.leaderboard_k = leaderboard_k
+        self.leaderboards = {metric: TopK(leaderboard_k) for metric in RankingIndex.METRICS}
+
+        self.demographics: Dict[tuple, float] = {}
+        self.demographic_videos = 0
+
+        self.geography = GeographyCube()
+        self.countries: Dict[str, Dict[str, float]] = {}
+        self.video_hhi = QuantileSketch(0.0, 1.0, 200)
+
+        self.retention = [QuantileSketch(0.0, 2.0, 200) for _ in range(self.RETENTION_POINTS)]
+        self.content = ContentSketch()
+        self.descriptions = DescriptionSketch()
+
+    def add(self, video: Dict) -> None:
+        """Fold one enriched video into the aggregates."""
+        self.count += 1
+        stats = video.get('stats', {})
+        summary = {
+            'id': video.get('id'),
+            'title': video.get('title', 'Untitled'),
+            'published_at': video.get('published_at'),
+            'published_ts': video.get('published_ts'),
+            'stats': dict(stats),
+            'performance': dict(video.get('performance', {}))
+        }
+
+        self.views.add(stats.get('views', 0))
+        self.watch_time.add(video.get('performance', {}).get('watch_time', 0))
+        if stats.get('views', 0) > 0:
+            rate = stats.get('likes', 0) / stats['views'] * 100
+            self.engagement.add(rate)
+            self.engagement_sum += rate
+
+        self.best.add(stats.get('views', 0), summary)
+        for metric, topk in self.leaderboards.items():
+            topk.add(RankingIndex.METRICS[metric](video), summary)
+
+        self._add_demographics(video.get('demographics', {}).get('audience', []))
+        self._add_geography(video.get('geography', []))
+        self._add_retention(video.get('retention', {}).get('retention_points', []))
+        self.content.add(video)
+        self.descriptions.add(video)
+
+    def add_channel_geography(self, rows: ReportTable, period: str = 'current') -> None:
+        """Channel-wide geography rows used for shares and growth."""
+        self.geography.add_rows(rows, period=period)
+
+    def trend_analysis(self) -> Dict[str, Any]:
+        """Trend summary shaped like analyze_trends output."""
+        engagement_count = self.engagement.count
+        return {
+            'performance_trends': {
+                'views': self.views.summary(),
+                'engagement_rate': {
+                    'average_engagement': self.engagement_sum / engagement_count if engagement_count else 0,
+                    'trend': self.engagement.percentage_change() if engagement_count > 1 else 0
+                },
+                'watch_time': self.watch_time.summary()
+            },
+            'content_insights': {
+                'best_performing_videos': self.best.top(),
+                'worst_performing_videos': self.best.bottom(),
+                'content_type_performance': self.content.analyze(),
+                'description_similarity': self.descriptions.analyze(),
+                'leaderboards': {
+                    metric: [
+                        {'id': item['id'], 'title': item['title'], 'value': value}
+                        for value, item in topk.top_with_values()
+                    ]
+                    for metric, topk in self.leaderboards.items()
+                } if self.count else {}
+            },
+            'audience_trends': {
+                'demographic_shifts': self.demographics_data(),
+                'geographic_expansion': self.geographic_expansion(),
+                'retention_curve': self.retention_curve()
+            }
+        }
+
+    def demographics_data(self) -> List[List[Dict]]:
+        """Average audience breakdown as a single demographics entry."""
+        if not self.demographic_videos:
+            return []
+        return [[
+            {'age_group': age_group, 'gender': gender, 'percentage': total / self.demographic_videos}
+            for (age_group, gender), total in self.demographics.items()
+        ]]
+
+    def geographic_expansion(self) -> Dict[str, Any]:
+        if not self.geography.countries and self.countries:
+            # No channel-wide rows: fall back to the summed per-video histogram
+            self.geography.add_rows(ReportTable({
+                'country': list(self.countries),
+                'views': [totals['views'] for totals in self.countries.values()],
+                'watch_time_minutes': [totals['watch_time_minutes'] for totals in self.countries.values()]
+            }))
+        expansion = self.geography.analyze()
+        if expansion:
+            median = self.video_hhi.quantile(0.5)
+            expansion['median_video_hhi'] = round(median, 4) if median is not None else None
+        return expansion
+
+    def retention_curve(self) -> List[Dict[str, Any]]:
+        """Approximate quartiles of relative retention along the video timeline."""
+        curve = []
+        for position, sketch in enumerate(self.retention):
+            if sketch.total:
+                curve.append({
+                    'position': (position + 0.5) / self.RETENTION_POINTS,
+                    'p25': sketch.quantile(0.25),
+                    'median': sketch.quantile(0.5),
+                    'p75': sketch.quantile(0.75)
+                })
+        return curve
+
+    def _add_demographics(self, audience: ReportTable) -> None:
+        if not audience:
+            return
+        self.demographic_videos += 1
+        for key, percentage in zip(zip(audience['age_group'], audience['gender']), audience['percentage']):
+            self.demographics[key] = self.demographics.get(key, 0.0) + percentage
+
+    def _add_geography(self, rows: ReportTable) -> None:
+        if not rows:
+            return
+        views = rows['views']
+        total_views = sum(views)
+        for country, country_views, minutes in zip(rows['country'], views, rows['watch_time_minutes']):
+            totals = self.countries.setdefault(country, {'views': 0, 'watch_time_minutes': 0.0})
+            totals['views'] += country_views
+            totals['watch_time_minutes'] += minutes
+        if total_views:
+            self.video_hhi.add(sum((value / total_views) ** 2 for value in views))
+
+    def _add_retention(self, points: ReportTable) -> None:
+        if not points:
+            return
+        for ratio, retention in zip(points['position'], points['retention_percentage']):
+            position = min(int(ratio * self.RETENTION_POINTS), self.RETENTION_POINTS - 1)
+            self.retention[position].add(retention)
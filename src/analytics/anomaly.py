@@ -0,0 +1,227 @@
+import os
+import json
+import math
+from collections import deque
+from datetime import datetime, timedelta
+from typing import Dict, List, Any, Optional, Iterable, Tuple
+from src.api.rows import from_epoch_day
+from .comparison import SETTLE_DAYS
+
+class SeriesState:
+    """Online baseline for a single daily series."""
+
+    def __init__(self, window: int = 28):
+        self.window = window
+        self.level: Optional[float] = None
+        self.variance = 0.0
+        self.seasonal = [1.0] * 7
+        self.residuals: deque = deque(maxlen=window)
+        self.count = 0
+        self.last_date: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'level': self.level,
+            'variance': self.variance,
+            'seasonal': self.seasonal,
+            'residuals': list(self.residuals),
+            'count': self.count,
+            'last_date': self.last_date
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], window: int = 28) -> 'SeriesState':
+        state = cls(window)
+        state.level = data.get('level')
+        state.variance = data.get('variance', 0.0)
+        state.seasonal = data.get('seasonal', [1.0] * 7)
+        state.residuals.extend(data.get('residuals', []))
+        state.count = data.get('count', 0)
+        state.last_date = data.get('last_date')
+        return state
+
+
+class AnomalyDetector:
+    """
+    Streaming spike/drop detector for daily view series.
+
+    Each point is deseasonalized by a day-of-week factor, compared against an
+    EWMA baseline and scored with a robust z-score (median/MAD) over a bounded
+    window of recent residuals, so an update costs O(1). State is keyed by
+    series and remembers the last processed date, so history is never replayed.
+    Only days at least settle_days old are fed: a day is never revisited, so
+    one ingested while the API was still reporting it would stay a drop.
+    """
+
+    def __init__(self, alpha: float = 0.3, seasonal_gamma: float = 0.1,
+                 threshold: float = 3.5, window: int = 28, warmup: int = 7,
+                 settle_days: int = SETTLE_DAYS):
+        self.alpha = alpha
+        self.seasonal_gamma = seasonal_gamma
+        self.threshold = threshold
+        self.window = window
+        self.warmup = warmup
+        self.settle_days = settle_days
+        self.series: Dict[str, SeriesState] = {}
+
+    @classmethod
+    def load(cls, path: str, **kwargs) -> 'AnomalyDetector':
+        """Load detector state from a JSON file, starting fresh if missing."""
+        detector = cls(**kwargs)
+        if os.path.exists(path):
+            with open(path, 'r') as f:
+                data = json.load(f)
+            detector.series = {
+                key: SeriesState.from_dict(value, detector.window)
+                for key, value in data.get('series', {}).items()
+            }
+        return detector
+
+    def save(self, path: str) -> None:
+        """Persist detector state as JSON."""
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, 'w') as f:
+            json.dump({
+                'series': {key: state.to_dict() for key, state in self.series.items()}
+            }, f)
+
+    def update(self, series_key: str, date: str, value: float) -> Optional[Dict[str, Any]]:
+        """Feed one daily point; returns an alert dict if it is anomalous."""
+        state = self.series.get(series_key)
+        if state is None:
+            state = self.series[series_key] = SeriesState(self.window)
+
+        if state.last_date is not None and date <= state.last_date:
+            return None
+
+        weekday = datetime.strptime(date, '%Y-%m-%d').weekday()
+        factor = state.seasonal[weekday] or 1.0
+        adjusted = value / factor
+        state.last_date = date
+        state.count += 1
+
+        if state.level is None:
+            state.level = adjusted
+            state.residuals.append(0.0)
+            return None
+
+        residual = adjusted - state.level
+        score = self._robust_score(state, residual)
+        alert = None
+
+        if state.count > self.warmup and abs(score) >= self.threshold:
+            alert = {
+                'series': series_key,
+                'date': date,
+                'value': value,
+                'expected': round(state.level * factor, 2),
+                'score': round(score, 2),
+                'type': 'spike' if score > 0 else 'drop'
+            }
+            # Winsorize so a single outlier does not drag the baseline
+            scale = self._scale(state)
+            residual = math.copysign(self.threshold * scale, residual) if scale else 0.0
+
+        state.residuals.append(residual)
+        state.variance = (1 - self.alpha) * (state.variance + self.alpha * residual ** 2)
+        state.level += self.alpha * residual
+
+        if state.level > 0:
+            observed_factor = value / state.level if alert is None else factor
+            state.seasonal[weekday] = (
+                self.seasonal_gamma * observed_factor + (1 - self.seasonal_gamma) * factor
+            )
+            # Factors average 1, so the level stays in views/day rather than drifting into them
+            total = sum(state.seasonal)
+            if total > 0:
+                state.seasonal = [weight * 7 / total for weight in state.seasonal]
+
+        return alert
+
+    def update_series(self, series_key: str, points: Iterable[Tuple[str, float]]) -> List[Dict[str, Any]]:
+        """Feed settled points of a series in date order, collecting alerts."""
+        cutoff = (datetime.now() - timedelta(days=self.settle_days)).strftime('%Y-%m-%d')
+        alerts = []
+        for date, value in sorted(points):
+            if date > cutoff:
+                continue
+            alert = self.update(series_key, date, value)
+            if alert:
+                alerts.append(alert)
+        return alerts
+
+    def analyze(self, period_stats: Dict, videos: Iterable[Dict]) -> Dict[str, List[Dict]]:
+        """Run the channel and per-video day series through the detector."""
+        alerts = self.analyze_channel(period_stats)
+        for video in videos:
+            alerts.extend(self.analyze_video(video))
+        return self.summarize(alerts)
+
+    def analyze_channel(self, period_stats: Dict) -> List[Dict]:
+        """Feed the channel day series; returns its alerts."""
+        daily = period_stats.get('daily_data')
+        if not daily:
+            return []
+        return self.update_series('channel', [
+            (from_epoch_day(day), float(views)) for day, views in zip(daily['day'], daily['views'])
+        ])
+
+    def analyze_video(self, video: Dict) -> List[Dict]:
+        """Feed one video's day series; returns its alerts."""
+        daily_views = video.get('real_time', {}).get('daily_views')
+        if not daily_views:
+            return []
+        alerts = self.update_series(f"video:{video['id']}", [
+            (from_epoch_day(day), float(views)) for day, views in zip(daily_views['date'], daily_views['views'])
+        ])
+        for alert in alerts:
+            alert['title'] = video.get('title', '')
+        return alerts
+
+    @staticmethod
+    def summarize(alerts: List[Dict]) -> Dict[str, List[Dict]]:
+        """Split alerts into spikes and drops, strongest first."""
+        alerts = sorted(alerts, key=lambda a: abs(a['score']), reverse=True)
+        return {
+            'spikes': [a for a in alerts if a['type'] == 'spike'],
+            'drops': [a for a in alerts if a['type'] == 'drop']
+        }
+
+    @staticmethod
+    def write_alerts(anomalies: Dict[str, List[Dict]], path: str) -> None:
+        """Write alerts as JSON Lines for downstream tooling."""
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, 'w') as f:
+            for alert in anomalies.get('spikes', []) + anomalies.get('drops', []):
+                f.write(json.dumps(alert) + '\n')
+
+    def _robust_score(self, state: SeriesState, residual: float) -> float:
+        """Robust z-score of a residual against the recent residual window."""
+        scale = self._scale(state)
+        if not scale:
+            return 0.0
+        return (residual - _median(state.residuals)) / scale
+
+    @staticmethod
+    def _scale(state: SeriesState) -> float:
+        """MAD-based scale, falling back to the EWMA deviation."""
+        if state.residuals:
+            center = _median(state.residuals)
+            mad = _median([abs(r - center) for r in state.residuals])
+            if mad > 0:
+                return 1.4826 * mad
+        return math.sqrt(state.variance)
+
+
+def _median(values: Iterable[float]) -> float:
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    mid = len(ordered) // 2
+    if len(ordered) % 2:
+        return ordered[mid]
+    return (ordered[mid - 1] + ordered[mid]) / 2
@@ -1,19 +1,24 @@
-from typing import Dict, Any
+from typing import Dict, Any, Sequence
 from datetime import datetime, timedelta
-from googleapiclient.discovery import build
+from src.api.fields import FIELDS
+from src.api.rows import ReportTable, to_epoch_day
+from .comparison import HORIZONS, PeriodComparison, fetch_span, settled_day, through_day
 
 class ChannelAnalytics:
-    def __init__(self, youtube, youtube_analytics):
-        """Initialize with API clients."""
+    def __init__(self, youtube, youtube_analytics, cache=None):
+        """Initialize with API clients and an optional ConditionalCache for Data API resources."""
         self.youtube = youtube
         self.youtube_analytics = youtube_analytics
+        self.cache = cache
 
     def get_basic_stats(self) -> Dict[str, int]:
         """Get channel's basic statistics."""
-        response = self.youtube.channels().list(
+        request = self.youtube.channels().list(
             part="statistics",
-            mine=True
-        ).execute()
+            mine=True,
+            fields=FIELDS['channels.list']
+        )
+        response = self.cache.execute(request) if self.cache else request.execute()
         
         if 'items' not in response:
             return {}
@@ -25,16 +30,21 @@ class ChannelAnalytics:
             'video_count': int(stats['videoCount'])
         }
 
-    def get_period_analytics(self, days: int = 30) -> Dict[str, Any]:
-        """Get analytics for specified time period."""
-        end_date = datetime.now().strftime('%Y-%m-%d')
-        start_date = (datetime.now() - timedelta(days=days)).strftime('%Y-%m-%d')
+    def get_period_analytics(self, days: int = 30, horizons: Sequence[int] = HORIZONS) -> Dict[str, Any]:
+        """
+        Get analytics for specified time period, with period-over-period
+        comparisons for each horizon sliced from the same daily fetch.
+        """
+        now = datetime.now()
+        end_date = now.strftime('%Y-%m-%d')
+        # One contiguous range covers the report period and every current/previous window
+        start_date = (now - timedelta(days=fetch_span(horizons, days))).strftime('%Y-%m-%d')
         
         response = self.youtube_analytics.reports().query(
             ids="channel==MINE",
             startDate=start_date,
             endDate=end_date,
-            metrics="estimatedMinutesWatched,views,averageViewDuration",
+            metrics="estimatedMinutesWatched,views,averageViewDuration,likes,subscribersGained",
             dimensions="day",
             sort="day"
         ).execute()
@@ -42,13 +52,26 @@ class ChannelAnalytics:
         if 'rows' not in response:
             return {}
             
-        rows = response['rows']
-        total_views = sum(int(row[2]) for row in rows)
-        total_watch_minutes = sum(float(row[1]) for row in rows)
+        history = ReportTable.from_response(response, rename={
+            'estimatedMinutesWatched': 'watch_time_minutes',
+            'averageViewDuration': 'avg_view_duration',
+            'subscribersGained': 'subscribers_gained'
+        })
+        # Windows and the history (which feeds the forecasts) end on the last fully reported
+        # day, so recent days missing views do not drag them down
+        end_day = settled_day(to_epoch_day(end_date))
+        history = through_day(history, end_day)
+        comparison = PeriodComparison(history, end_day)
+        # The report period is the `days + 1` days through that same day, inclusive
+        daily = history[comparison.window(days + 1)]
+        total_views = sum(daily['views'])
+        total_watch_minutes = sum(daily['watch_time_minutes'])
         
         return {
             'total_views': total_views,
             'watch_time_hours': round(total_watch_minutes / 60, 2),
-            'avg_daily_views': round(total_views / len(rows), 2),
-            'daily_data': rows
+            'avg_daily_views': round(total_views / len(daily), 2) if daily else 0,
+            'daily_data': daily,
+            'history': history,
+            'comparison': comparison.summary(horizons)
         }
\ No newline at end of file
@@ -0,0 +1,324 @@
+import os
+import logging
+import threading
+import numpy as np
+from collections import deque
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Any, Callable, Iterable, Iterator, Optional, Sequence, Tuple
+from src.api.rows import ReportTable, to_epoch_day, from_epoch_day
+from src.analytics.comparison import SETTLE_DAYS
+
+# Cumulative views are reported at these days since publish (day 1 is the publish day)
+MILESTONES = (1, 7, 30, 90)
+
+# Percentiles of the cohort curves
+PERCENTILES = (25, 50, 75, 90)
+
+
+class CohortMatrix:
+    """
+    Daily views of every video aligned by age: a dense videos x days matrix.
+
+    Column k holds the views on day k + 1 since publish; days a video has
+    not reached yet are NaN. Each row also records how many of its days are
+    settled (older than the Analytics reporting lag), so a daily run only
+    fetches what came after them and a video older than the curve is never
+    fetched again. The matrix is saved as one .npz file and updated in place,
+    row by row, as videos are fetched.
+    """
+
+    def __init__(self, days: int = 90):
+        self.days = days
+        self.video_ids: List[str] = []
+        self.titles: List[str] = []
+        self.rows: Dict[str, int] = {}
+        # Capacity grows by doubling; only the first len(self) rows are in use
+        self.published = np.zeros(0, dtype=np.int64)
+        self.settled = np.zeros(0, dtype=np.int64)
+        self.views = np.full((0, days), np.nan)
+
+    def __len__(self) -> int:
+        return len(self.video_ids)
+
+    @classmethod
+    def load(cls, path: str, days: int = 90) -> 'CohortMatrix':
+        """Matrix saved at path, widened or cut to `days`; empty when there is none."""
+        matrix = cls(days)
+        if not os.path.exists(path):
+            return matrix
+        try:
+            with np.load(path, allow_pickle=False) as saved:
+                video_ids = [str(video_id) for video_id in saved['video_ids']]
+                titles = [str(title) for title in saved['titles']]
+                published = saved['published']
+                settled = saved['settled']
+                views = saved['views']
+        except (OSError, KeyError, ValueError) as e:
+            logging.warning(f"Ignoring unreadable cohort matrix {path}: {e}")
+            return matrix
+
+        width = min(days, views.shape[1])
+        matrix._reserve(len(video_ids))
+        matrix.video_ids = video_ids
+        matrix.titles = titles
+        matrix.rows = {video_id: row for row, video_id in enumerate(video_ids)}
+        matrix.published[:len(video_ids)] = published
+        # A wider curve than before leaves the new days unsettled, so they are fetched next
+        matrix.settled[:len(video_ids)] = np.minimum(settled, width)
+        matrix.views[:len(video_ids), :width] = views[:, :width]
+        return matrix
+
+    def save(self, path: str) -> None:
+        """Write the matrix atomically."""
+        count = len(self)
+        temp_path = f"{path}.tmp"
+        with open(temp_path, 'wb') as f:
+            np.savez(
+                f,
+                video_ids=np.asarray(self.video_ids, dtype=str),
+                titles=np.asarray(self.titles, dtype=str),
+                published=self.published[:count],
+                settled=self.settled[:count],
+                views=self.views[:count]
+            )
+        os.replace(temp_path, path)
+
+    def pending(self, video_id: str, published_day: int, today: int,
+                lag_days: int = SETTLE_DAYS) -> Optional[Tuple[int, int, int]]:
+        """
+        Days still to fetch for a video: (first, last, settled) column indices.
+
+        first is the first unsettled day and last the latest the video has
+        reached; after the fetch, days up to settled are final. None when the
+        whole curve is settled.
+        """
+        reached = min(self.days, today - published_day + 1)
+        if reached <= 0:
+            return None
+        row = self.rows.get(video_id)
+        first = 0
+        if row is not None and self.published[row] == published_day:
+            first = int(self.settled[row])
+        if first >= self.days:
+            return None
+        settled = max(first, min(self.days, today - lag_days - published_day + 1))
+        return first, reached - 1, settled
+
+    def update(self, video_id: str, title: str, published_day: int, first: int, last: int,
+               settled: int, days: Sequence[int], views: Sequence[float]) -> None:
+        """Store a fetched (day, views) series covering columns first..last of a video."""
+        row = self.rows.get(video_id)
+        if row is None:
+            row = len(self)
+            self._reserve(row + 1)
+            self.rows[video_id] = row
+            self.video_ids.append(video_id)
+            self.titles.append(title)
+        elif self.published[row] != published_day:
+            # Publish date moved (a scheduled video went live later); its curve starts over
+            self.views[row] = np.nan
+        self.titles[row] = title
+        self.published[row] = published_day
+
+        # Days without a report row had no views; days past `last` are not reached yet
+        self.views[row, first:last + 1] = 0.0
+        self.views[row, last + 1:] = np.nan
+        columns = np.asarray(days, dtype=np.int64) - published_day
+        inside = (columns >= first) & (columns <= last)
+        self.views[row, columns[inside]] = np.asarray(views, dtype=np.float64)[inside]
+        self.settled[row] = settled
+
+    def analyze(self, video_ids: Optional[Iterable[str]] = None, limit: int = 5,
+                min_peers: int = 5) -> Dict[str, Any]:
+        """
+        cohorts section: cohort percentiles of the cumulative curves at the
+        milestone days, and the videos furthest above and below same-age peers.
+
+        A video's standing is the percentile rank of its cumulative views
+        among every video that reached the same age, at its latest day.
+        Only settled days count: the days after them are zero-filled by
+        update() until the API has reported them, which would pull young
+        videos and the latest columns down. Only video_ids (default: all)
+        are ranked as leaders and laggards.
+        """
+        count = len(self)
+        if not count:
+            return {}
+        views = self.views[:count]
+        settled = np.arange(self.days) < self.settled[:count, None]
+        reached = settled & ~np.isnan(views)
+        cumulative = np.cumsum(np.where(reached, views, 0.0), axis=1)
+        cumulative[~reached] = np.nan
+
+        peers = reached.sum(axis=0)
+        populated = np.flatnonzero(peers)
+        percentiles = np.full((len(PERCENTILES), self.days), np.nan)
+        percentiles[:, populated] = np.nanpercentile(cumulative[:, populated], PERCENTILES, axis=0)
+
+        # Rank of every video within every day column (NaN sorts last) with one argsort
+        order = np.argsort(cumulative, axis=0, kind='stable')
+        ranks = np.empty_like(order)
+        np.put_along_axis(ranks, order, np.broadcast_to(np.arange(count)[:, None], order.shape), axis=0)
+
+        age = reached.sum(axis=1) - 1
+        rows = np.arange(count)
+        known = age >= 0
+        latest = np.where(known, age, 0)
+        peer_count = peers[latest]
+        standing = np.where(
+            known & (peer_count >= min_peers),
+            ranks[rows, latest] / np.maximum(peer_count - 1, 1) * 100,
+            np.nan
+        )
+
+        median = percentiles[PERCENTILES.index(50)]
+        curve = []
+        for day in MILESTONES:
+            if day <= self.days and peers[day - 1]:
+                entry = {'day': day, 'videos': int(peers[day - 1])}
+                entry.update(
+                    (f"p{q}", round(float(percentiles[i, day - 1]))) for i, q in enumerate(PERCENTILES)
+                )
+                curve.append(entry)
+
+        if video_ids is None:
+            candidates = rows
+        else:
+            candidates = np.asarray([self.rows[v] for v in video_ids if v in self.rows], dtype=np.int64)
+        candidates = candidates[~np.isnan(standing[candidates])]
+        ranked = candidates[np.argsort(-standing[candidates], kind='stable')]
+
+        def entry(row: int) -> Dict[str, Any]:
+            return {
+                'id': self.video_ids[row],
+                'title': self.titles[row],
+                'day': int(latest[row]) + 1,
+                'views': round(float(cumulative[row, latest[row]])),
+                'peer_median': round(float(median[latest[row]])),
+                'percentile': round(float(standing[row]))
+            }
+
+        return {
+            'days': self.days,
+            'videos': count,
+            'complete': int((self.settled[:count] >= self.days).sum()),
+            'ranked': len(ranked),
+            'curve': curve,
+            'leaders': [entry(row) for row in ranked[:limit]],
+            'laggards': [entry(row) for row in ranked[max(limit, len(ranked) - limit):][::-1]]
+        }
+
+    def _reserve(self, size: int) -> None:
+        capacity = len(self.published)
+        if size <= capacity:
+            return
+        capacity = max(size, 2 * capacity, 64)
+        grown = len(self)
+        published = np.zeros(capacity, dtype=np.int64)
+        settled = np.zeros(capacity, dtype=np.int64)
+        views = np.full((capacity, self.days), np.nan)
+        published[:grown] = self.published[:grown]
+        settled[:grown] = self.settled[:grown]
+        views[:grown] = self.views[:grown]
+        self.published, self.settled, self.views = published, settled, views
+
+
+class CohortAnalytics:
+    """
+    Keeps the cohort matrix current for the videos streaming past.
+
+    A video seen for the first time is fetched in bulk: one daily query
+    from its publish date to today (or to the end of the curve). Afterwards
+    only the days after its settled ones are fetched, so a daily run costs
+    one short query per video younger than the curve plus the reporting
+    lag, and nothing for older ones. Queries run concurrently on
+    per-thread clients while the listing continues.
+    """
+
+    def __init__(self, client_factory: Callable[[], Any], matrix: CohortMatrix,
+                 workers: int = 4, lag_days: int = SETTLE_DAYS):
+        self.client_factory = client_factory
+        self.matrix = matrix
+        self.workers = workers
+        self.lag_days = lag_days
+        self.seen: List[str] = []
+        self.stats = {'videos_fetched': 0, 'videos_current': 0, 'days_fetched': 0}
+        self._local = threading.local()
+
+    def iter_sync(self, videos: Iterable[Dict]) -> Iterator[Dict]:
+        """Update the matrix for videos as they stream past, yielding them in order."""
+        today = to_epoch_day(datetime.now().strftime('%Y-%m-%d'))
+        in_flight: deque = deque()
+
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            for video in videos:
+                in_flight.append((video, *self._submit(pool, video, today)))
+                if len(in_flight) >= self.workers:
+                    yield self._finish(*in_flight.popleft())
+            while in_flight:
+                yield self._finish(*in_flight.popleft())
+
+    def summary(self, limit: int = 5) -> Dict[str, Any]:
+        """Cohort curves and peer standings of this run's videos, with sync counts."""
+        analysis = self.matrix.analyze(self.seen, limit)
+        return dict(analysis, **self.stats) if analysis else {}
+
+    def _submit(self, pool: ThreadPoolExecutor, video: Dict, today: int):
+        published_at = video.get('published_at')
+        if not published_at:
+            return None, None, None
+        published_day = to_epoch_day(published_at[:10])
+        window = self.matrix.pending(video['id'], published_day, today, self.lag_days)
+        if window is None:
+            return published_day, None, None
+        first, last, _ = window
+        future = pool.submit(
+            self._fetch, video['id'], from_epoch_day(published_day + first), from_epoch_day(published_day + last)
+        )
+        return published_day, window, future
+
+    def _finish(self, video: Dict, published_day: Optional[int], window, future) -> Dict:
+        video_id = video['id']
+        if published_day is None:
+            return video
+        self.seen.append(video_id)
+
+        if future is None:
+            self.stats['videos_current'] += 1
+            return video
+        try:
+            days, views = future.result()
+        except Exception as e:
+            # Private video, quota...; the stored days stay and the rest is retried next run
+            logging.warning(f"Cohort fetch failed for {video_id}: {e}")
+            return video
+
+        first, last, settled = window
+        self.matrix.update(
+            video_id, video.get('title', 'Untitled'), published_day, first, last, settled,
+            days, views
+        )
+        self.stats['videos_fetched'] += 1
+        self.stats['days_fetched'] += last - first + 1
+        return video
+
+    def _client(self):
+        """Per-thread API client; httplib2 transports are not thread-safe."""
+        if not hasattr(self._local, 'client'):
+            self._local.client = self.client_factory()
+        return self._local.client
+
+    def _fetch(self, video_id: str, start_date: str, end_date: str) -> Tuple[Sequence[int], Sequence[float]]:
+        """A video's (day, views) columns over a date range."""
+        response = self._client().reports().query(
+            ids="channel==MINE",
+            startDate=start_date,
+            endDate=end_date,
+            metrics="views",
+            dimensions="day",
+            filters=f"video=={video_id}",
+            sort="day"
+        ).execute()
+        table = ReportTable.from_response(response)
+        return table.columns.get('day', ()), table.columns.get('views', ())
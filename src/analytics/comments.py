@@ -0,0 +1,251 @@
+import logging
+import sqlite3
+import threading
+from collections import deque
+from datetime import datetime, timedelta, timezone
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Any, Callable, Iterable, Iterator, Optional, Tuple
+from src.api.fields import FIELDS
+
+def _timestamp(moment: datetime) -> str:
+    """UTC time in the RFC 3339 form of the API's publishedAt and updatedAt."""
+    return moment.strftime('%Y-%m-%dT%H:%M:%SZ')
+
+
+class CommentStore:
+    """SQLite store of comment threads keyed by thread id."""
+
+    def __init__(self, path: str):
+        self.conn = sqlite3.connect(path)
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS threads (
+                id TEXT PRIMARY KEY,
+                video_id TEXT NOT NULL,
+                author TEXT,
+                text TEXT,
+                like_count INTEGER,
+                reply_count INTEGER,
+                published_at TEXT,
+                updated_at TEXT
+            );
+            CREATE INDEX IF NOT EXISTS threads_video ON threads (video_id, published_at);
+            CREATE TABLE IF NOT EXISTS sync_state (
+                video_id TEXT PRIMARY KEY,
+                watermark TEXT,
+                full_sync_at TEXT
+            );
+        """)
+
+    def known_versions(self, video_id: str) -> Dict[str, str]:
+        """Stored thread id -> updatedAt for a video."""
+        cursor = self.conn.execute(
+            "SELECT id, updated_at FROM threads WHERE video_id = ?", (video_id,)
+        )
+        return dict(cursor.fetchall())
+
+    def sync_state(self, video_id: str) -> Tuple[Optional[str], Optional[str]]:
+        """(watermark, full_sync_at) of a video: its newest synced publish time and last full sync."""
+        row = self.conn.execute(
+            "SELECT watermark, full_sync_at FROM sync_state WHERE video_id = ?", (video_id,)
+        ).fetchone()
+        return row if row else (None, None)
+
+    def save(self, video_id: str, threads: List[Dict], watermark: Optional[str],
+             removed: Iterable[str] = (), full_sync: bool = False) -> None:
+        """Upsert changed threads, delete removed ones and record the video's sync state."""
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO threads VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (t['id'], video_id, t['author'], t['text'], t['like_count'],
+                     t['reply_count'], t['published_at'], t['updated_at'])
+                    for t in threads
+                ]
+            )
+            self.conn.executemany("DELETE FROM threads WHERE id = ?", [(thread_id,) for thread_id in removed])
+            full_sync_at = _timestamp(datetime.now(timezone.utc)) if full_sync else self.sync_state(video_id)[1]
+            self.conn.execute(
+                "INSERT OR REPLACE INTO sync_state VALUES (?, ?, ?)", (video_id, watermark, full_sync_at)
+            )
+
+    def activity(self, video_id: str, since: str) -> Tuple[int, int]:
+        """(total stored threads, threads published since a timestamp) for a video."""
+        return self.conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(published_at >= ?), 0) FROM threads WHERE video_id = ?",
+            (since, video_id)
+        ).fetchone()
+
+    def top_commenters(self, limit: int = 10) -> List[Dict[str, Any]]:
+        cursor = self.conn.execute(
+            "SELECT author, COUNT(*) AS threads, SUM(like_count) FROM threads "
+            "GROUP BY author ORDER BY threads DESC, author LIMIT ?", (limit,)
+        )
+        return [
+            {'author': author, 'threads': threads, 'likes': likes or 0}
+            for author, threads, likes in cursor
+        ]
+
+    def total_threads(self) -> int:
+        return self.conn.execute("SELECT COUNT(*) FROM threads").fetchone()[0]
+
+    def close(self) -> None:
+        self.conn.close()
+
+
+class CommentAnalytics:
+    """
+    Incremental comment thread ingestion across videos.
+
+    Threads are paged newest-first (by publish time) with
+    commentThreads().list on a bounded worker pool (one API client per
+    thread). Each video keeps a watermark, the newest publish time synced:
+    paging stops at the first page reaching threads published before it, so
+    new threads are always picked up, and threads on the fetched pages are
+    stored again when their updatedAt changed. The API cannot list threads
+    by update time, so edits and deletions further down are caught by a
+    full sync every full_sync_days, which pages everything and removes the
+    stored threads no longer listed. Only videos with no comments and none
+    stored are skipped without an API call.
+    """
+
+    def __init__(self, client_factory: Callable[[], Any], store: CommentStore,
+                 workers: int = 4, days: int = 30, full_sync_days: int = 7):
+        self.client_factory = client_factory
+        self.store = store
+        self.workers = workers
+        self.days = days
+        self.full_sync_days = full_sync_days
+        self._local = threading.local()
+        self.stats = {
+            'videos_synced': 0, 'videos_skipped': 0, 'full_syncs': 0,
+            'threads_changed': 0, 'threads_removed': 0, 'pages': 0
+        }
+
+    def iter_sync(self, videos: Iterable[Dict]) -> Iterator[Dict]:
+        """Sync comments for videos as they stream past, yielding them in order with comment activity."""
+        now = datetime.now(timezone.utc)
+        since = _timestamp(now - timedelta(days=self.days))
+        full_sync_before = _timestamp(now - timedelta(days=self.full_sync_days))
+        in_flight: deque = deque()
+
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            for video in videos:
+                in_flight.append((video, self._submit(pool, video, full_sync_before)))
+                if len(in_flight) >= self.workers:
+                    yield self._finish(*in_flight.popleft(), since)
+            while in_flight:
+                yield self._finish(*in_flight.popleft(), since)
+
+    def summary(self, limit: int = 10) -> Dict[str, Any]:
+        """Channel-level comment figures for the report."""
+        return dict(
+            self.stats,
+            total_threads=self.store.total_threads(),
+            top_commenters=self.store.top_commenters(limit)
+        )
+
+    def _submit(self, pool: ThreadPoolExecutor, video: Dict, full_sync_before: str):
+        video_id = video['id']
+        known = self.store.known_versions(video_id)
+        if not video.get('stats', {}).get('comments', 0) and not known:
+            return None
+        watermark, full_sync_at = self.store.sync_state(video_id)
+        if full_sync_at is None or full_sync_at < full_sync_before:
+            watermark = None
+        return pool.submit(self._fetch_changed, video_id, known, watermark)
+
+    def _finish(self, video: Dict, future, since: str) -> Dict:
+        """Store a video's fetched threads and attach its comment activity."""
+        video_id = video['id']
+
+        if future is None:
+            self.stats['videos_skipped'] += 1
+        else:
+            try:
+                threads, removed, newest, pages, full_sync = future.result()
+            except Exception as e:
+                # Comments disabled, private video, quota...; keep what is stored
+                logging.warning(f"Comment sync failed for {video_id}: {e}")
+            else:
+                watermark = self.store.sync_state(video_id)[0]
+                if newest and (full_sync or not watermark or newest > watermark):
+                    watermark = newest
+                self.store.save(video_id, threads, watermark, removed, full_sync)
+                self.stats['videos_synced'] += 1
+                self.stats['full_syncs'] += full_sync
+                self.stats['threads_changed'] += len(threads)
+                self.stats['threads_removed'] += len(removed)
+                self.stats['pages'] += pages
+
+        stored, recent = self.store.activity(video_id, since)
+        video['comments_activity'] = {
+            'stored_threads': stored,
+            'recent_threads': recent,
+            'velocity': round(recent / self.days, 2)
+        }
+        return video
+
+    def _client(self):
+        """Per-thread API client; httplib2 transports are not thread-safe."""
+        if not hasattr(self._local, 'client'):
+            self._local.client = self.client_factory()
+        return self._local.client
+
+    def _fetch_changed(self, video_id: str, known: Dict[str, str],
+                       watermark: Optional[str]) -> Tuple[List[Dict], List[str], Optional[str], int, bool]:
+        """
+        Page newest-first down to the watermark, or through every page for a
+        full sync (no watermark). Returns the new or changed threads, the
+        stored ones no longer listed (full sync only), the newest publish
+        time seen, the page count and whether it was a full sync.
+        """
+        changed = []
+        seen = set()
+        newest = None
+        page_token = None
+        pages = 0
+
+        while True:
+            response = self._client().commentThreads().list(
+                part="snippet",
+                videoId=video_id,
+                maxResults=100,
+                order="time",
+                textFormat="plainText",
+                pageToken=page_token,
+                fields=FIELDS['commentThreads.list']
+            ).execute()
+            pages += 1
+
+            reached_watermark = False
+            for item in response.get('items', []):
+                thread = self._parse_thread(item)
+                seen.add(thread['id'])
+                if known.get(thread['id']) != thread['updated_at']:
+                    changed.append(thread)
+                if newest is None or thread['published_at'] > newest:
+                    newest = thread['published_at']
+                # Threads published at the watermark itself may still be new; older ones were synced
+                if watermark and thread['published_at'] < watermark:
+                    reached_watermark = True
+
+            page_token = response.get('nextPageToken')
+            if not page_token or reached_watermark:
+                break
+
+        if watermark:
+            return changed, [], newest, pages, False
+        return changed, [thread_id for thread_id in known if thread_id not in seen], newest, pages, True
+
+    @staticmethod
+    def _parse_thread(item: Dict) -> Dict[str, Any]:
+        comment = item['snippet']['topLevelComment']['snippet']
+        return {
+            'id': item['id'],
+            'author': comment.get('authorDisplayName', ''),
+            'text': comment.get('textDisplay', ''),
+            'like_count': int(comment.get('likeCount', 0)),
+            'reply_count': int(item['snippet'].get('totalReplyCount', 0)),
+            'published_at': comment.get('publishedAt', ''),
+            'updated_at': comment.get('updatedAt', comment.get('publishedAt', ''))
+        }
@@ -0,0 +1,105 @@
+import numpy as np
+from bisect import bisect_right
+from typing import Dict, Any, Iterable, Optional, Sequence
+from src.api.rows import ReportTable
+
+# Default comparison horizons, in days
+HORIZONS = (7, 28, 90)
+
+# Averages compare as weighted means of the window, not sums
+WEIGHTED = {
+    'avg_view_duration': 'views',
+    'averageViewDuration': 'views',
+    'averageViewPercentage': 'views'
+}
+
+
+# The Analytics API reports a day in full 2-3 days later; windows end this many days before today
+SETTLE_DAYS = 3
+
+
+def fetch_span(horizons: Iterable[int], days: int = 0) -> int:
+    """Days of history one fetch through today needs to cover every current and previous window."""
+    return 2 * max(tuple(horizons) + (days,)) + SETTLE_DAYS
+
+
+def settled_day(today: int) -> int:
+    """Last fully reported day (epoch days): the end_day comparisons are anchored at."""
+    return today - SETTLE_DAYS
+
+
+def through_day(table: ReportTable, last_day: int, date_column: str = 'day') -> ReportTable:
+    """Rows of a day-sorted table up to and including last_day."""
+    return table[:bisect_right(table.column(date_column), last_day)]
+
+
+class PeriodComparison:
+    """
+    Current vs previous window deltas over one day-grained ReportTable.
+
+    The table covers a contiguous range through end_day (epoch days), which
+    should be the last fully reported day (settled_day), so the current
+    window is not missing views the API has yet to report. Windows are
+    located with a binary search over the sorted day column and summed as
+    array slices, so every horizon comes out of the same fetch.
+    """
+
+    def __init__(self, table: ReportTable, end_day: int, date_column: str = 'day'):
+        days = np.asarray(table.column(date_column), dtype=np.int64)
+        order = np.argsort(days, kind='stable')
+        self.end_day = end_day
+        self.days = days[order]
+        self.metrics: Dict[str, np.ndarray] = {}
+        self.integers = set()
+        for name in table.names():
+            values = table[name]
+            if name == date_column or getattr(values, 'typecode', None) not in ('q', 'd'):
+                continue
+            self.metrics[name] = np.asarray(values, dtype=np.float64)[order]
+            if values.typecode == 'q':
+                self.integers.add(name)
+
+    def window(self, days: int, offset: int = 0) -> slice:
+        """Rows of the days-long window ending offset days before end_day."""
+        last = self.end_day - offset
+        first = last - days + 1
+        return slice(
+            int(np.searchsorted(self.days, first, 'left')),
+            int(np.searchsorted(self.days, last, 'right'))
+        )
+
+    def totals(self, window: slice) -> Dict[str, float]:
+        """Sum of each metric over a window (weighted mean for averages)."""
+        totals = {}
+        for name, values in self.metrics.items():
+            part = values[window]
+            weight_name = WEIGHTED.get(name)
+            if weight_name in self.metrics:
+                weights = self.metrics[weight_name][window]
+                total_weight = weights.sum()
+                totals[name] = float((part * weights).sum() / total_weight) if total_weight else 0.0
+            elif name in WEIGHTED:
+                totals[name] = float(part.mean()) if len(part) else 0.0
+            elif name in self.integers:
+                totals[name] = int(part.sum())
+            else:
+                totals[name] = float(part.sum())
+        return totals
+
+    def compare(self, days: int) -> Dict[str, Dict[str, Any]]:
+        """Per-metric current, previous, delta and percentage change for one horizon."""
+        current = self.totals(self.window(days))
+        previous = self.totals(self.window(days, offset=days))
+        return {
+            name: {
+                'current': current[name],
+                'previous': previous[name],
+                'delta': current[name] - previous[name],
+                'change_pct': (current[name] - previous[name]) / previous[name] * 100 if previous[name] else None
+            }
+            for name in self.metrics
+        }
+
+    def summary(self, horizons: Optional[Sequence[int]] = None) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """Comparisons keyed '7d', '28d', ... in horizon order."""
+        return {f"{days}d": self.compare(days) for days in (horizons or HORIZONS)}
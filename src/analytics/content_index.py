@@ -0,0 +1,132 @@
+import re
+import numpy as np
+from array import array
+from typing import Dict, List, Any, Optional
+
+_TOKEN = re.compile(r"[^\W\d_][^\W_]*")
+
+_STOPWORDS = frozenset("""
+    about after all also and any are because been but can could did does doing don down for from
+    get got had has have her here him his how into its just like make more most new not now off
+    one only our out over own she should some than that the their them then there these they
+    this those through too under very was way were what when where which while who why will
+    with would you your
+""".split())
+
+# Placeholders VideoAnalytics/DescriptionAnalytics store in place of a description
+PLACEHOLDER_DESCRIPTIONS = ("No description available.", "Error retrieving description.")
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase word terms of a text, without stopwords, numbers and very short words."""
+    return [term for term in _TOKEN.findall(text.lower()) if len(term) > 2 and term not in _STOPWORDS]
+
+
+def content_keys(video: Dict) -> Dict[str, set]:
+    """A video's content groups by kind: its tags (whole, lowercased) and the terms of its title and description."""
+    tags = {tag.strip().lower() for tag in video.get('tags', []) if tag.strip()}
+    text = video.get('title', '')
+    description = video.get('description', '')
+    if description and description not in PLACEHOLDER_DESCRIPTIONS:
+        text += "\n" + description
+    return {'tag': tags, 'term': set(tokenize(text))}
+
+
+def group_stats(positions: np.ndarray, views: np.ndarray, likes: np.ndarray,
+                watch_time: np.ndarray) -> Dict[str, Any]:
+    """Median views, engagement rate and average watch time of the videos at positions."""
+    if not len(positions):
+        return {'videos': 0, 'median_views': 0.0, 'engagement_rate': 0.0, 'avg_watch_time': 0.0}
+    group_views = views[positions]
+    total_views = group_views.sum()
+    return {
+        'videos': int(len(positions)),
+        'median_views': float(np.median(group_views)),
+        'engagement_rate': float(likes[positions].sum() / total_views * 100) if total_views else 0.0,
+        'avg_watch_time': float(watch_time[positions].mean())
+    }
+
+
+class ContentIndex:
+    """
+    Inverted index from content groups to video positions.
+
+    Each video's tags (whole, lowercased) and the terms of its title and
+    description are posted to compact position arrays, while its metrics go
+    to parallel columns. Group-by aggregates (median views, engagement rate,
+    average watch time and lift over the channel median) are then a gather
+    over the columns per posting list, so thousands of groups over tens of
+    thousands of videos take well under a second.
+    """
+
+    KINDS = ('tag', 'term')
+
+    def __init__(self, max_share: float = 0.5):
+        # Groups present in more than max_share of the videos are boilerplate, not a content type
+        self.max_share = max_share
+        self.postings: Dict[str, Dict[str, array]] = {kind: {} for kind in self.KINDS}
+        self.views = array('d')
+        self.likes = array('d')
+        self.watch_time = array('d')
+
+    def __len__(self) -> int:
+        return len(self.views)
+
+    def add(self, video: Dict) -> None:
+        """Index one video's tags and text and record its metrics."""
+        position = len(self.views)
+        stats = video.get('stats', {})
+        self.views.append(stats.get('views', 0))
+        self.likes.append(stats.get('likes', 0))
+        self.watch_time.append(video.get('performance', {}).get('watch_time', 0))
+
+        for kind, keys in content_keys(video).items():
+            postings = self.postings[kind]
+            for key in keys:
+                posting = postings.get(key)
+                if posting is None:
+                    posting = postings[key] = array('q')
+                posting.append(position)
+
+    def positions(self, key: str, kind: str = 'tag') -> List[int]:
+        """Positions of the videos in a group (terms are matched lowercased)."""
+        return list(self.postings[kind].get(key.lower(), ()))
+
+    def baseline(self) -> Dict[str, Any]:
+        """Channel-wide aggregates the groups are compared against."""
+        return group_stats(np.arange(len(self)), *self._columns())
+
+    def groups(self, kind: str = 'tag', min_videos: int = 3, limit: Optional[int] = 10) -> List[Dict[str, Any]]:
+        """Groups of a kind with at least min_videos videos, by lift then size."""
+        views, likes, watch_time = self._columns()
+        baseline_median = float(np.median(views)) if len(views) else 0.0
+        max_videos = max(min_videos, int(len(self) * self.max_share))
+
+        results = []
+        for key, posting in self.postings[kind].items():
+            if not min_videos <= len(posting) <= max_videos:
+                continue
+            group = group_stats(np.asarray(posting), views, likes, watch_time)
+            group['group'] = key
+            group['lift'] = group['median_views'] / baseline_median if baseline_median else 0.0
+            results.append(group)
+
+        results.sort(key=lambda group: (-group['lift'], -group['videos'], group['group']))
+        return results[:limit] if limit is not None else results
+
+    def analyze(self, min_videos: int = 3, limit: int = 10) -> Dict[str, Any]:
+        """content_type_performance section: baseline plus top tag and term groups."""
+        if not len(self):
+            return {}
+        return {
+            'baseline': self.baseline(),
+            'tags': self.groups('tag', min_videos, limit),
+            'terms': self.groups('term', min_videos, limit)
+        }
+
+    def _columns(self):
+        return (
+            np.asarray(self.views),
+            np.asarray(self.likes),
+            np.asarray(self.watch_time)
+        )
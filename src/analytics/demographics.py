@@ -1,5 +1,6 @@
-from typing import Dict, List, Any
+from typing import Dict, Any
 from datetime import datetime, timedelta
+from src.api.rows import ReportTable
 
 class DemographicsAnalytics:
     def __init__(self, youtube_analytics):
@@ -19,7 +20,7 @@ class DemographicsAnalytics:
             'traffic': traffic_sources
         }
 
-    def _get_audience_demographics(self, video_id: str, start_date: str, end_date: str) -> List[Dict]:
+    def _get_audience_demographics(self, video_id: str, start_date: str, end_date: str) -> ReportTable:
         """Get age and gender demographics."""
         response = self.youtube_analytics.reports().query(
             ids="channel==MINE",
@@ -30,19 +31,16 @@ class DemographicsAnalytics:
             filters=f"video=={video_id}"
         ).execute()
 
-        if 'rows' not in response:
-            return []
-
-        return [
-            {
-                'age_group': row[0].replace('age', ''),
-                'gender': 'Female' if row[1] == 'female' else 'Male',
-                'percentage': round(float(row[2]), 2)
+        return ReportTable.from_response(
+            response,
+            rename={'ageGroup': 'age_group', 'viewerPercentage': 'percentage'},
+            convert={
+                'ageGroup': lambda value: value.replace('age', ''),
+                'gender': lambda value: 'Female' if value == 'female' else 'Male'
             }
-            for row in response['rows']
-        ]
+        )
 
-    def _get_traffic_sources(self, video_id: str, start_date: str, end_date: str) -> List[Dict]:
+    def _get_traffic_sources(self, video_id: str, start_date: str, end_date: str) -> ReportTable:
         """Get top traffic sources."""
         response = self.youtube_analytics.reports().query(
             ids="channel==MINE",
@@ -55,16 +53,11 @@ class DemographicsAnalytics:
             maxResults=5
         ).execute()
 
-        if 'rows' not in response:
-            return []
-
-        return [
-            {
-                'source': self._format_source_name(row[0]),
-                'views': int(row[1])
-            }
-            for row in response['rows']
-        ]
+        return ReportTable.from_response(
+            response,
+            rename={'insightTrafficSourceType': 'source'},
+            convert={'insightTrafficSourceType': self._format_source_name}
+        )
 
     def _format_source_name(self, source: str) -> str:
         """Format traffic source name for readability."""
@@ -1,5 +1,6 @@
 # src/description.py
 from typing import Dict, Any
+from src.api.fields import FIELDS
 
 class DescriptionAnalytics:
      def __init__(self, youtube):
@@ -11,7 +12,8 @@ class DescriptionAnalytics:
          try:
              response = self.youtube.videos().list(
                  part="snippet",
-                 id=video_id
+                 id=video_id,
+                 fields=FIELDS['videos.list.description']
              ).execute()
          
              if 'items' not in response or not response['items']:
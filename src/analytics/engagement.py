@@ -1,5 +1,7 @@
-from typing import Dict, List, Any
+from typing import Dict, Any
 from datetime import datetime, timedelta
+from src.api.rows import ReportTable
+from .comparison import SETTLE_DAYS
 
 class EngagementAnalytics:
     def __init__(self, youtube_analytics):
@@ -20,16 +22,21 @@ class EngagementAnalytics:
         if 'rows' not in response:
             return {}
             
-        metrics = response['rows'][0]
-        return {
-            'views': int(metrics[0]),
-            'watch_time': float(metrics[1]),
-            'avg_view_duration': float(metrics[2])
-        }
+        return ReportTable.from_response(response, rename={
+            'estimatedMinutesWatched': 'watch_time',
+            'averageViewDuration': 'avg_view_duration'
+        }).row()
 
-    def get_real_time_metrics(self, video_id: str) -> Dict[str, Any]:
-        end_date = datetime.now().strftime('%Y-%m-%d')
-        start_date = (datetime.now() - timedelta(days=2)).strftime('%Y-%m-%d')
+    def get_real_time_metrics(self, video_id: str, days: int = 28, settle_days: int = SETTLE_DAYS) -> Dict[str, Any]:
+        """
+        Daily views of a video over the `days` days ending settle_days ago.
+
+        The anomaly detector skips days it already processed, so the whole
+        window is refetched every run: a first run has enough days to warm up
+        and runs skipped for up to `days` days leave no gap in the series.
+        """
+        end_date = (datetime.now() - timedelta(days=settle_days)).strftime('%Y-%m-%d')
+        start_date = (datetime.now() - timedelta(days=settle_days + days - 1)).strftime('%Y-%m-%d')
         
         response = self.youtube_analytics.reports().query(
             ids="channel==MINE",
@@ -42,16 +49,10 @@ class EngagementAnalytics:
         ).execute()
         
         return {
-            'daily_views': [
-                {
-                    'date': row[0],
-                    'views': int(row[1])
-                }
-                for row in response.get('rows', [])
-            ]
+            'daily_views': ReportTable.from_response(response, rename={'day': 'date'})
         }
 
-    def get_peak_viewing_times(self, days: int = 30) -> Dict[str, List]:
+    def get_peak_viewing_times(self, days: int = 30) -> Dict[str, ReportTable]:
         end_date = datetime.now().strftime('%Y-%m-%d')
         start_date = (datetime.now() - timedelta(days=days)).strftime('%Y-%m-%d')
         
@@ -64,16 +65,9 @@ class EngagementAnalytics:
             sort="-views"
         ).execute()
         
-        if 'rows' not in response:
-            return {'peak_times': []}
-        
         return {
-            'peak_times': [
-                {
-                    'date': row[0],
-                    'watch_time': float(row[1]),
-                    'views': int(row[2])
-                }
-                for row in response.get('rows', [])
-            ]
+            'peak_times': ReportTable.from_response(response, rename={
+                'day': 'date',
+                'estimatedMinutesWatched': 'watch_time'
+            })
         }
\ No newline at end of file
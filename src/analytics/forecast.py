@@ -0,0 +1,236 @@
+import numpy as np
+from typing import Dict, List, Any, Optional, Sequence, Tuple
+from src.api.rows import ReportTable
+
+# Forecast horizons, in days
+FORECAST_HORIZONS = (7, 30)
+
+# (alpha, beta, gamma) combinations tried for every series; each keeps its best
+GRID = tuple(
+    (alpha, beta, gamma)
+    for alpha in (0.1, 0.3, 0.6)
+    for beta in (0.0, 0.05)
+    for gamma in (0.05, 0.2)
+)
+
+# Two-sided normal quantiles for the supported interval levels
+_Z = {0.8: 1.2816, 0.9: 1.6449, 0.95: 1.9600}
+
+
+def fit_holt_winters(series: np.ndarray, start: np.ndarray, season: int = 7,
+                     grid: Sequence[Tuple[float, float, float]] = GRID) -> Dict[str, np.ndarray]:
+    """
+    Additive Holt-Winters fitted to every row of a (series x days) matrix at once.
+
+    Row i is observed from column start[i] on and needs at least two
+    seasons. Its level and trend start from the means of its first two
+    seasons and its seasonal indices from the first season; the recursion
+    then runs over the remaining columns for all rows and every grid
+    combination in one pass, with rows that have not started yet left
+    untouched. Each row keeps the combination with the lowest one-step
+    squared error.
+    """
+    rows_count, days = series.shape
+    rows = np.arange(rows_count)
+    params = np.asarray(grid, dtype=np.float64)
+    alpha, beta, gamma = (params[:, i][:, None] for i in range(3))
+
+    offsets = start[:, None] + np.arange(season)
+    first = series[rows[:, None], offsets]
+    second = series[rows[:, None], offsets + season]
+    level0 = first.mean(axis=1)
+
+    # Seasonal indices are kept by absolute phase (column % season)
+    seasonal0 = np.zeros((rows_count, season))
+    seasonal0[rows[:, None], offsets % season] = first - level0[:, None]
+
+    combos = len(params)
+    level = np.tile(level0, (combos, 1))
+    trend = np.tile((second.mean(axis=1) - level0) / season, (combos, 1))
+    seasonal = np.tile(seasonal0, (combos, 1, 1))
+    sse = np.zeros((combos, rows_count))
+    fitted = start + season
+
+    for day in range(int(fitted.min()), days):
+        active = day >= fitted
+        observed = series[:, day]
+        phase = day % season
+        previous = seasonal[:, :, phase]
+
+        error = observed - (level + trend + previous)
+        sse += np.where(active, error * error, 0.0)
+
+        new_level = alpha * (observed - previous) + (1 - alpha) * (level + trend)
+        new_trend = beta * (new_level - level) + (1 - beta) * trend
+        new_seasonal = gamma * (observed - new_level) + (1 - gamma) * previous
+        level = np.where(active, new_level, level)
+        trend = np.where(active, new_trend, trend)
+        seasonal[:, :, phase] = np.where(active, new_seasonal, previous)
+
+    best = sse.argmin(axis=0)
+    steps = np.maximum(days - fitted, 1)
+    return {
+        'level': level[best, rows],
+        'trend': trend[best, rows],
+        'seasonal': seasonal[best, rows],
+        'params': params[best],
+        'sigma': np.sqrt(sse[best, rows] / steps),
+        'end': days
+    }
+
+
+def project(model: Dict[str, np.ndarray], horizon: int, season: int = 7,
+            interval: float = 0.95) -> Dict[str, np.ndarray]:
+    """
+    Daily forecasts and horizon totals with prediction intervals for every fitted row.
+
+    Uses the additive Holt-Winters error form: the h-step error is the
+    next innovation plus c_j-weighted earlier ones, c_j = alpha(1 + j beta)
+    + gamma [j multiple of season], which gives both the per-day and the
+    total-over-horizon variance. Views cannot go negative, so forecasts and
+    lower bounds are clipped at zero.
+    """
+    z = _Z[interval]
+    steps = np.arange(1, horizon + 1)
+    phases = (model['end'] - 1 + steps) % season
+    daily = (
+        model['level'][:, None]
+        + model['trend'][:, None] * steps
+        + model['seasonal'][:, phases]
+    )
+
+    alpha, beta, gamma = (model['params'][:, i][:, None] for i in range(3))
+    lags = steps[:-1]
+    weights = alpha * (1 + lags * beta) + gamma * (lags % season == 0)
+    sigma = model['sigma'][:, None]
+
+    # Per-day variance: 1 + sum of squared weights of the earlier innovations
+    day_variance = np.concatenate(
+        [np.ones((len(sigma), 1)), 1 + np.cumsum(weights ** 2, axis=1)], axis=1
+    ) * sigma ** 2
+    # Total variance: innovation k enters the total with weight 1 + C(horizon - k)
+    cumulative = np.concatenate([np.zeros((len(sigma), 1)), np.cumsum(weights, axis=1)], axis=1)
+    total_sigma = model['sigma'] * np.sqrt(((1 + cumulative) ** 2).sum(axis=1))
+
+    total = daily.sum(axis=1)
+    day_margin = z * np.sqrt(day_variance)
+    return {
+        'daily': np.clip(daily, 0, None),
+        'daily_low': np.clip(daily - day_margin, 0, None),
+        'daily_high': np.clip(daily + day_margin, 0, None),
+        'total': np.clip(total, 0, None),
+        'low': np.clip(total - z * total_sigma, 0, None),
+        'high': np.clip(total + z * total_sigma, 0, None)
+    }
+
+
+class ForecastIndex:
+    """
+    Daily view series of the channel and its videos, forecast in one batch.
+
+    Videos are added as they are enriched (their 'history' table of daily
+    views); analyze() aligns them into one videos x days matrix ending on
+    the latest reported day and fits every series together, so thousands
+    of videos cost a few hundred vectorized steps rather than a model fit
+    each. Series shorter than min_days are skipped.
+    """
+
+    def __init__(self, horizons: Sequence[int] = FORECAST_HORIZONS, season: int = 7,
+                 interval: float = 0.95, min_days: int = 21):
+        self.horizons = tuple(horizons)
+        self.season = season
+        self.interval = interval
+        self.min_days = max(min_days, 2 * season + 1)
+        self.video_ids: List[Optional[str]] = []
+        self.titles: List[str] = []
+        self.days: List[np.ndarray] = []
+        self.views: List[np.ndarray] = []
+
+    def __len__(self) -> int:
+        return len(self.video_ids)
+
+    def add(self, video: Dict) -> None:
+        history = video.get('history')
+        if not history:
+            return
+        self.video_ids.append(video.get('id'))
+        self.titles.append(video.get('title', 'Untitled'))
+        self.days.append(np.asarray(history['day'], dtype=np.int64))
+        self.views.append(np.asarray(history['views'], dtype=np.float64))
+
+    def forecast_series(self, days: Sequence[np.ndarray], views: Sequence[np.ndarray],
+                        end_day: int) -> Tuple[np.ndarray, Dict[str, Dict[str, np.ndarray]]]:
+        """
+        Fit and project day series ending on end_day.
+
+        Returns the indices of the series that were long enough and, per
+        horizon, the projection arrays for those series.
+        """
+        lengths = np.fromiter((len(d) for d in days), dtype=np.int64, count=len(days))
+        first = np.fromiter((d.min() if len(d) else end_day for d in days), dtype=np.int64, count=len(days))
+        span = int(end_day - first.min()) + 1 if len(days) else 0
+        start = first - (end_day - span + 1)
+        usable = np.flatnonzero((lengths > 0) & (span - start >= self.min_days))
+        if not len(usable):
+            return usable, {}
+
+        # Scatter every (series, day, views) point into the dense matrix at once; missing days are zero views
+        matrix = np.zeros((len(usable), span))
+        rows = np.repeat(np.arange(len(usable)), lengths[usable])
+        columns = np.concatenate([days[i] for i in usable]) - (end_day - span + 1)
+        values = np.concatenate([views[i] for i in usable])
+        inside = (columns >= 0) & (columns < span)
+        matrix[rows[inside], columns[inside]] = values[inside]
+
+        model = fit_holt_winters(matrix, start[usable], self.season)
+        return usable, {
+            f"{horizon}d": project(model, horizon, self.season, self.interval) for horizon in self.horizons
+        }
+
+    def analyze(self, channel_history: Optional[ReportTable] = None, limit: int = 10) -> Dict[str, Any]:
+        """forecasts section: channel projections and the videos projected to gain the most views."""
+        end_day = max((int(days.max()) for days in self.days if len(days)), default=None)
+        channel = {}
+        if channel_history:
+            channel_days = np.asarray(channel_history['day'], dtype=np.int64)
+            channel_end = int(channel_days.max())
+            used, projections = self.forecast_series(
+                [channel_days], [np.asarray(channel_history['views'], dtype=np.float64)], channel_end
+            )
+            if len(used):
+                channel = {key: self._entry(projection, 0) for key, projection in projections.items()}
+            end_day = end_day if end_day is not None else channel_end
+
+        videos = []
+        skipped = len(self)
+        if end_day is not None and len(self):
+            used, projections = self.forecast_series(self.days, self.views, end_day)
+            skipped = len(self) - len(used)
+            if len(used):
+                # Rank by the longest horizon's projected views
+                ranking = projections[f"{max(self.horizons)}d"]['total']
+                for position in np.argsort(-ranking, kind='stable')[:limit]:
+                    index = int(used[position])
+                    entry = {'id': self.video_ids[index], 'title': self.titles[index]}
+                    entry.update((key, self._entry(projection, position)) for key, projection in projections.items())
+                    videos.append(entry)
+
+        if not channel and not videos:
+            return {}
+        return {
+            'horizons': list(self.horizons),
+            'interval': self.interval,
+            'channel': channel,
+            'videos': videos,
+            'videos_forecast': len(self) - skipped,
+            'videos_skipped': skipped
+        }
+
+    @staticmethod
+    def _entry(projection: Dict[str, np.ndarray], row: int) -> Dict[str, float]:
+        return {
+            'views': round(float(projection['total'][row])),
+            'low': round(float(projection['low'][row])),
+            'high': round(float(projection['high'][row])),
+            'daily': [round(float(value), 1) for value in projection['daily'][row]]
+        }
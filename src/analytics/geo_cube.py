@@ -0,0 +1,154 @@
+import numpy as np
+from typing import Dict, List, Any, Optional, Tuple
+from src.api.rows import ReportTable
+
+CHANNEL_SCOPE = '__channel__'
+
+class GeographyCube:
+    """
+    Sparse country x video x period store of geography rows.
+
+    Rows are kept as coordinate lists (country, video, period) indexed by
+    country code and video id. Totals, shares, concentration (HHI) and
+    growth are summed straight from the coordinates with np.bincount, so
+    memory stays proportional to the rows, never countries x videos.
+    Channel-wide rows live under a reserved video slot.
+    """
+
+    PERIODS = ('previous', 'current')
+    METRICS = ('views', 'watch_time_minutes')
+
+    def __init__(self):
+        self.country_index: Dict[str, int] = {}
+        self.countries: List[str] = []
+        self.video_index: Dict[str, int] = {}
+        self.videos: List[str] = []
+        self._coords: Dict[str, List[int]] = {'country': [], 'video': [], 'period': []}
+        self._values: Dict[str, List[float]] = {metric: [] for metric in self.METRICS}
+        self._arrays: Optional[Dict[str, np.ndarray]] = None
+
+    def add_rows(self, rows: ReportTable, video_id: Optional[str] = None, period: str = 'current') -> None:
+        """Load a geography table for a video (or the channel when video_id is None)."""
+        if not rows:
+            return
+        video_position = self._position(self.video_index, self.videos, video_id or CHANNEL_SCOPE)
+        period_position = self.PERIODS.index(period)
+        count = len(rows)
+
+        self._coords['country'].extend(
+            self._position(self.country_index, self.countries, country) for country in rows['country']
+        )
+        self._coords['video'].extend([video_position] * count)
+        self._coords['period'].extend([period_position] * count)
+        for metric in self.METRICS:
+            self._values[metric].extend(rows.column(metric, [0] * count))
+        self._arrays = None
+
+    def rows(self, metric: str = 'views', period: str = 'current') -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """(country, video, value) coordinate arrays of a metric for one period."""
+        if self._arrays is None:
+            # Converted once per batch of added rows, however many aggregates read them
+            self._arrays = {name: np.asarray(values, dtype=np.int64) for name, values in self._coords.items()}
+            self._arrays.update(
+                (metric_name, np.asarray(values, dtype=np.float64)) for metric_name, values in self._values.items()
+            )
+        mask = self._arrays['period'] == self.PERIODS.index(period)
+        return self._arrays['country'][mask], self._arrays['video'][mask], self._arrays[metric][mask]
+
+    def country_totals(self, metric: str = 'views', period: str = 'current') -> np.ndarray:
+        """Per-country totals, preferring channel-wide rows over summed videos."""
+        countries, videos, values = self.rows(metric, period)
+        on_channel = videos == self.video_index.get(CHANNEL_SCOPE, -1)
+
+        if values[on_channel].any():
+            return np.bincount(countries[on_channel], weights=values[on_channel], minlength=len(self.countries))
+        return np.bincount(countries[~on_channel], weights=values[~on_channel], minlength=len(self.countries))
+
+    def shares(self, metric: str = 'views', period: str = 'current') -> np.ndarray:
+        """Country share of the metric total."""
+        totals = self.country_totals(metric, period)
+        grand_total = totals.sum()
+        return totals / grand_total if grand_total else np.zeros_like(totals)
+
+    def hhi(self, metric: str = 'views', period: str = 'current') -> float:
+        """Herfindahl-Hirschman index of country concentration (0-1)."""
+        return float(np.square(self.shares(metric, period)).sum())
+
+    def video_hhi(self, metric: str = 'views', period: str = 'current') -> Dict[str, float]:
+        """Per-video country concentration, computed across all videos at once."""
+        countries, videos, values = self.rows(metric, period)
+        keep = videos != self.video_index.get(CHANNEL_SCOPE, -1)
+        countries, videos, values = countries[keep], videos[keep], values[keep]
+
+        # Sum repeated (video, country) rows into cells before squaring their shares
+        cells, cell_of_row = np.unique(videos * len(self.countries) + countries, return_inverse=True)
+        cell_values = np.bincount(cell_of_row, weights=values, minlength=len(cells))
+        cell_videos = cells // max(len(self.countries), 1)
+        totals = np.bincount(cell_videos, weights=cell_values, minlength=len(self.videos))
+        squares = np.bincount(cell_videos, weights=np.square(cell_values), minlength=len(self.videos))
+
+        return {
+            self.videos[column]: float(squares[column] / totals[column] ** 2)
+            for column in range(len(self.videos))
+            if totals[column] > 0
+        }
+
+    def growth(self, metric: str = 'views') -> np.ndarray:
+        """Period-over-period growth per country in percent (NaN when new)."""
+        current = self.country_totals(metric, 'current')
+        previous = self.country_totals(metric, 'previous')
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return np.where(previous > 0, (current - previous) / previous * 100, np.nan)
+
+    def analyze(self, metric: str = 'views', top_n: int = 10) -> Dict[str, Any]:
+        """Summarize shares, concentration and growth for the report."""
+        if not self.countries:
+            return {}
+
+        current = self.country_totals(metric, 'current')
+        previous = self.country_totals(metric, 'previous')
+        shares = self.shares(metric, 'current')
+        growth = self.growth(metric)
+        has_previous = bool(previous.any())
+
+        order = np.argsort(-current, kind='stable')[:top_n]
+        countries = [
+            {
+                'country': self.countries[i],
+                metric: float(current[i]),
+                'share': round(float(shares[i]) * 100, 2),
+                'previous': float(previous[i]),
+                'growth': None if np.isnan(growth[i]) else round(float(growth[i]), 2)
+            }
+            for i in order
+            if current[i] > 0
+        ]
+
+        new_markets = []
+        if has_previous:
+            new_mask = (current > 0) & (previous == 0)
+            new_markets = [self.countries[i] for i in np.flatnonzero(new_mask)]
+
+        video_concentration = self.video_hhi(metric, 'current')
+
+        return {
+            'metric': metric,
+            'countries': countries,
+            'country_count': int((current > 0).sum()),
+            'concentration_hhi': round(self.hhi(metric, 'current'), 4),
+            'previous_hhi': round(self.hhi(metric, 'previous'), 4) if has_previous else None,
+            'new_markets': new_markets,
+            'median_video_hhi': (
+                round(float(np.median(list(video_concentration.values()))), 4)
+                if video_concentration else None
+            )
+        }
+
+    @staticmethod
+    def _position(index: Dict[str, int], keys: List[str], key: str) -> int:
+        position = index.get(key)
+        if position is None:
+            position = index[key] = len(keys)
+            keys.append(key)
+        return position
@@ -1,15 +1,29 @@
-from typing import Dict, List
-from datetime import datetime, timedelta
+from datetime import datetime
+from typing import Optional
+from src.api.rows import ReportTable, from_epoch_day, to_epoch_day
+from .comparison import settled_day
 
 class GeographyAnalytics:
     def __init__(self, youtube_analytics):
         self.youtube_analytics = youtube_analytics
 
-    def get_watch_time_by_country(self, video_id: str = None, days: int = 30) -> List[Dict]:
-        end_date = datetime.now().strftime('%Y-%m-%d')
-        start_date = (datetime.now() - timedelta(days=days)).strftime('%Y-%m-%d')
+    def get_watch_time_by_country(self, video_id: str = None, days: int = 30, offset_days: int = 0,
+                                  limit: Optional[int] = 25) -> ReportTable:
+        """
+        Get watch time by country over the `days` days ending on the settled
+        day; offset_days shifts the window into the past, so offset_days=days
+        is the previous period, adjacent to and disjoint from the current one.
+
+        Only the top `limit` countries by watch time come back; None returns
+        every country, which period-over-period growth needs so a country
+        crossing the cut-off is not taken for a new market.
+        """
+        last = settled_day(to_epoch_day(datetime.now().strftime('%Y-%m-%d'))) - offset_days
+        end_date = from_epoch_day(last)
+        start_date = from_epoch_day(last - days + 1)
         
         filters = f"video=={video_id}" if video_id else ""
+        options = {'maxResults': limit} if limit else {}
         
         response = self.youtube_analytics.reports().query(
             ids="channel==MINE",
@@ -19,11 +33,9 @@ class GeographyAnalytics:
             dimensions="country",
             filters=filters,
             sort="-estimatedMinutesWatched",
-            maxResults=25
+            **options
         ).execute()
         
-        return [{
-            'country': row[0],
-            'watch_time_minutes': float(row[1]),
-            'views': int(row[2])
-        } for row in response.get('rows', [])]
\ No newline at end of file
+        return ReportTable.from_response(response, rename={
+            'estimatedMinutesWatched': 'watch_time_minutes'
+        })
\ No newline at end of file
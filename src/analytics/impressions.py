@@ -1,5 +1,6 @@
 from typing import Dict, Any
 from datetime import datetime, timedelta
+from src.api.rows import ReportTable
 
 class ImpressionAnalytics:
     def __init__(self, youtube_analytics):
@@ -27,10 +28,10 @@ class ImpressionAnalytics:
                     'click_through_rate': 0.0
                 }
                 
-            # If rows exist, process them
-            metrics = response['rows'][0]
-            views = int(metrics[1])
-            likes = int(metrics[2])
+            # Columns are looked up by header; the video dimension comes first
+            metrics = ReportTable.from_response(response).row()
+            views = metrics['views']
+            likes = metrics['likes']
             
             return {
                 'impressions': views,  # Using views as impressions
@@ -0,0 +1,111 @@
+import heapq
+import time
+from typing import Dict, List, Any, Callable, Optional
+
+def _views(video: Dict) -> float:
+    return video.get('stats', {}).get('views', 0)
+
+def _likes(video: Dict) -> float:
+    return video.get('stats', {}).get('likes', 0)
+
+def _engagement_rate(video: Dict) -> float:
+    views = _views(video)
+    return (_likes(video) / views * 100) if views > 0 else 0.0
+
+def _watch_time(video: Dict) -> float:
+    return video.get('performance', {}).get('watch_time', 0)
+
+def _avg_view_percentage(video: Dict) -> float:
+    return video.get('performance', {}).get('avg_percentage_watched', 0)
+
+def _comment_velocity(video: Dict) -> float:
+    return video.get('comments_activity', {}).get('velocity', 0)
+
+def _views_per_day(video: Dict, now: Optional[float] = None) -> float:
+    published_ts = video.get('published_ts')
+    if published_ts is None:
+        return 0.0
+    age_days = max(((now or time.time()) - published_ts) / 86400, 1.0)
+    return _views(video) / age_days
+
+
+class RankingIndex:
+    """
+    Column store of per-video ranking metrics.
+
+    Metric values are computed once when a video is added, and top/bottom
+    queries use heap-based partial selection (O(n log k)) rather than a
+    full sort per query.
+    """
+
+    METRICS: Dict[str, Callable[[Dict], float]] = {
+        'views': _views,
+        'likes': _likes,
+        'engagement_rate': _engagement_rate,
+        'watch_time': _watch_time,
+        'avg_view_percentage': _avg_view_percentage,
+        'views_per_day': _views_per_day,
+        'comment_velocity': _comment_velocity
+    }
+
+    def __init__(self, videos: Optional[List[Dict]] = None):
+        self.videos: List[Dict] = []
+        self.positions: Dict[str, int] = {}
+        self.columns: Dict[str, List[float]] = {metric: [] for metric in self.METRICS}
+
+        for video in videos or []:
+            self.add(video)
+
+    def __len__(self) -> int:
+        return len(self.videos)
+
+    def add(self, video: Dict) -> None:
+        """Add or refresh a video's metric values."""
+        video_id = video.get('id')
+        position = self.positions.get(video_id)
+
+        if position is None:
+            position = len(self.videos)
+            self.videos.append(video)
+            if video_id is not None:
+                self.positions[video_id] = position
+            for metric, column in self.columns.items():
+                column.append(self.METRICS[metric](video))
+            return
+
+        self.videos[position] = video
+        for metric, column in self.columns.items():
+            column[position] = self.METRICS[metric](video)
+
+    def top(self, metric: str = 'views', k: int = 5) -> List[Dict]:
+        """Return the k highest-ranked videos by a metric."""
+        column = self.columns[metric]
+        positions = heapq.nlargest(k, range(len(column)), key=column.__getitem__)
+        return [self.videos[i] for i in positions]
+
+    def bottom(self, metric: str = 'views', k: int = 5) -> List[Dict]:
+        """Return the k lowest-ranked videos by a metric."""
+        column = self.columns[metric]
+        positions = heapq.nsmallest(k, range(len(column)), key=column.__getitem__)
+        return [self.videos[i] for i in positions]
+
+    def value(self, video: Dict, metric: str) -> float:
+        """Look up a video's indexed metric value."""
+        position = self.positions.get(video.get('id'))
+        if position is None:
+            return self.METRICS[metric](video)
+        return self.columns[metric][position]
+
+    def leaderboards(self, metrics: Optional[List[str]] = None, k: int = 3) -> Dict[str, List[Dict[str, Any]]]:
+        """Top-k entries for several metrics, as title/value pairs."""
+        return {
+            metric: [
+                {
+                    'id': video.get('id'),
+                    'title': video.get('title', 'Untitled'),
+                    'value': self.value(video, metric)
+                }
+                for video in self.top(metric, k)
+            ]
+            for metric in (metrics or list(self.METRICS))
+        }
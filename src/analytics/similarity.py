@@ -0,0 +1,237 @@
+import re
+import zlib
+import numpy as np
+from array import array
+from typing import Dict, List, Any, Iterator, Optional, Sequence, Tuple
+from src.utils.formatters import DataFormatter
+from .content_index import PLACEHOLDER_DESCRIPTIONS, group_stats
+
+_WORD = re.compile(r"\w+")
+_MERSENNE = (1 << 31) - 1
+
+
+def shingle_hashes(text: str, k: int = 2) -> np.ndarray:
+    """Distinct CRC32 hashes of the lowercase word k-grams of a text."""
+    words = _WORD.findall(text.lower())
+    if not words:
+        return np.empty(0, dtype=np.uint64)
+    if len(words) < k:
+        grams = [' '.join(words)]
+    else:
+        grams = (' '.join(words[i:i + k]) for i in range(len(words) - k + 1))
+    return np.unique(np.fromiter((zlib.crc32(gram.encode()) for gram in grams), dtype=np.uint64))
+
+
+class MinHasher:
+    """MinHash signatures from universal hashes (a*x + b) mod 2^31-1."""
+
+    def __init__(self, num_perm: int = 64, seed: int = 1):
+        rng = np.random.default_rng(seed)
+        self.num_perm = num_perm
+        self.a = rng.integers(1, _MERSENNE, num_perm, dtype=np.uint64)
+        self.b = rng.integers(0, _MERSENNE, num_perm, dtype=np.uint64)
+
+    def signature(self, hashes: np.ndarray) -> np.ndarray:
+        if not len(hashes):
+            return np.full(self.num_perm, _MERSENNE, dtype=np.uint32)
+        values = hashes % _MERSENNE
+        return ((np.outer(self.a, values) + self.b[:, None]) % _MERSENNE).min(axis=1).astype(np.uint32)
+
+    @staticmethod
+    def similarity(left: np.ndarray, right: np.ndarray) -> float:
+        """Estimated Jaccard similarity: share of agreeing signature slots."""
+        return float(np.mean(left == right))
+
+
+class LSHIndex:
+    """Banded LSH buckets over MinHash signatures."""
+
+    def __init__(self, bands: int = 8, rows: int = 8):
+        self.bands = bands
+        self.rows = rows
+        self.buckets: Dict[Tuple[int, bytes], List[int]] = {}
+
+    def add(self, key: int, signature: np.ndarray) -> None:
+        for band in range(self.bands):
+            band_key = (band, signature[band * self.rows:(band + 1) * self.rows].tobytes())
+            self.buckets.setdefault(band_key, []).append(key)
+
+    def remove(self, key: int, signature: np.ndarray) -> None:
+        for band in range(self.bands):
+            band_key = (band, signature[band * self.rows:(band + 1) * self.rows].tobytes())
+            keys = self.buckets.get(band_key)
+            if keys and key in keys:
+                keys.remove(key)
+                if not keys:
+                    del self.buckets[band_key]
+
+    def query(self, signature: np.ndarray) -> List[int]:
+        """Keys sharing at least one band with a signature."""
+        keys = set()
+        for band in range(self.bands):
+            keys.update(self.buckets.get((band, signature[band * self.rows:(band + 1) * self.rows].tobytes()), ()))
+        return sorted(keys)
+
+    def candidate_groups(self) -> Iterator[List[int]]:
+        """Buckets holding more than one key."""
+        return (keys for keys in self.buckets.values() if len(keys) > 1)
+
+
+class DescriptionIndex:
+    """
+    Near-duplicate descriptions and shared boilerplate blocks.
+
+    Whole descriptions, and separately their paragraphs, are shingled into
+    word 2-grams and reduced to MinHash signatures bucketed by LSH bands.
+    Only bucket-mates are compared, so clustering grows with the number of
+    videos instead of its square. Clusters of whole descriptions above
+    threshold are templates, compared on performance; clusters of
+    near-identical paragraphs (duplicate_threshold) used by at least
+    min_videos videos are boilerplate, which the video section prints once.
+    """
+
+    def __init__(self, threshold: float = 0.5, duplicate_threshold: float = 0.8, min_videos: int = 3,
+                 num_perm: int = 64, bands: int = 16):
+        self.threshold = threshold
+        self.duplicate_threshold = duplicate_threshold
+        self.min_videos = min_videos
+        self.hasher = MinHasher(num_perm)
+        rows = num_perm // bands
+
+        self.video_ids: List[Optional[str]] = []
+        self.titles: List[str] = []
+        self.views = array('d')
+        self.likes = array('d')
+        self.watch_time = array('d')
+        self.video_blocks: List[array] = []
+
+        self.descriptions = LSHIndex(bands, rows)
+        self.description_signatures: Dict[int, np.ndarray] = {}
+
+        # Paragraphs are stored once per distinct normalized text
+        self.blocks = LSHIndex(bands, rows)
+        self.block_keys: Dict[str, int] = {}
+        self.block_texts: List[str] = []
+        self.block_signatures: List[np.ndarray] = []
+        self.block_videos: List[array] = []
+
+    def __len__(self) -> int:
+        return len(self.video_ids)
+
+    def add(self, video: Dict) -> None:
+        """Index a video's description and paragraphs and record its metrics."""
+        position = len(self.video_ids)
+        stats = video.get('stats', {})
+        self.video_ids.append(video.get('id'))
+        self.titles.append(video.get('title', 'Untitled'))
+        self.views.append(stats.get('views', 0))
+        self.likes.append(stats.get('likes', 0))
+        self.watch_time.append(video.get('performance', {}).get('watch_time', 0))
+
+        description = video.get('description') or ''
+        if description in PLACEHOLDER_DESCRIPTIONS:
+            description = ''
+
+        blocks = array('q')
+        for paragraph in DataFormatter.split_paragraphs(description):
+            blocks.append(self._block(paragraph, position))
+        self.video_blocks.append(blocks)
+
+        if blocks:
+            signature = self.hasher.signature(shingle_hashes(description))
+            self.description_signatures[position] = signature
+            self.descriptions.add(position, signature)
+
+    def templates(self, limit: Optional[int] = 10) -> List[Dict[str, Any]]:
+        """Clusters of near-duplicate descriptions with their performance."""
+        clusters = self._clusters(self.descriptions, self.description_signatures, self.threshold)
+        clusters.sort(key=lambda members: (-len(members), members[0]))
+
+        results = []
+        for number, members in enumerate(clusters[:limit] if limit is not None else clusters, 1):
+            group = self._stats(members)
+            group.update(template=f"T{number}", sample_title=self.titles[members[0]])
+            results.append(group)
+        return results
+
+    def boilerplate(self) -> Tuple[List[Dict[str, Any]], Dict[int, str]]:
+        """Paragraph clusters shared by at least min_videos videos, and block -> label."""
+        signatures = dict(enumerate(self.block_signatures))
+        shared = []
+        for members in self._clusters(self.blocks, signatures, self.duplicate_threshold, singletons=True):
+            videos = sorted({position for block in members for position in self.block_videos[block]})
+            if len(videos) >= self.min_videos:
+                shared.append((members, videos))
+        shared.sort(key=lambda entry: (-len(entry[1]), entry[0][0]))
+
+        results = []
+        labels: Dict[int, str] = {}
+        for number, (members, videos) in enumerate(shared, 1):
+            label = f"B{number}"
+            representative = max(members, key=lambda block: (len(self.block_videos[block]), -block))
+            group = self._stats(videos)
+            group.update(block=label, text=self.block_texts[representative])
+            results.append(group)
+            labels.update((block, label) for block in members)
+        return results, labels
+
+    def analyze(self, limit: int = 10) -> Dict[str, Any]:
+        """description_similarity section: templates, boilerplate blocks and per-video block labels."""
+        if not len(self):
+            return {}
+        boilerplate, labels = self.boilerplate()
+        video_blocks = {}
+        for position, blocks in enumerate(self.video_blocks):
+            marks = [labels.get(block) for block in blocks]
+            if any(marks):
+                video_blocks[str(self.video_ids[position])] = marks
+        return {
+            'templates': self.templates(limit),
+            'boilerplate': boilerplate,
+            'video_blocks': video_blocks
+        }
+
+    def _block(self, paragraph: str, position: int) -> int:
+        key = ' '.join(_WORD.findall(paragraph.lower()))
+        block = self.block_keys.get(key)
+        if block is None:
+            block = self.block_keys[key] = len(self.block_texts)
+            signature = self.hasher.signature(shingle_hashes(paragraph))
+            self.block_texts.append(paragraph)
+            self.block_signatures.append(signature)
+            self.block_videos.append(array('q'))
+            self.blocks.add(block, signature)
+        videos = self.block_videos[block]
+        if not videos or videos[-1] != position:
+            videos.append(position)
+        return block
+
+    def _clusters(self, lsh: LSHIndex, signatures: Dict[int, np.ndarray], threshold: float,
+                  singletons: bool = False) -> List[List[int]]:
+        """Union bucket-mates whose estimated similarity to the bucket's first key passes the threshold."""
+        parent = {key: key for key in signatures}
+
+        def find(key: int) -> int:
+            while parent[key] != key:
+                parent[key] = parent[parent[key]]
+                key = parent[key]
+            return key
+
+        for keys in lsh.candidate_groups():
+            anchor = keys[0]
+            for key in keys[1:]:
+                if MinHasher.similarity(signatures[anchor], signatures[key]) >= threshold:
+                    parent[find(key)] = find(anchor)
+
+        clusters: Dict[int, List[int]] = {}
+        for key in signatures:
+            clusters.setdefault(find(key), []).append(key)
+        return [sorted(members) for members in clusters.values() if singletons or len(members) > 1]
+
+    def _stats(self, positions: Sequence[int]) -> Dict[str, Any]:
+        views = np.asarray(self.views)
+        group = group_stats(np.asarray(positions, dtype=np.int64), views, np.asarray(self.likes),
+                            np.asarray(self.watch_time))
+        baseline_median = float(np.median(views)) if len(views) else 0.0
+        group['lift'] = group['median_views'] / baseline_median if baseline_median else 0.0
+        return group
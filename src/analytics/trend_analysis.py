@@ -1,4 +1,9 @@
-def analyze_trends(videos):
+from .ranking import RankingIndex
+from .geo_cube import GeographyCube
+from .content_index import ContentIndex
+from .similarity import DescriptionIndex
+
+def analyze_trends(videos, ranking=None, geography=None, content=None, descriptions=None):
     """Comprehensive trend analysis for YouTube channel."""
     if not videos:
         return {
@@ -10,14 +15,19 @@ def analyze_trends(videos):
             'content_insights': {
                 'best_performing_videos': [],
                 'worst_performing_videos': [],
-                'content_type_performance': {}
+                'content_type_performance': {},
+                'description_similarity': {},
+                'leaderboards': {}
             },
             'audience_trends': {
                 'demographic_shifts': [],
-                'geographic_expansion': []
+                'geographic_expansion': {}
             }
         }
 
+    if ranking is None:
+        ranking = RankingIndex(videos)
+
     return {
         'performance_trends': {
             'views': _calculate_view_trend(videos),
@@ -25,13 +35,15 @@ def analyze_trends(videos):
             'watch_time': _calculate_watch_time_trend(videos)
         },
         'content_insights': {
-            'best_performing_videos': _find_top_videos(videos),
-            'worst_performing_videos': _find_bottom_videos(videos),
-            'content_type_performance': _analyze_content_types(videos)
+            'best_performing_videos': _find_top_videos(ranking),
+            'worst_performing_videos': _find_bottom_videos(ranking),
+            'content_type_performance': _analyze_content_types(videos, content),
+            'description_similarity': _analyze_descriptions(videos, descriptions),
+            'leaderboards': ranking.leaderboards()
         },
         'audience_trends': {
             'demographic_shifts': _track_demographic_changes(videos),
-            'geographic_expansion': _analyze_geographic_growth(videos)
+            'geographic_expansion': _analyze_geographic_growth(videos, geography)
         }
     }
 
@@ -90,18 +102,29 @@ def _calculate_rolling_average(values, window=3):
         for i in range(len(values))
     ]
 
-def _find_top_videos(videos, top_n=5):
+def _find_top_videos(ranking, top_n=5):
     """Find top performing videos."""
-    return sorted(videos, key=lambda x: x['stats']['views'], reverse=True)[:top_n]
+    return ranking.top('views', top_n)
 
-def _find_bottom_videos(videos, bottom_n=5):
+def _find_bottom_videos(ranking, bottom_n=5):
     """Find bottom performing videos."""
-    return sorted(videos, key=lambda x: x['stats']['views'])[:bottom_n]
+    return ranking.bottom('views', bottom_n)
+
+def _analyze_content_types(videos, content=None):
+    """Analyze performance by tag and title/description term groups."""
+    if content is None:
+        content = ContentIndex()
+        for video in videos:
+            content.add(video)
+    return content.analyze()
 
-def _analyze_content_types(videos):
-    """Analyze performance by content type or tags."""
-    # Placeholder for more sophisticated content type extraction
-    return {}
+def _analyze_descriptions(videos, descriptions=None):
+    """Find description templates and shared boilerplate paragraphs."""
+    if descriptions is None:
+        descriptions = DescriptionIndex()
+        for video in videos:
+            descriptions.add(video)
+    return descriptions.analyze()
 
 def _track_demographic_changes(videos):
     """Track shifts in audience demographics."""
@@ -111,10 +134,10 @@ def _track_demographic_changes(videos):
     ]
     return demographic_data
 
-def _analyze_geographic_growth(videos):
+def _analyze_geographic_growth(videos, geography=None):
     """Analyze geographic distribution growth."""
-    geographic_data = [
-        video.get('geography', []) 
-        for video in videos
-    ]
-    return geographic_data
\ No newline at end of file
+    if geography is None:
+        geography = GeographyCube()
+        for video in videos:
+            geography.add_rows(video.get('geography', []), video.get('id'))
+    return geography.analyze()
\ No newline at end of file
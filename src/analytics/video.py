@@ -1,33 +1,51 @@
 # src/video.py
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Iterator, Optional, Sequence, Tuple
 from datetime import datetime, timedelta
 from .demographics import DemographicsAnalytics
 from .impressions import ImpressionAnalytics
 from .description import DescriptionAnalytics
+from .comparison import HORIZONS, PeriodComparison, fetch_span, settled_day, through_day
+from src.api.fields import FIELDS
+from src.api.rows import ReportTable, to_epoch_day
+from src.utils.date_helper import DateHelper
 
 class VideoAnalytics:
-     def __init__(self, youtube, youtube_analytics):
-         """Initialize with API clients."""
+     def __init__(self, youtube, youtube_analytics, cache=None):
+         """Initialize with API clients and an optional ConditionalCache for Data API resources."""
          self.youtube = youtube
          self.youtube_analytics = youtube_analytics
+         self.cache = cache
          self.demographics = DemographicsAnalytics(youtube_analytics)
          self.impressions = ImpressionAnalytics(youtube_analytics)
          self.descriptions = DescriptionAnalytics(youtube)  # Initialize the DescriptionAnalytics
 
-     def get_recent_videos(self, max_results: int = 50) -> List[Dict[str, Any]]:
+     def get_recent_videos(self, max_results: int = 50, with_performance: bool = True,
+                           with_impressions: bool = True) -> List[Dict[str, Any]]:
          """Get recent videos with basic stats."""
-         all_videos = []
-         page_token = None
+         return list(self.iter_recent_videos(max_results, with_performance, with_impressions))
 
-         while len(all_videos) < max_results:
+     def iter_recent_videos(self, max_results: int = 50, with_performance: bool = True,
+                            with_impressions: bool = True) -> Iterator[Dict[str, Any]]:
+         """Yield recent videos with basic stats one at a time."""
+         for videos, _ in self.iter_video_pages(max_results, with_performance, with_impressions):
+             yield from videos
+
+     def iter_video_pages(self, max_results: int = 50, with_performance: bool = True,
+                          with_impressions: bool = True,
+                          page_token: Optional[str] = None) -> Iterator[Tuple[List[Dict[str, Any]], Optional[str]]]:
+         """Yield (videos, next page token) per listing page, optionally starting from a page token."""
+         count = 0
+
+         while count < max_results:
              # Get video IDs with pagination
              videos_response = self.youtube.search().list(
                  part="snippet",
                  forMine=True,
-                 maxResults=min(50, max_results - len(all_videos)),  # YouTube API limit is 50
+                 maxResults=min(50, max_results - count),  # YouTube API limit is 50
                  type="video",
                  order="date",
-                 pageToken=page_token
+                 pageToken=page_token,
+                 fields=FIELDS['search.list']
              ).execute()
 
              if 'items' not in videos_response:
@@ -37,27 +55,53 @@ class VideoAnalytics:
              video_ids = [item['id']['videoId'] for item in videos_response['items']]
 
              # Get detailed stats for these videos
-             stats_response = self.youtube.videos().list(
-                 part="statistics,snippet,contentDetails",
-                 id=','.join(video_ids)
-             ).execute()
+             stats_response = self._list_videos(video_ids)
 
-             # Process videos and add to list
-             for item in stats_response.get('items', []):
-                 video_data = self._process_video_item(item)
-                 all_videos.append(video_data)
+             videos = [
+                 self._process_video_item(item, with_performance, with_impressions)
+                 for item in stats_response.get('items', [])
+             ]
+             count += len(videos)
 
              # Check if there are more pages
              page_token = videos_response.get('nextPageToken')
+             yield videos, page_token
              if not page_token:
                  break
 
-         return all_videos
+     def _list_videos(self, video_ids: List[str]) -> Dict[str, Any]:
+        """videos().list for one page of ids."""
+        if not self.cache:
+            return self.youtube.videos().list(
+                part="statistics,snippet,contentDetails",
+                id=','.join(video_ids),
+                fields=FIELDS['videos.list']
+            ).execute()
+
+        # Statistics change on every run and would void the page's ETag, so they
+        # are fetched on their own; snippet and contentDetails are fetched conditionally
+        details = self.cache.execute(self.youtube.videos().list(
+            part="snippet,contentDetails",
+            id=','.join(video_ids),
+            fields=FIELDS['videos.list.details']
+        ))
+        statistics = self.youtube.videos().list(
+            part="statistics",
+            id=','.join(video_ids),
+            fields=FIELDS['videos.list.statistics']
+        ).execute()
 
-     def _process_video_item(self, item: Dict) -> Dict:
+        stats_by_id = {item['id']: item.get('statistics', {}) for item in statistics.get('items', [])}
+        for item in details.get('items', []):
+            item['statistics'] = stats_by_id.get(item['id'], {})
+        return details
+
+     def _process_video_item(self, item: Dict, with_performance: bool = True,
+                             with_impressions: bool = True) -> Dict:
         """Process a single video item."""
         video_id = item['id']
         stats = item['statistics']
+        duration_seconds = DateHelper.parse_duration(item['contentDetails']['duration'])
         video_data = {
             'title': item['snippet']['title'],
             'id': video_id,
@@ -67,19 +111,31 @@ class VideoAnalytics:
                 'comments': int(stats.get('commentCount', 0))
             },
             'published_at': item['snippet']['publishedAt'],
-            'duration': self._format_duration(item['contentDetails']['duration']),
-            'description': self.descriptions.get_video_description(video_id) # Fetch description
+            'published_ts': DateHelper.parse_timestamp(item['snippet']['publishedAt']),
+            'duration_seconds': duration_seconds,
+            'duration': DateHelper.format_seconds(duration_seconds),
+            # The snippet already carries the description; no extra videos().list call
+            'description': item['snippet'].get('description') or "No description available.",
+            'tags': item['snippet'].get('tags', [])
         }
+        return self.enrich_video(video_data, with_performance, with_impressions)
+
+     def enrich_video(self, video_data: Dict, with_performance: bool = True,
+                      with_impressions: bool = True) -> Dict:
+        """Attach performance and impression metrics to a listed video."""
+        video_id = video_data['id']
 
         # Add performance metrics
-        perf_data = self._get_performance_metrics(video_id)
-        if perf_data:
-            video_data['performance'] = perf_data
+        if with_performance:
+            perf_data = self._get_performance_metrics(video_id)
+            if perf_data:
+                video_data['performance'] = perf_data
 
         # Add impression metrics
-        impression_data = self.impressions.get_impression_metrics(video_id)
-        if impression_data:
-            video_data['impressions'] = impression_data
+        if with_impressions:
+            impression_data = self.impressions.get_impression_metrics(video_id)
+            if impression_data:
+                video_data['impressions'] = impression_data
         
         return video_data
 
@@ -99,29 +155,63 @@ class VideoAnalytics:
         if 'rows' not in response:
             return {}
 
-        metrics = response['rows'][0]
+        metrics = ReportTable.from_response(response).row()
         return {
-            'watch_time': round(float(metrics[0]), 2),
-            'avg_view_duration': round(float(metrics[1]), 2),
-            'avg_percentage_watched': round(float(metrics[2]), 2)
+            'watch_time': round(metrics['estimatedMinutesWatched'], 2),
+            'avg_view_duration': round(metrics['averageViewDuration'], 2),
+            'avg_percentage_watched': round(metrics['averageViewPercentage'], 2)
         }
 
-     @staticmethod
-     def _format_duration(duration: str) -> str:
-         """Format video duration from ISO 8601 to readable format."""
-         duration = duration.replace('PT', '')
-         if 'H' in duration:
-             hours, rest = duration.split('H')
-             minutes = rest.split('M')[0] if 'M' in rest else '0'
-             seconds = rest.split('M')[1].replace('S', '') if 'S' in rest else '0'
-             return f"{hours}:{minutes.zfill(2)}:{seconds.zfill(2)}"
-         elif 'M' in duration:
-             minutes, seconds = duration.split('M')
-             seconds = seconds.replace('S', '')
-             return f"{minutes}:{seconds.zfill(2)}"
-         else:
-             seconds = duration.replace('S', '')
-             return f"0:{seconds.zfill(2)}"
+     def get_period_comparison(self, video_id: str, horizons: Sequence[int] = HORIZONS) -> Dict[str, Any]:
+        """Period-over-period deltas for each horizon from one daily fetch of the video."""
+        now = datetime.now()
+        end_date = now.strftime('%Y-%m-%d')
+        start_date = (now - timedelta(days=fetch_span(horizons))).strftime('%Y-%m-%d')
+
+        response = self.youtube_analytics.reports().query(
+            ids="channel==MINE",
+            startDate=start_date,
+            endDate=end_date,
+            metrics="views,estimatedMinutesWatched,averageViewDuration,likes,subscribersGained",
+            dimensions="day",
+            filters=f"video=={video_id}",
+            sort="day"
+        ).execute()
+
+        if 'rows' not in response:
+            return {}
+
+        history = ReportTable.from_response(response, rename={
+            'estimatedMinutesWatched': 'watch_time_minutes',
+            'averageViewDuration': 'avg_view_duration',
+            'subscribersGained': 'subscribers_gained'
+        })
+        # Same window as get_view_history, so the two merge; the comparison ends on the last settled day
+        return PeriodComparison(history, settled_day(to_epoch_day(end_date))).summary(horizons)
+
+     def get_view_history(self, video_id: str, days: int = fetch_span(HORIZONS)) -> ReportTable:
+        """
+        Daily views of a video (day, views) through the last settled day.
+
+        Fetched through today, like get_period_comparison, so the two merge
+        into one query; the unsettled days are dropped afterwards, as their
+        partial counts would read as a drop to the forecasts.
+        """
+        now = datetime.now()
+        end_date = now.strftime('%Y-%m-%d')
+        start_date = (now - timedelta(days=days)).strftime('%Y-%m-%d')
+
+        response = self.youtube_analytics.reports().query(
+            ids="channel==MINE",
+            startDate=start_date,
+            endDate=end_date,
+            metrics="views",
+            dimensions="day",
+            filters=f"video=={video_id}",
+            sort="day"
+        ).execute()
+
+        return through_day(ReportTable.from_response(response), settled_day(to_epoch_day(end_date)))
 
      def get_audience_retention(self, video_id: str) -> Dict[str, Any]:
         """Get audience retention data for a video."""
@@ -142,11 +232,11 @@ class VideoAnalytics:
             return {}
 
         return {
-            'retention_points': [
-                {
-                    'position': float(row[0]),
-                    'retention_percentage': float(row[1])
+            'retention_points': ReportTable.from_response(
+                response,
+                rename={
+                    'elapsedVideoTimeRatio': 'position',
+                    'relativeRetentionPerformance': 'retention_percentage'
                 }
-                for row in response['rows']
-            ]
+            )
         }
\ No newline at end of file
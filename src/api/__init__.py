@@ -0,0 +1,10 @@
+from src._lazy import lazy_exports
+
+__all__, __getattr__, __dir__ = lazy_exports(__name__, {
+    'QueryMerger': '.query_merger',
+    'ReportTable': '.rows',
+    'AdaptiveLimiter': '.limiter',
+    'ConditionalCache': '.conditional',
+    'TransportMeter': '.transport',
+    'TransportPool': '.transport'
+})
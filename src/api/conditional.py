@@ -0,0 +1,86 @@
+import json
+import time
+import sqlite3
+from typing import Dict, Any, Optional
+from .limiter import _status
+
+NOT_MODIFIED = 304
+
+
+class ConditionalCache:
+    """
+    ETag store for conditional Data API requests.
+
+    Each request's response is cached with its ETag, keyed by the request
+    URI. The next fetch of the same URI sends If-None-Match; a 304 is
+    answered from the cached body. Bytes and time saved are estimated from
+    the size of the cached body and the duration of its last full fetch.
+    Entries unused for max_age_days are pruned on close.
+    """
+
+    def __init__(self, path: str, max_age_days: int = 30):
+        self.max_age_days = max_age_days
+        self.conn = sqlite3.connect(path)
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS resources (
+                uri TEXT PRIMARY KEY,
+                etag TEXT NOT NULL,
+                payload TEXT NOT NULL,
+                elapsed REAL NOT NULL,
+                last_used REAL NOT NULL
+            );
+        """)
+        self.stats = {'requests': 0, 'not_modified': 0, 'bytes_saved': 0, 'seconds_saved': 0.0}
+
+    def execute(self, request: Any) -> Dict[str, Any]:
+        """Execute a Data API request, conditionally when its URI was seen before."""
+        uri = getattr(request, 'uri', None)
+        headers = getattr(request, 'headers', None)
+        if uri is None or headers is None:
+            return request.execute()
+
+        self.stats['requests'] += 1
+        cached = self.conn.execute(
+            "SELECT etag, payload, elapsed FROM resources WHERE uri = ?", (uri,)
+        ).fetchone()
+        if cached:
+            headers['If-None-Match'] = cached[0]
+
+        start = time.perf_counter()
+        try:
+            response = request.execute()
+        except Exception as e:
+            if not cached or _status(e) != NOT_MODIFIED:
+                raise
+            elapsed = time.perf_counter() - start
+            self.stats['not_modified'] += 1
+            self.stats['bytes_saved'] += len(cached[1])
+            self.stats['seconds_saved'] += max(0.0, cached[2] - elapsed)
+            with self.conn:
+                self.conn.execute("UPDATE resources SET last_used = ? WHERE uri = ?", (time.time(), uri))
+            return json.loads(cached[1])
+        finally:
+            headers.pop('If-None-Match', None)
+
+        elapsed = time.perf_counter() - start
+        etag = response.get('etag')
+        if etag:
+            with self.conn:
+                self.conn.execute(
+                    "INSERT OR REPLACE INTO resources VALUES (?, ?, ?, ?, ?)",
+                    (uri, etag, json.dumps(response), elapsed, time.time())
+                )
+        return response
+
+    def describe(self) -> str:
+        return (
+            f"{self.stats['not_modified']}/{self.stats['requests']} not modified, "
+            f"{self.stats['bytes_saved'] / 1024:.1f} KiB and {self.stats['seconds_saved']:.2f}s saved"
+        )
+
+    def close(self) -> None:
+        with self.conn:
+            self.conn.execute(
+                "DELETE FROM resources WHERE last_used < ?", (time.time() - self.max_age_days * 86400,)
+            )
+        self.conn.close()
@@ -0,0 +1,18 @@
+# Partial-response masks for the Data API calls: only the fields the
+# analytics code reads. Add a field here when code starts reading it.
+FIELDS = {
+    'channels.list': 'etag,items/statistics(subscriberCount,viewCount,videoCount)',
+    'search.list': 'nextPageToken,items/id/videoId',
+    'videos.list': (
+        'items(id,statistics(viewCount,likeCount,commentCount),'
+        'snippet(title,publishedAt,description,tags),contentDetails/duration)'
+    ),
+    # The ETag-cached half and the always-fresh half of a split videos.list
+    'videos.list.details': 'etag,items(id,snippet(title,publishedAt,description,tags),contentDetails/duration)',
+    'videos.list.statistics': 'items(id,statistics(viewCount,likeCount,commentCount))',
+    'videos.list.description': 'items/snippet/description',
+    'commentThreads.list': (
+        'nextPageToken,items(id,snippet(totalReplyCount,'
+        'topLevelComment/snippet(authorDisplayName,textDisplay,likeCount,publishedAt,updatedAt)))'
+    )
+}
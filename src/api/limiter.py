@@ -0,0 +1,252 @@
+import json
+import time
+import random
+import logging
+import threading
+from collections import deque
+from typing import Dict, List, Any, Callable, Iterable, Optional
+
+# HTTP statuses worth retrying; 403 only with a rate-limit reason
+_RETRY_STATUSES = {429, 500, 502, 503, 504}
+_RATE_LIMIT_REASONS = ('rateLimitExceeded', 'userRateLimitExceeded')
+
+
+def _status(error: Exception) -> Optional[int]:
+    """HTTP status of a googleapiclient HttpError (without importing it)."""
+    status = getattr(getattr(error, 'resp', None), 'status', None)
+    try:
+        return int(status) if status is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+def _reason(error: Exception) -> str:
+    content = getattr(error, 'content', b'') or b''
+    if isinstance(content, bytes):
+        content = content.decode('utf-8', 'replace')
+    try:
+        errors = json.loads(content).get('error', {}).get('errors', [])
+        return ','.join(str(e.get('reason', '')) for e in errors)
+    except (ValueError, AttributeError):
+        return content
+
+
+def _retry_after(error: Exception) -> Optional[float]:
+    resp = getattr(error, 'resp', None)
+    value = resp.get('retry-after') if hasattr(resp, 'get') else None
+    try:
+        return float(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+class EndpointLimit:
+    """AIMD concurrency window and latency record of one API endpoint."""
+
+    def __init__(self, initial: float, minimum: int, maximum: int, window: int):
+        self.limit = float(initial)
+        self.minimum = minimum
+        self.maximum = maximum
+        self.in_flight = 0
+        self.latencies: deque = deque(maxlen=window)
+        self.baseline_p95: Optional[float] = None
+        self.since_decrease = 0
+        self.stats = {'requests': 0, 'retries': 0, 'throttled': 0, 'errors': 0, 'peak_limit': int(initial)}
+        self._cond = threading.Condition()
+
+    def acquire(self) -> None:
+        with self._cond:
+            while self.in_flight >= int(self.limit):
+                self._cond.wait()
+            self.in_flight += 1
+            self.stats['requests'] += 1
+
+    def release(self) -> bool:
+        """Free a slot; returns whether the window was fully used."""
+        with self._cond:
+            saturated = self.in_flight >= int(self.limit)
+            self.in_flight -= 1
+            self._cond.notify_all()
+            return saturated
+
+    def succeeded(self, latency: float, saturated: bool, tolerance: float) -> None:
+        with self._cond:
+            self.latencies.append(latency)
+            self.since_decrease += 1
+            p95 = self._p95() if len(self.latencies) == self.latencies.maxlen else None
+
+            if p95 is not None:
+                self.baseline_p95 = p95 if self.baseline_p95 is None else min(self.baseline_p95, p95)
+                if p95 > self.baseline_p95 * tolerance and self.since_decrease >= len(self.latencies):
+                    # Latency climbing: back off once per window
+                    self._decrease()
+                    return
+
+            if saturated and self.limit < self.maximum:
+                # Additive increase: about one slot per window of completions
+                self.limit = min(self.maximum, self.limit + 1 / self.limit)
+                self.stats['peak_limit'] = max(self.stats['peak_limit'], int(self.limit))
+                self._cond.notify_all()
+
+    def count(self, key: str) -> None:
+        with self._cond:
+            self.stats[key] += 1
+
+    def throttled(self) -> None:
+        with self._cond:
+            self.stats['throttled'] += 1
+            self._decrease()
+
+    def summary(self) -> Dict[str, Any]:
+        with self._cond:
+            latencies = sorted(self.latencies)
+            return dict(
+                self.stats,
+                limit=int(self.limit),
+                p50_ms=round(latencies[len(latencies) // 2] * 1000, 1) if latencies else None,
+                p95_ms=round(self._p95() * 1000, 1) if latencies else None
+            )
+
+    def _decrease(self) -> None:
+        self.limit = max(self.minimum, self.limit / 2)
+        self.since_decrease = 0
+
+    def _p95(self) -> float:
+        latencies = sorted(self.latencies)
+        return latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))]
+
+
+class AdaptiveLimiter:
+    """
+    AIMD concurrency limiter around API request execution.
+
+    Each endpoint (e.g. 'commentThreads.list') gets its own window of
+    concurrent calls. The window grows additively while it is in full use
+    and p95 latency stays within tolerance of the best p95 seen, and halves
+    on 429/5xx/rate-limit errors or a latency climb. Throttled and transient
+    failures are retried with full-jitter exponential backoff.
+    """
+
+    def __init__(self, initial_limit: int = 4, min_limit: int = 1, max_limit: int = 16,
+                 max_retries: int = 5, backoff_base: float = 1.0, backoff_cap: float = 32.0,
+                 latency_tolerance: float = 2.0, window: int = 50):
+        self.initial_limit = min(initial_limit, max_limit)
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self.latency_tolerance = latency_tolerance
+        self.window = window
+        self.endpoints: Dict[str, EndpointLimit] = {}
+        self._lock = threading.Lock()
+
+    def wrap(self, client: Any, no_retry: Iterable[str] = ()) -> 'LimitedClient':
+        """
+        Proxy a discovery client so every request's execute() goes through the limiter.
+
+        Endpoints in no_retry (non-idempotent writes such as
+        'documents.batchUpdate') are limited but never retried: a 5xx may
+        come back after the write was applied.
+        """
+        return LimitedClient(client, self, no_retry=frozenset(no_retry))
+
+    def call(self, endpoint: str, execute: Callable, *args, retry: bool = True, **kwargs) -> Any:
+        """Run one request under the endpoint's window, retrying throttled calls unless retry is off."""
+        state = self._endpoint(endpoint)
+        attempt = 0
+
+        while True:
+            state.acquire()
+            start = time.perf_counter()
+            try:
+                result = execute(*args, **kwargs)
+            except Exception as e:
+                state.release()
+                if _status(e) == 304:
+                    # Not Modified answers a conditional request; it is not a failure
+                    raise
+                throttled, retryable = self._classify(e)
+                if throttled:
+                    state.throttled()
+                if not retry or not retryable or attempt >= self.max_retries:
+                    state.count('errors')
+                    raise
+                delay = _retry_after(e) or random.uniform(0, min(self.backoff_cap, self.backoff_base * 2 ** attempt))
+                attempt += 1
+                state.count('retries')
+                logging.debug(f"{endpoint}: retry {attempt} in {delay:.2f}s after {e}")
+                time.sleep(delay)
+                continue
+
+            saturated = state.release()
+            state.succeeded(time.perf_counter() - start, saturated, self.latency_tolerance)
+            return result
+
+    def summary(self) -> Dict[str, Dict[str, Any]]:
+        """Per-endpoint limits, retries and latency for the run metrics."""
+        return {endpoint: state.summary() for endpoint, state in sorted(self.endpoints.items())}
+
+    def describe(self) -> List[str]:
+        lines = []
+        for endpoint, stats in self.summary().items():
+            lines.append(
+                f"{endpoint}: limit {stats['limit']} (peak {stats['peak_limit']}), "
+                f"{stats['requests']} requests, {stats['retries']} retries, "
+                f"{stats['throttled']} throttled, {stats['errors']} errors, "
+                f"p50 {stats['p50_ms']} ms, p95 {stats['p95_ms']} ms"
+            )
+        return lines
+
+    def _endpoint(self, endpoint: str) -> EndpointLimit:
+        state = self.endpoints.get(endpoint)
+        if state is None:
+            with self._lock:
+                state = self.endpoints.setdefault(endpoint, EndpointLimit(
+                    self.initial_limit, self.min_limit, self.max_limit, self.window
+                ))
+        return state
+
+    @staticmethod
+    def is_transient(error: Exception) -> bool:
+        """Whether a failed call is worth repeating (throttled, 5xx or a dropped connection)."""
+        return AdaptiveLimiter._classify(error)[1]
+
+    @staticmethod
+    def _classify(error: Exception):
+        """(throttled, retryable) for a failed call."""
+        status = _status(error)
+        if status is None:
+            # Dropped connections and timeouts: retry, but they say nothing about load
+            return False, isinstance(error, (ConnectionError, TimeoutError))
+        if status == 403:
+            throttled = any(reason in _reason(error) for reason in _RATE_LIMIT_REASONS)
+            return throttled, throttled
+        if status in _RETRY_STATUSES:
+            return True, True
+        return False, False
+
+
+class LimitedClient:
+    """Proxy over a discovery client, resource or request that tracks the endpoint path."""
+
+    def __init__(self, target: Any, limiter: AdaptiveLimiter, path: str = '', no_retry: frozenset = frozenset()):
+        self._target = target
+        self._limiter = limiter
+        self._path = path
+        self._no_retry = no_retry
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._target, name)
+        if not callable(attr):
+            return attr
+        if name == 'execute':
+            retry = self._path not in self._no_retry
+            return lambda *args, **kwargs: self._limiter.call(self._path, attr, *args, retry=retry, **kwargs)
+
+        path = f"{self._path}.{name}" if self._path else name
+
+        def method(*args, **kwargs):
+            result = attr(*args, **kwargs)
+            return None if result is None else LimitedClient(result, self._limiter, path, self._no_retry)
+        return method
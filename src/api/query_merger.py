@@ -0,0 +1,129 @@
+from collections import OrderedDict
+from typing import Dict, List, Any, Tuple
+
+# Parameters that can be re-derived locally from a merged response
+_LOCAL_PARAMS = ('metrics', 'sort', 'maxResults')
+
+
+class QueryMerger:
+    """
+    YouTube Analytics client wrapper that merges compatible report queries.
+
+    Queries sharing ids, date window, dimensions and filters are answered from
+    a single API query over the union of their metrics. Each caller gets its
+    own view of the merged response: requested columns only, in requested
+    order, re-sorted and truncated locally. Metric unions are learned per
+    query shape (the filter value's id is ignored), so repeated per-video
+    queries collapse into one call per video after the first.
+    """
+
+    def __init__(self, client, cache_size: int = 256):
+        self.client = client
+        self.cache_size = cache_size
+        self._shape_metrics: Dict[Tuple, List[str]] = {}
+        self._cache: 'OrderedDict[Tuple, Tuple[List[str], Dict]]' = OrderedDict()
+        self.stats = {'requested': 0, 'issued': 0, 'merged': 0}
+
+    def reports(self) -> '_Reports':
+        return _Reports(self)
+
+    def execute(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Answer a query, from a merged response when possible."""
+        self.stats['requested'] += 1
+        key = self._key(params)
+        wanted = _split(params['metrics'])
+
+        cached = self._cache.get(key)
+        if cached and set(wanted) <= set(cached[0]):
+            self._cache.move_to_end(key)
+            self.stats['merged'] += 1
+            return _project(cached[1], params)
+
+        shape = self._shape(params)
+        metrics = self._union(self._shape_metrics.get(shape, []), wanted)
+        if cached:
+            metrics = self._union(metrics, cached[0])
+        self._shape_metrics[shape] = metrics
+
+        query = {k: v for k, v in params.items() if k not in _LOCAL_PARAMS}
+        query['metrics'] = ','.join(metrics)
+        server_side = metrics == wanted
+        if server_side:
+            # Nothing to merge yet: keep server-side sort and limits
+            query.update({k: params[k] for k in ('sort', 'maxResults') if k in params})
+
+        response = self.client.reports().query(**query).execute()
+        self.stats['issued'] += 1
+
+        if server_side and 'maxResults' in params:
+            # A truncated response can't serve other views
+            return response
+
+        self._cache[key] = (metrics, response)
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return _project(response, params)
+
+    @staticmethod
+    def _key(params: Dict[str, Any]) -> Tuple:
+        return tuple(sorted(
+            (k, str(v)) for k, v in params.items() if k not in _LOCAL_PARAMS
+        ))
+
+    @classmethod
+    def _shape(cls, params: Dict[str, Any]) -> Tuple:
+        shaped = dict(params)
+        filters = shaped.get('filters') or ''
+        shaped['filters'] = ';'.join(part.split('==')[0] for part in filters.split(';') if part)
+        return cls._key(shaped)
+
+    @staticmethod
+    def _union(first: List[str], second: List[str]) -> List[str]:
+        return first + [metric for metric in second if metric not in first]
+
+
+class _Reports:
+    def __init__(self, merger: QueryMerger):
+        self.merger = merger
+
+    def query(self, **params) -> '_MergedQuery':
+        return _MergedQuery(self.merger, params)
+
+
+class _MergedQuery:
+    def __init__(self, merger: QueryMerger, params: Dict[str, Any]):
+        self.merger = merger
+        self.params = params
+
+    def execute(self) -> Dict[str, Any]:
+        return self.merger.execute(self.params)
+
+
+def _split(metrics: str) -> List[str]:
+    return [metric.strip() for metric in metrics.split(',') if metric.strip()]
+
+
+def _project(response: Dict[str, Any], params: Dict[str, Any]) -> Dict[str, Any]:
+    """Derive one caller's view of a merged response."""
+    headers = response.get('columnHeaders', [])
+    positions = {header['name']: i for i, header in enumerate(headers)}
+    dimensions = [h['name'] for h in headers if h.get('columnType') == 'DIMENSION']
+    columns = [positions[name] for name in dimensions + _split(params['metrics'])]
+
+    projected = {k: v for k, v in response.items() if k not in ('columnHeaders', 'rows')}
+    projected['columnHeaders'] = [headers[i] for i in columns]
+
+    if 'rows' not in response:
+        return projected
+
+    rows = list(response['rows'])
+    for field in reversed(_split(params.get('sort', ''))):
+        descending = field.startswith('-')
+        position = positions[field.lstrip('-')]
+        rows.sort(key=lambda row: row[position], reverse=descending)
+
+    if params.get('maxResults'):
+        rows = rows[:int(params['maxResults'])]
+
+    projected['rows'] = [[row[i] for i in columns] for row in rows]
+    return projected
@@ -0,0 +1,134 @@
+from array import array
+from datetime import date, timedelta
+from typing import Dict, List, Any, Iterator, Optional, Sequence, Union
+
+_EPOCH = date(1970, 1, 1)
+
+# Dimensions whose values are calendar days; stored as days since the epoch
+DATE_COLUMNS = ('day',)
+
+
+def to_epoch_day(value: str) -> int:
+    """'YYYY-MM-DD' -> days since 1970-01-01."""
+    return (date(int(value[:4]), int(value[5:7]), int(value[8:10])) - _EPOCH).days
+
+
+def from_epoch_day(value: int) -> str:
+    """Days since 1970-01-01 -> 'YYYY-MM-DD'."""
+    return (_EPOCH + timedelta(days=int(value))).isoformat()
+
+
+class ReportTable:
+    """
+    Columnar, typed view of an Analytics API result.
+
+    Columns are located through the response's columnHeaders rather than by
+    position and decoded once: INTEGER columns into array('q'), FLOAT into
+    array('d'), day dimensions into epoch-day array('l') and everything else
+    into plain lists. Iterating yields row dicts on demand (for rendering),
+    with dates back in ISO form.
+    """
+
+    def __init__(self, columns: Optional[Dict[str, Sequence]] = None,
+                 date_columns: Sequence[str] = ()):
+        self.columns: Dict[str, Sequence] = columns or {}
+        self.date_columns = tuple(date_columns)
+
+    @classmethod
+    def from_response(cls, response: Dict[str, Any], rename: Optional[Dict[str, str]] = None,
+                      convert: Optional[Dict[str, Any]] = None) -> 'ReportTable':
+        """Decode response rows into typed columns using columnHeaders."""
+        rename = rename or {}
+        convert = convert or {}
+        headers = response.get('columnHeaders', [])
+        rows = response.get('rows', [])
+
+        columns: Dict[str, Sequence] = {}
+        date_columns = []
+        for position, header in enumerate(headers):
+            source = header['name']
+            name = rename.get(source, source)
+            values = (row[position] for row in rows)
+
+            if source in convert:
+                columns[name] = [convert[source](value) for value in values]
+            elif source in DATE_COLUMNS:
+                columns[name] = array('l', (to_epoch_day(value) for value in values))
+                date_columns.append(name)
+            elif header.get('dataType') == 'INTEGER':
+                columns[name] = array('q', (int(value) for value in values))
+            elif header.get('dataType') in ('FLOAT', 'CURRENCY'):
+                columns[name] = array('d', (float(value) for value in values))
+            else:
+                columns[name] = list(values)
+
+        return cls(columns, date_columns)
+
+    def __repr__(self) -> str:
+        return f"ReportTable({', '.join(self.columns)}; {len(self)} rows)"
+
+    def __len__(self) -> int:
+        for values in self.columns.values():
+            return len(values)
+        return 0
+
+    def __bool__(self) -> bool:
+        return len(self) > 0
+
+    def __getitem__(self, key: Union[str, slice]) -> Union[Sequence, 'ReportTable']:
+        if isinstance(key, slice):
+            return ReportTable(
+                {name: values[key] for name, values in self.columns.items()}, self.date_columns
+            )
+        return self.columns[key]
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        return self.records()
+
+    def __eq__(self, other: Any) -> bool:
+        return (
+            isinstance(other, ReportTable)
+            and self.date_columns == other.date_columns
+            and {k: list(v) for k, v in self.columns.items()} == {k: list(v) for k, v in other.columns.items()}
+        )
+
+    def column(self, name: str, default: Optional[Sequence] = None) -> Sequence:
+        """A column's values (the default, or empty, when absent)."""
+        if name in self.columns:
+            return self.columns[name]
+        return default if default is not None else []
+
+    def names(self) -> List[str]:
+        return list(self.columns)
+
+    def row(self, index: int = 0) -> Dict[str, Any]:
+        """One row as a dict, dates formatted as 'YYYY-MM-DD'."""
+        return {
+            name: from_epoch_day(values[index]) if name in self.date_columns else values[index]
+            for name, values in self.columns.items()
+        }
+
+    def records(self, limit: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """Row dicts built lazily, for rendering."""
+        count = len(self) if limit is None else min(limit, len(self))
+        for index in range(count):
+            yield self.row(index)
+
+    def to_json(self) -> Dict[str, Any]:
+        return {
+            'columns': {name: list(values) for name, values in self.columns.items()},
+            'types': {name: values.typecode for name, values in self.columns.items() if isinstance(values, array)},
+            'date_columns': list(self.date_columns)
+        }
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> 'ReportTable':
+        types = data.get('types', {})
+        return cls(
+            {
+                name: array(types[name], values) if name in types else values
+                for name, values in data['columns'].items()
+            },
+            data.get('date_columns', ())
+        )
+
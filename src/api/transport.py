@@ -0,0 +1,158 @@
+import re
+import time
+import threading
+from urllib.parse import urlsplit
+from typing import Dict, List, Any, Tuple
+
+_VERSION = re.compile(r"v\d+(?:beta\d*)?")
+
+
+def endpoint_name(uri: str) -> str:
+    """'https://youtube.googleapis.com/youtube/v3/videos?...' -> 'youtube.videos'."""
+    parts = urlsplit(uri)
+    segments = [segment for segment in parts.path.split('/') if segment]
+    resource = segments[-1] if segments else ''
+    for position, segment in enumerate(segments[:-1]):
+        if _VERSION.fullmatch(segment):
+            resource = segments[position + 1]
+            break
+    api = (parts.hostname or '').split('.')[0]
+    return f"{api}.{resource.split(':')[0]}"
+
+
+class TransportMeter:
+    """
+    Per-endpoint response size, compression, latency and connection reuse at the HTTP layer.
+
+    Transports from a TransportPool report every response: decoded body
+    bytes, whether it arrived gzip-encoded (the discovery client asks for
+    gzip on every request), the round-trip time and whether it went over a
+    kept-alive connection or had to open a new one.
+    """
+
+    def __init__(self):
+        self.endpoints: Dict[str, Dict[str, Any]] = {}
+        self.transports = 0
+        self._lock = threading.Lock()
+
+    def transport_opened(self) -> None:
+        with self._lock:
+            self.transports += 1
+
+    def record(self, endpoint: str, size: int, compressed: bool, elapsed: float, reused: bool = False) -> None:
+        with self._lock:
+            stats = self.endpoints.setdefault(
+                endpoint, {'responses': 0, 'bytes': 0, 'compressed': 0, 'seconds': 0.0, 'reused': 0}
+            )
+            stats['responses'] += 1
+            stats['bytes'] += size
+            stats['compressed'] += int(compressed)
+            stats['seconds'] += elapsed
+            stats['reused'] += int(reused)
+
+    def describe(self) -> List[str]:
+        lines = []
+        with self._lock:
+            if self.endpoints:
+                responses = sum(stats['responses'] for stats in self.endpoints.values())
+                reused = sum(stats['reused'] for stats in self.endpoints.values())
+                lines.append(
+                    f"{self.transports} pooled transports, {responses - reused} connections opened, "
+                    f"{reused}/{responses} responses on reused connections"
+                )
+            for endpoint, stats in sorted(self.endpoints.items()):
+                responses = stats['responses']
+                lines.append(
+                    f"{endpoint}: {responses} responses, {stats['bytes'] / 1024:.1f} KiB "
+                    f"({stats['bytes'] // responses} B avg), {stats['compressed']} gzip, "
+                    f"{stats['seconds'] / responses * 1000:.0f} ms avg, "
+                    f"{stats['reused']} on reused connections"
+                )
+        return lines
+
+
+class MeteredHttp:
+    """httplib2-compatible wrapper recording each response with a TransportMeter."""
+
+    def __init__(self, http, meter: TransportMeter):
+        self.http = http
+        self.meter = meter
+
+    def request(self, uri, method='GET', body=None, headers=None, **kwargs):
+        before = self._sockets()
+        start = time.perf_counter()
+        response, content = self.http.request(uri, method, body=body, headers=headers, **kwargs)
+        elapsed = time.perf_counter() - start
+        # httplib2 decodes gzip bodies and keeps the original encoding under this key
+        compressed = '-content-encoding' in response
+        # A socket that was not open before the call means a new connection (and TLS handshake)
+        reused = bool(before) and not (self._sockets() - before)
+        self.meter.record(endpoint_name(uri), len(content or b''), compressed, elapsed, reused)
+        return response, content
+
+    def _sockets(self) -> set:
+        """Open sockets of the underlying httplib2.Http, one per host it has talked to."""
+        http = getattr(self.http, 'http', self.http)
+        connections = getattr(http, 'connections', {})
+        return {conn.sock for conn in list(connections.values()) if getattr(conn, 'sock', None) is not None}
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.http, name)
+
+
+class TransportPool:
+    """
+    Authorized keep-alive HTTP transports shared by every API client.
+
+    Each thread gets one authorized httplib2 transport, used for the Data,
+    Analytics and Docs APIs alike, so its connection to each host stays
+    open across calls instead of being set up per client. Clients are
+    built once per API over a dispatching transport that forwards every
+    request to the calling thread's own one; httplib2 transports are not
+    thread-safe, but these clients can be shared by any number of threads.
+    httplib2 speaks HTTP/1.1, so connections are kept alive rather than
+    multiplexed.
+    """
+
+    def __init__(self, credentials, meter: TransportMeter = None):
+        self.credentials = credentials
+        self.meter = meter
+        self.clients: Dict[Tuple[str, str], Any] = {}
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    def client(self, api: str, version: str):
+        """The shared discovery client of an API, built on first use."""
+        with self._lock:
+            if (api, version) not in self.clients:
+                from googleapiclient.discovery import build
+
+                self.clients[(api, version)] = build(api, version, http=PooledHttp(self))
+            return self.clients[(api, version)]
+
+    def transport(self):
+        """The calling thread's authorized transport."""
+        transport = getattr(self._local, 'transport', None)
+        if transport is None:
+            from google_auth_httplib2 import AuthorizedHttp
+            from googleapiclient.http import build_http
+
+            transport = AuthorizedHttp(self.credentials, http=build_http())
+            if self.meter is not None:
+                transport = MeteredHttp(transport, self.meter)
+                self.meter.transport_opened()
+            self._local.transport = transport
+        return transport
+
+
+class PooledHttp:
+    """httplib2-compatible transport forwarding each call to the calling thread's pooled transport."""
+
+    def __init__(self, pool: TransportPool):
+        self.pool = pool
+
+    def request(self, uri, method='GET', body=None, headers=None, **kwargs):
+        return self.pool.transport().request(uri, method, body=body, headers=headers, **kwargs)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.pool.transport(), name)
@@ -1 +1,5 @@
-from .credentials import SetAuth
\ No newline at end of file
+from src._lazy import lazy_exports
+
+__all__, __getattr__, __dir__ = lazy_exports(__name__, {
+    'SetAuth': '.credentials'
+})
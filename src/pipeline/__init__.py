@@ -0,0 +1,16 @@
+from src._lazy import lazy_exports
+
+__all__, __getattr__, __dir__ = lazy_exports(__name__, {
+    'FetchPlanner': '.planner',
+    'FetchPlan': '.planner',
+    'BackfillEngine': '.backfill',
+    'BackfillStore': '.backfill',
+    'RunJournal': '.journal',
+    'VideoEnricher': '.enrichment',
+    'Coordinator': '.distributed',
+    'Worker': '.distributed',
+    'QueueStalledError': '.distributed',
+    'TaskQueue': '.work_queue',
+    'SQLiteTaskQueue': '.work_queue',
+    'open_queue': '.work_queue'
+})
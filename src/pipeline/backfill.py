@@ -0,0 +1,176 @@
+import json
+import logging
+import sqlite3
+import threading
+from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, List, Any, Callable, Iterator, Optional, Tuple
+
+class BackfillStore:
+    """SQLite store of backfilled report rows, tracked per date chunk."""
+
+    def __init__(self, path: str):
+        self.conn = sqlite3.connect(path)
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS chunks (
+                query_key TEXT NOT NULL,
+                start_date TEXT NOT NULL,
+                end_date TEXT NOT NULL,
+                row_count INTEGER NOT NULL,
+                headers TEXT NOT NULL,
+                PRIMARY KEY (query_key, start_date)
+            );
+            CREATE TABLE IF NOT EXISTS rows (
+                query_key TEXT NOT NULL,
+                start_date TEXT NOT NULL,
+                seq INTEGER NOT NULL,
+                row TEXT NOT NULL,
+                PRIMARY KEY (query_key, start_date, seq)
+            );
+        """)
+
+    def completed_chunks(self, query_key: str) -> set:
+        """(start, end) date pairs of chunks already stored for a query."""
+        cursor = self.conn.execute(
+            "SELECT start_date, end_date FROM chunks WHERE query_key = ?", (query_key,)
+        )
+        return {(row[0], row[1]) for row in cursor}
+
+    def save_chunk(self, query_key: str, start_date: str, end_date: str,
+                   headers: List[Dict], rows: List[List]) -> None:
+        """Store a chunk's rows and mark it complete in one transaction."""
+        with self.conn:
+            self.conn.execute(
+                "DELETE FROM rows WHERE query_key = ? AND start_date = ?", (query_key, start_date)
+            )
+            self.conn.executemany(
+                "INSERT INTO rows (query_key, start_date, seq, row) VALUES (?, ?, ?, ?)",
+                [(query_key, start_date, seq, json.dumps(row)) for seq, row in enumerate(rows)]
+            )
+            self.conn.execute(
+                "INSERT OR REPLACE INTO chunks VALUES (?, ?, ?, ?, ?)",
+                (query_key, start_date, end_date, len(rows), json.dumps(headers))
+            )
+
+    def headers(self, query_key: str) -> List[Dict]:
+        row = self.conn.execute(
+            "SELECT headers FROM chunks WHERE query_key = ? LIMIT 1", (query_key,)
+        ).fetchone()
+        return json.loads(row[0]) if row else []
+
+    def iter_rows(self, query_key: str) -> Iterator[List]:
+        """Stream stitched rows in chunk and page order."""
+        cursor = self.conn.execute(
+            "SELECT row FROM rows WHERE query_key = ? ORDER BY start_date, seq", (query_key,)
+        )
+        for (row,) in cursor:
+            yield json.loads(row)
+
+    def close(self) -> None:
+        self.conn.close()
+
+
+class BackfillEngine:
+    """
+    Chunked, paginated, resumable history backfill for Analytics reports.
+
+    The date range is split into fixed-size chunks that are fetched in
+    parallel. Each chunk is paged with startIndex until exhausted, and rows
+    are written to the store from the calling thread as chunks complete,
+    so an interrupted run resumes from the first missing chunk.
+    """
+
+    def __init__(self, client_factory: Callable[[], Any], store: BackfillStore,
+                 chunk_days: int = 90, page_size: int = 200, workers: int = 4):
+        self.client_factory = client_factory
+        self.store = store
+        self.chunk_days = chunk_days
+        self.page_size = page_size
+        self.workers = workers
+        self._local = threading.local()
+
+    def run(self, start_date: str, end_date: str, metrics: str, dimensions: str = 'day',
+            filters: str = '', sort: Optional[str] = None,
+            progress: Optional[Callable[[int, int], None]] = None) -> str:
+        """Backfill a query over a date range; returns the store key."""
+        query = {
+            'ids': 'channel==MINE',
+            'metrics': metrics,
+            'dimensions': dimensions,
+            'filters': filters,
+            'sort': sort or dimensions.split(',')[0]
+        }
+        query_key = json.dumps(query, sort_keys=True)
+
+        chunks = self.split_range(start_date, end_date, self.chunk_days)
+        done = self.store.completed_chunks(query_key)
+        pending = [chunk for chunk in chunks if chunk not in done]
+        completed = len(chunks) - len(pending)
+        logging.info(f"Backfill: {len(chunks)} chunks, {completed} already stored")
+
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            futures = {
+                pool.submit(self._fetch_chunk, query, chunk_start, chunk_end): (chunk_start, chunk_end)
+                for chunk_start, chunk_end in pending
+            }
+            failed = []
+            for future in as_completed(futures):
+                chunk_start, chunk_end = futures[future]
+                try:
+                    headers, rows = future.result()
+                except Exception as e:
+                    # Keep storing the other chunks; a rerun resumes the failed ones
+                    logging.error(f"Backfill chunk {chunk_start}..{chunk_end} failed: {e}")
+                    failed.append(chunk_start)
+                    continue
+                self.store.save_chunk(query_key, chunk_start, chunk_end, headers, rows)
+                completed += 1
+                logging.info(
+                    f"Backfill: {completed}/{len(chunks)} chunks "
+                    f"({completed * 100 // len(chunks)}%), {chunk_start}..{chunk_end}: {len(rows)} rows"
+                )
+                if progress:
+                    progress(completed, len(chunks))
+
+        if failed:
+            raise Exception(f"Backfill incomplete: {len(failed)} chunks failed, rerun to resume")
+        return query_key
+
+    def _client(self):
+        """Per-thread API client; httplib2 transports are not thread-safe."""
+        if not hasattr(self._local, 'client'):
+            self._local.client = self.client_factory()
+        return self._local.client
+
+    def _fetch_chunk(self, query: Dict[str, Any], start_date: str, end_date: str) -> Tuple[List[Dict], List[List]]:
+        """Page through one chunk until the result set is exhausted."""
+        rows: List[List] = []
+        headers: List[Dict] = []
+        start_index = 1
+
+        while True:
+            params = dict(query, startDate=start_date, endDate=end_date,
+                          startIndex=start_index, maxResults=self.page_size)
+            if not params['filters']:
+                del params['filters']
+            response = self._client().reports().query(**params).execute()
+
+            headers = response.get('columnHeaders', headers)
+            page = response.get('rows', [])
+            rows.extend(page)
+
+            if len(page) < self.page_size:
+                return headers, rows
+            start_index += len(page)
+
+    @staticmethod
+    def split_range(start_date: str, end_date: str, chunk_days: int) -> List[Tuple[str, str]]:
+        """Split an inclusive date range into consecutive chunks."""
+        start = datetime.strptime(start_date, '%Y-%m-%d')
+        end = datetime.strptime(end_date, '%Y-%m-%d')
+        chunks = []
+        while start <= end:
+            chunk_end = min(start + timedelta(days=chunk_days - 1), end)
+            chunks.append((start.strftime('%Y-%m-%d'), chunk_end.strftime('%Y-%m-%d')))
+            start = chunk_end + timedelta(days=1)
+        return chunks
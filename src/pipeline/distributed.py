@@ -0,0 +1,147 @@
+import time
+import logging
+from typing import Dict, List, Any, Callable, Iterable, Iterator, Optional, Tuple
+from .work_queue import TaskQueue, worker_name
+
+
+class QueueStalledError(Exception):
+    """No enrichment task made progress for the coordinator's stall timeout, e.g. no worker is running."""
+
+
+class Coordinator:
+    """
+    Farms per-video enrichment of one run out to queue workers.
+
+    Listed videos are submitted in batches as the listing streams in, so
+    workers start while later pages are still being fetched. Enriched videos
+    are read back in listing position order; a task that exhausted its
+    retries fails the run. A resumed run keeps the results already in the
+    queue and resubmits only what is missing or failed. When the run's task
+    counts stay unchanged for stall_timeout seconds (no worker leased,
+    completed or failed anything) it fails with QueueStalledError instead
+    of polling forever; None waits indefinitely.
+    """
+
+    def __init__(self, queue: TaskQueue, run_key: str, calls: Iterable[str], horizons: Iterable[int],
+                 resume: bool = False, batch_size: int = 50, poll_interval: float = 1.0,
+                 stall_timeout: Optional[float] = 600):
+        self.queue = queue
+        self.run_key = run_key
+        self.options = {'calls': list(calls), 'horizons': list(horizons)}
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.stall_timeout = stall_timeout
+        if not resume:
+            self.queue.clear(run_key)
+
+    def run(self, videos: Iterable[Tuple[int, Dict[str, Any]]]) -> Iterator[Tuple[int, Dict[str, Any]]]:
+        """Submit (position, video) pairs and yield (position, enriched video) in position order."""
+        next_position, end = None, None
+        batch: List[Tuple[int, Dict[str, Any]]] = []
+
+        for position, video in videos:
+            if next_position is None:
+                next_position = position
+            batch.append((position, dict(self.options, video=video)))
+            end = position + 1
+            if len(batch) >= self.batch_size:
+                self.queue.submit(self.run_key, batch)
+                batch = []
+                for ready, enriched in self.queue.results(self.run_key, next_position):
+                    yield ready, enriched
+                    next_position = ready + 1
+        if batch:
+            self.queue.submit(self.run_key, batch)
+
+        last_counts, changed_at = None, time.monotonic()
+        while next_position is not None and next_position < end:
+            waiting = next_position
+            for ready, enriched in self.queue.results(self.run_key, next_position):
+                yield ready, enriched
+                next_position = ready + 1
+            if next_position == waiting:
+                self._check_failures()
+                counts = self.queue.counts(self.run_key)
+                if counts != last_counts:
+                    last_counts, changed_at = counts, time.monotonic()
+                elif self.stall_timeout is not None and time.monotonic() - changed_at >= self.stall_timeout:
+                    raise QueueStalledError(
+                        f"No enrichment progress for {self.stall_timeout:.0f}s ({counts}); "
+                        f"is a worker running on this queue?"
+                    )
+                time.sleep(self.poll_interval)
+
+        logging.info(f"Distributed enrichment: {self.queue.counts(self.run_key)}")
+        self.queue.clear(self.run_key)
+
+    def close(self) -> None:
+        self.queue.close()
+
+    def _check_failures(self) -> None:
+        failures = self.queue.failures(self.run_key)
+        if failures:
+            position, error = min(failures.items())
+            raise Exception(f"{len(failures)} enrichment tasks failed; video #{position}: {error}")
+
+
+class Worker:
+    """
+    Leases enrichment tasks from a queue and writes the enriched videos back.
+
+    enricher_factory(calls, horizons) builds a VideoEnricher on this
+    worker's own API clients; one is kept per distinct task shape. With
+    idle_exit the worker stops after that many seconds without work,
+    otherwise it polls until interrupted.
+    """
+
+    def __init__(self, queue: TaskQueue, enricher_factory: Callable[[List[str], List[int]], Any],
+                 worker_id: Optional[str] = None, lease_seconds: float = 300,
+                 poll_interval: float = 2.0, idle_exit: Optional[float] = None):
+        self.queue = queue
+        self.enricher_factory = enricher_factory
+        self.worker_id = worker_id or worker_name()
+        self.lease_seconds = lease_seconds
+        self.poll_interval = poll_interval
+        self.idle_exit = idle_exit
+        self.enrichers: Dict[Tuple, Any] = {}
+        self.stats = {'completed': 0, 'duplicates': 0, 'failed': 0}
+
+    def run(self, run_key: Optional[str] = None) -> Dict[str, int]:
+        """Process tasks until idle for idle_exit seconds; returns the worker's counts."""
+        idle_since = time.monotonic()
+        while True:
+            task = self.queue.lease(self.worker_id, self.lease_seconds, run_key)
+            if task is None:
+                if self.idle_exit is not None and time.monotonic() - idle_since >= self.idle_exit:
+                    break
+                time.sleep(self.poll_interval)
+                continue
+
+            self.process(task)
+            idle_since = time.monotonic()
+
+        logging.info(f"Worker {self.worker_id}: {self.stats}")
+        return self.stats
+
+    def process(self, task: Dict[str, Any]) -> None:
+        payload = task['payload']
+        video = payload['video']
+        try:
+            enriched = self._enricher(payload['calls'], payload['horizons']).enrich(video)
+        except Exception as e:
+            logging.warning(f"Enrichment of {video.get('id')} failed (attempt {task['attempt']}): {e}")
+            self.stats['failed'] += 1
+            self.queue.fail(task, str(e))
+            return
+
+        if self.queue.complete(task, enriched):
+            self.stats['completed'] += 1
+        else:
+            # Another worker finished it after this lease expired; its result stands
+            self.stats['duplicates'] += 1
+
+    def _enricher(self, calls: List[str], horizons: List[int]):
+        key = (tuple(calls), tuple(horizons))
+        if key not in self.enrichers:
+            self.enrichers[key] = self.enricher_factory(calls, horizons)
+        return self.enrichers[key]
@@ -0,0 +1,58 @@
+from typing import Dict, Any, Iterable, Sequence
+from src.analytics.comparison import HORIZONS, fetch_span
+
+# Video dict key -> planned call filling it
+PER_VIDEO_CALLS = {
+    'geography': 'video.geography',
+    'retention': 'video.retention',
+    'engagement': 'video.engagement',
+    'real_time': 'video.real_time',
+    'demographics': 'video.demographics',
+    'comparison': 'video.comparison',
+    'history': 'video.history'
+}
+
+# Planned calls a listed video needs; the rest are channel-level or listing calls
+VIDEO_CALLS = ('video.performance', 'video.impressions') + tuple(PER_VIDEO_CALLS.values())
+
+
+class VideoEnricher:
+    """
+    The planned per-video Analytics calls for a listed video.
+
+    Used in-process by gather and by queue workers, which rebuild it from
+    the calls and horizons carried in each task.
+    """
+
+    def __init__(self, youtube, youtube_analytics, calls: Iterable[str], horizons: Sequence[int] = HORIZONS):
+        from src.analytics import VideoAnalytics, GeographyAnalytics, EngagementAnalytics, DemographicsAnalytics
+
+        calls = set(calls)
+        self.calls = [call for call in VIDEO_CALLS if call in calls]
+        self.horizons = list(horizons)
+        self.video = VideoAnalytics(youtube, youtube_analytics)
+        geography = GeographyAnalytics(youtube_analytics)
+        engagement = EngagementAnalytics(youtube_analytics)
+        demographics = DemographicsAnalytics(youtube_analytics)
+
+        fetches = {
+            'geography': geography.get_watch_time_by_country,
+            'retention': self.video.get_audience_retention,
+            'engagement': engagement.get_video_engagement,
+            'real_time': engagement.get_real_time_metrics,
+            'demographics': demographics.get_video_demographics,
+            'comparison': lambda video_id: self.video.get_period_comparison(video_id, self.horizons),
+            'history': lambda video_id: self.video.get_view_history(video_id, fetch_span(self.horizons))
+        }
+        self.fetches = {key: fetches[key] for key, call in PER_VIDEO_CALLS.items() if call in calls}
+
+    def enrich(self, video_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Attach the planned metrics to a listed video, in place."""
+        video_id = video_data['id']
+        self.video.enrich_video(
+            video_data,
+            with_performance='video.performance' in self.calls,
+            with_impressions='video.impressions' in self.calls
+        )
+        video_data.update({key: fetch(video_id) for key, fetch in self.fetches.items()})
+        return video_data
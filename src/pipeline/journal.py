@@ -0,0 +1,170 @@
+import json
+import logging
+import sqlite3
+from typing import Dict, List, Any, Callable, Iterator, Optional
+from src.utils.snapshot import Snapshot
+
+class RunJournal:
+    """
+    SQLite checkpoint journal of one gather run.
+
+    Channel-level fetch results, listing pages and enriched videos are
+    recorded as they complete, keyed by a run key describing the run
+    (plan, limits and day). A resumed run replays the recorded work and
+    continues from the first incomplete item; a fresh run clears the journal.
+    """
+
+    def __init__(self, path: str, run_key: str, resume: bool = False):
+        self.path = path
+        self.run_key = run_key
+        self.conn = sqlite3.connect(path)
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS steps (
+                run_key TEXT NOT NULL,
+                name TEXT NOT NULL,
+                payload TEXT NOT NULL,
+                PRIMARY KEY (run_key, name)
+            );
+            CREATE TABLE IF NOT EXISTS listed (
+                run_key TEXT NOT NULL,
+                position INTEGER NOT NULL,
+                payload TEXT NOT NULL,
+                PRIMARY KEY (run_key, position)
+            );
+            CREATE TABLE IF NOT EXISTS enriched (
+                run_key TEXT NOT NULL,
+                position INTEGER NOT NULL,
+                payload TEXT NOT NULL,
+                PRIMARY KEY (run_key, position)
+            );
+        """)
+
+        with self.conn:
+            for table in ('steps', 'listed', 'enriched'):
+                if resume:
+                    # Journals of other runs (other plan or day) cannot be resumed
+                    self.conn.execute(f"DELETE FROM {table} WHERE run_key != ?", (run_key,))
+                else:
+                    self.conn.execute(f"DELETE FROM {table}")
+
+        if resume:
+            logging.info(
+                f"Resuming run: {len(self.completed_steps())} steps, "
+                f"{self.listed_count()} listed and {self.enriched_count()} enriched videos journaled"
+            )
+
+    @staticmethod
+    def make_key(**parts: Any) -> str:
+        return json.dumps(parts, sort_keys=True)
+
+    def step(self, name: str, compute: Callable[[], Any]) -> Any:
+        """Return a recorded step result, or compute and record it."""
+        row = self.conn.execute(
+            "SELECT payload FROM steps WHERE run_key = ? AND name = ?", (self.run_key, name)
+        ).fetchone()
+        if row:
+            return Snapshot.loads(row[0])
+        value = compute()
+        self.record_step(name, value)
+        return value
+
+    def record_step(self, name: str, value: Any) -> None:
+        with self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO steps VALUES (?, ?, ?)",
+                (self.run_key, name, Snapshot.dumps(value))
+            )
+
+    def completed_steps(self) -> List[str]:
+        cursor = self.conn.execute("SELECT name FROM steps WHERE run_key = ?", (self.run_key,))
+        return [name for (name,) in cursor]
+
+    def iter_listing(self, fetch_pages: Callable[[int, Optional[str]], Iterator], max_results: int,
+                     start: int = 0) -> Iterator[Dict]:
+        """
+        Listed videos from position start on: journaled pages first, then
+        fresh pages from fetch_pages(remaining, page_token), recorded as they arrive.
+        """
+        state = self._listing_state()
+        yield from self._iter_table('listed', start)
+
+        if state['done']:
+            return
+
+        count = self.listed_count()
+        for videos, next_page_token in fetch_pages(max_results - count, state['next_page_token']):
+            with self.conn:
+                self.conn.executemany(
+                    "INSERT OR REPLACE INTO listed VALUES (?, ?, ?)",
+                    [
+                        (self.run_key, count + offset, Snapshot.dumps(video))
+                        for offset, video in enumerate(videos)
+                    ]
+                )
+                self._save_listing_state(next_page_token, done=False)
+            for offset, video in enumerate(videos):
+                if count + offset >= start:
+                    yield video
+            count += len(videos)
+
+        with self.conn:
+            self._save_listing_state(None, done=True)
+
+    def listed_count(self) -> int:
+        return self.conn.execute(
+            "SELECT COUNT(*) FROM listed WHERE run_key = ?", (self.run_key,)
+        ).fetchone()[0]
+
+    def record_video(self, position: int, video: Dict) -> None:
+        """Record a fully enriched video."""
+        with self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO enriched VALUES (?, ?, ?)",
+                (self.run_key, position, Snapshot.dumps(video))
+            )
+
+    def enriched_count(self) -> int:
+        return self.conn.execute(
+            "SELECT COUNT(*) FROM enriched WHERE run_key = ?", (self.run_key,)
+        ).fetchone()[0]
+
+    def iter_enriched(self) -> Iterator[Dict]:
+        """Enriched videos in listing order."""
+        return self._iter_table('enriched')
+
+    def finish(self) -> None:
+        """The run completed: nothing is left to resume."""
+        with self.conn:
+            for table in ('steps', 'listed', 'enriched'):
+                self.conn.execute(f"DELETE FROM {table}")
+        self.close()
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def _iter_table(self, table: str, start: int = 0, batch: int = 500) -> Iterator[Dict]:
+        """Payloads in position order, fetched in batches so no cursor stays open between yields."""
+        position = start
+        while True:
+            rows = self.conn.execute(
+                f"SELECT position, payload FROM {table} WHERE run_key = ? AND position >= ? "
+                "ORDER BY position LIMIT ?",
+                (self.run_key, position, batch)
+            ).fetchall()
+            for position, payload in rows:
+                yield Snapshot.loads(payload)
+            if len(rows) < batch:
+                return
+            position += 1
+
+    def _save_listing_state(self, next_page_token: Optional[str], done: bool) -> None:
+        self.conn.execute(
+            "INSERT OR REPLACE INTO steps VALUES (?, 'listing', ?)",
+            (self.run_key, json.dumps({'next_page_token': next_page_token, 'done': done}))
+        )
+
+    def _listing_state(self) -> Dict[str, Any]:
+        row = self.conn.execute(
+            "SELECT payload FROM steps WHERE run_key = ? AND name = 'listing'", (self.run_key,)
+        ).fetchone()
+        return json.loads(row[0]) if row else {'next_page_token': None, 'done': False}
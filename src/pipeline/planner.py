@@ -0,0 +1,195 @@
+import math
+from typing import Dict, List, Any, Iterable, Optional
+
+# Concrete API calls with their scope and quota cost.
+# Data API costs are quota units; Analytics API calls are counted as queries.
+# 'merges' names a call whose query QueryMerger answers this one from when both are planned.
+API_CALLS: Dict[str, Dict[str, Any]] = {
+    'channel.basic_stats': {'api': 'data', 'scope': 'channel', 'cost': 1,
+                            'endpoint': 'channels.list'},
+    'channel.period_analytics': {'api': 'analytics', 'scope': 'channel', 'cost': 1,
+                                 'endpoint': 'reports.query'},
+    'channel.peak_viewing': {'api': 'analytics', 'scope': 'channel', 'cost': 1,
+                             'endpoint': 'reports.query'},
+    'channel.geography': {'api': 'analytics', 'scope': 'channel', 'cost': 1,
+                          'endpoint': 'reports.query'},
+    'channel.geography_previous': {'api': 'analytics', 'scope': 'channel', 'cost': 1,
+                                   'endpoint': 'reports.query'},
+    'video.search': {'api': 'data', 'scope': 'page', 'cost': 100,
+                     'endpoint': 'search.list'},
+    # Statistics and the ETag-cached snippet/contentDetails are separate videos.list requests
+    'video.details': {'api': 'data', 'scope': 'page', 'cost': 2,
+                      'endpoint': 'videos.list', 'requires': ['video.search']},
+    'video.performance': {'api': 'analytics', 'scope': 'video', 'cost': 1,
+                          'endpoint': 'reports.query', 'requires': ['video.details']},
+    'video.impressions': {'api': 'analytics', 'scope': 'video', 'cost': 1,
+                          'endpoint': 'reports.query', 'requires': ['video.details']},
+    'video.geography': {'api': 'analytics', 'scope': 'video', 'cost': 1,
+                        'endpoint': 'reports.query', 'requires': ['video.details']},
+    'video.retention': {'api': 'analytics', 'scope': 'video', 'cost': 1,
+                        'endpoint': 'reports.query', 'requires': ['video.details']},
+    # Same window and filters as video.performance
+    'video.engagement': {'api': 'analytics', 'scope': 'video', 'cost': 1,
+                         'endpoint': 'reports.query', 'requires': ['video.details'],
+                         'merges': 'video.performance'},
+    'video.real_time': {'api': 'analytics', 'scope': 'video', 'cost': 1,
+                        'endpoint': 'reports.query', 'requires': ['video.details']},
+    'video.demographics': {'api': 'analytics', 'scope': 'video', 'cost': 2,
+                           'endpoint': 'reports.query', 'requires': ['video.details']},
+    'video.comparison': {'api': 'analytics', 'scope': 'video', 'cost': 1,
+                         'endpoint': 'reports.query', 'requires': ['video.details']},
+    # Same window as video.comparison, so the two merge into one query when both are planned
+    'video.history': {'api': 'analytics', 'scope': 'video', 'cost': 1,
+                      'endpoint': 'reports.query', 'requires': ['video.details'],
+                      'merges': 'video.comparison'},
+    # Only days after the stored, settled part of a video's curve; nothing once the curve is complete
+    'video.cohort': {'api': 'analytics', 'scope': 'video', 'cost': 1,
+                     'endpoint': 'reports.query', 'requires': ['video.details']},
+    'video.comments': {'api': 'data', 'scope': 'video', 'cost': 1,
+                       'endpoint': 'commentThreads.list', 'requires': ['video.details']}
+}
+
+# Data items the report and exports consume, and the calls producing them.
+METRICS: Dict[str, List[str]] = {
+    'channel_stats': ['channel.basic_stats'],
+    'period_stats': ['channel.period_analytics'],
+    'peak_viewing': ['channel.peak_viewing'],
+    'geo_distribution': ['channel.geography'],
+    'geo_previous': ['channel.geography_previous'],
+    'videos': ['video.details'],
+    'video_performance': ['video.performance'],
+    'video_impressions': ['video.impressions'],
+    'video_geography': ['video.geography'],
+    'video_retention': ['video.retention'],
+    'video_engagement': ['video.engagement'],
+    'video_real_time': ['video.real_time'],
+    'video_demographics': ['video.demographics'],
+    'video_comparison': ['video.comparison'],
+    'video_history': ['video.history'],
+    'video_cohorts': ['video.cohort'],
+    'video_comments': ['video.comments']
+}
+
+# Report sections in render order, with the metrics each one reads.
+SECTIONS: Dict[str, List[str]] = {
+    'channel_overview': ['channel_stats'],
+    'period_stats': ['period_stats'],
+    'videos': ['videos', 'video_impressions', 'video_performance', 'video_comparison'],
+    'peak_viewing': ['peak_viewing'],
+    'geography': ['geo_distribution'],
+    'trends': ['videos', 'video_performance'],
+    'geographic_expansion': ['video_geography', 'geo_distribution', 'geo_previous'],
+    'forecasts': ['period_stats', 'video_history'],
+    'cohorts': ['videos', 'video_cohorts'],
+    'anomalies': ['period_stats', 'video_real_time'],
+    'comments': ['videos', 'video_comments'],
+    'demographics': ['video_demographics']
+}
+
+EXPORTS: Dict[str, List[str]] = {
+    'video_metrics': ['videos', 'video_performance']
+}
+
+# Demographics were never fetched before the planner existed, so it stays opt-in.
+DEFAULT_SECTIONS = [section for section in SECTIONS if section != 'demographics']
+
+
+class FetchPlan:
+    """Resolved set of API calls for a run."""
+
+    def __init__(self, sections: List[str], exports: List[str], metrics: List[str], calls: List[str]):
+        self.sections = sections
+        self.exports = exports
+        self.metrics = metrics
+        self.calls = calls
+
+    def includes(self, call: str) -> bool:
+        """Whether a concrete API call is part of the plan."""
+        return call in self.calls
+
+    def has_section(self, section: str) -> bool:
+        return section in self.sections
+
+    def estimate(self, video_count: int) -> List[Dict[str, Any]]:
+        """
+        Per-call query count and quota cost for a given number of videos.
+
+        A call merged into another planned call's query issues none of its own.
+        """
+        pages = max(1, math.ceil(video_count / 50))
+        rows = []
+        for call in self.calls:
+            spec = API_CALLS[call]
+            queries = {'channel': 1, 'page': pages, 'video': video_count}[spec['scope']]
+            merged_with = spec.get('merges') if spec.get('merges') in self.calls else None
+            if merged_with:
+                queries = 0
+            rows.append({
+                'call': call,
+                'endpoint': spec['endpoint'],
+                'api': spec['api'],
+                'queries': queries * (spec['cost'] if spec['api'] == 'analytics' else 1),
+                'quota': queries * spec['cost'] if spec['api'] == 'data' else 0,
+                'merged_with': merged_with
+            })
+        return rows
+
+    def describe(self, video_count: int) -> str:
+        """Human readable call plan with estimated quota cost."""
+        rows = self.estimate(video_count)
+        call_width = max([len('Call')] + [len(row['call']) for row in rows]) + 2
+        endpoint_width = max([len('Endpoint')] + [len(row['endpoint']) for row in rows]) + 2
+        lines = [
+            f"Sections: {', '.join(self.sections) or '-'}",
+            f"Exports: {', '.join(self.exports) or '-'}",
+            f"Videos: {video_count}",
+            "",
+            f"{'Call':<{call_width}}{'Endpoint':<{endpoint_width}}{'Queries':>10}{'Quota':>10}"
+        ]
+        for row in rows:
+            note = f"  (merged into {row['merged_with']})" if row['merged_with'] else ""
+            lines.append(
+                f"{row['call']:<{call_width}}{row['endpoint']:<{endpoint_width}}"
+                f"{row['queries']:>10}{row['quota']:>10}{note}"
+            )
+        lines.append("")
+        lines.append(f"Data API quota units: {sum(row['quota'] for row in rows)}")
+        lines.append(f"Analytics API queries: {sum(row['queries'] for row in rows if row['api'] == 'analytics')}")
+        return "\n".join(lines)
+
+
+class FetchPlanner:
+    """Walks sections -> metrics -> API calls to decide what a run fetches."""
+
+    def __init__(self, sections: Optional[Iterable[str]] = None, exports: Optional[Iterable[str]] = None):
+        self.sections = list(DEFAULT_SECTIONS if sections is None else sections)
+        self.exports = list(exports or [])
+
+        unknown = [s for s in self.sections if s not in SECTIONS]
+        unknown += [e for e in self.exports if e not in EXPORTS]
+        if unknown:
+            raise ValueError(f"Unknown report sections or exports: {', '.join(unknown)}")
+
+    def plan(self) -> FetchPlan:
+        """Resolve the dependency graph into an ordered list of API calls."""
+        metrics: List[str] = []
+        for name in self.sections:
+            metrics.extend(m for m in SECTIONS[name] if m not in metrics)
+        for name in self.exports:
+            metrics.extend(m for m in EXPORTS[name] if m not in metrics)
+
+        needed = set()
+        for metric in metrics:
+            for call in METRICS[metric]:
+                self._visit(call, needed)
+
+        # Keep catalog order so the plan is stable and dependencies come first
+        calls = [call for call in API_CALLS if call in needed]
+        return FetchPlan(self.sections, self.exports, metrics, calls)
+
+    def _visit(self, call: str, needed: set) -> None:
+        if call in needed:
+            return
+        needed.add(call)
+        for dependency in API_CALLS[call].get('requires', []):
+            self._visit(dependency, needed)
@@ -0,0 +1,218 @@
+import os
+import time
+import uuid
+import socket
+import sqlite3
+from abc import ABC, abstractmethod
+from typing import Dict, Any, Iterable, Iterator, Optional, Tuple
+from src.utils.snapshot import Snapshot
+
+PENDING, LEASED, DONE, FAILED = 'pending', 'leased', 'done', 'failed'
+
+
+def worker_name() -> str:
+    """Default worker id: host and process."""
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+class TaskQueue(ABC):
+    """
+    Lease-based queue of positioned tasks shared by a coordinator and its workers.
+
+    Tasks are keyed by (run_key, position), so submitting the same run again
+    only requeues its failed tasks. A worker leases one task at a time; when the worker dies its
+    lease expires and another worker picks the task up. Completion stores the
+    first result and ignores later ones, so a task retried after an expired
+    lease never yields two results. A failed attempt goes back to the queue
+    with backoff until max_attempts, then the task is marked failed.
+
+    Backends implement the abstract methods below. SQLiteTaskQueue serves
+    workers on one host (or a filesystem with working locks); a networked backend such
+    as Redis (a sorted set of lease deadlines plus a results hash) only needs
+    the same methods and open_queue() to know its URL scheme.
+    """
+
+    @abstractmethod
+    def submit(self, run_key: str, tasks: Iterable[Tuple[int, Any]]) -> int:
+        """Add (position, payload) tasks, retrying failed ones; returns how many were (re)queued."""
+
+    @abstractmethod
+    def lease(self, worker_id: str, lease_seconds: float = 300,
+              run_key: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """Lease the next runnable task (of any run unless run_key is given), or None."""
+
+    @abstractmethod
+    def complete(self, task: Dict[str, Any], result: Any) -> bool:
+        """Store a task's result; False when another attempt already completed it."""
+
+    @abstractmethod
+    def fail(self, task: Dict[str, Any], error: str) -> None:
+        """Return a task to the queue after a failed attempt, or mark it failed."""
+
+    @abstractmethod
+    def results(self, run_key: str, start: int = 0) -> Iterator[Tuple[int, Any]]:
+        """Contiguous completed (position, result) pairs of a run from start on."""
+
+    @abstractmethod
+    def failures(self, run_key: str) -> Dict[int, str]:
+        """Last error of each task that ran out of attempts, by position."""
+
+    @abstractmethod
+    def counts(self, run_key: str) -> Dict[str, int]:
+        ...
+
+    @abstractmethod
+    def clear(self, run_key: str) -> None:
+        ...
+
+    def close(self) -> None:
+        pass
+
+
+class SQLiteTaskQueue(TaskQueue):
+    """TaskQueue in a SQLite file (WAL mode) that worker processes open concurrently."""
+
+    def __init__(self, path: str, max_attempts: int = 5, backoff_base: float = 2.0, backoff_cap: float = 120.0):
+        self.path = path
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self.conn = sqlite3.connect(path, timeout=30)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS tasks (
+                run_key TEXT NOT NULL,
+                position INTEGER NOT NULL,
+                payload TEXT NOT NULL,
+                state TEXT NOT NULL,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                available_at REAL NOT NULL DEFAULT 0,
+                lease_token TEXT,
+                lease_owner TEXT,
+                lease_expires REAL,
+                result TEXT,
+                error TEXT,
+                PRIMARY KEY (run_key, position)
+            );
+            CREATE INDEX IF NOT EXISTS tasks_runnable ON tasks (state, available_at);
+        """)
+
+    def submit(self, run_key: str, tasks: Iterable[Tuple[int, Any]]) -> int:
+        with self.conn:
+            cursor = self.conn.executemany(
+                f"""INSERT INTO tasks (run_key, position, payload, state) VALUES (?, ?, ?, '{PENDING}')
+                    ON CONFLICT (run_key, position) DO UPDATE
+                    SET payload = excluded.payload, state = '{PENDING}', attempts = 0, available_at = 0
+                    WHERE state = '{FAILED}'""",
+                [(run_key, position, Snapshot.dumps(payload)) for position, payload in tasks]
+            )
+        return cursor.rowcount
+
+    def lease(self, worker_id: str, lease_seconds: float = 300,
+              run_key: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        token = uuid.uuid4().hex
+        while True:
+            now = time.time()
+            with self.conn:
+                # A task whose workers keep dying mid-lease counts those leases as attempts
+                self.conn.execute(
+                    f"""UPDATE tasks SET state = '{FAILED}', error = 'lease expired', lease_token = NULL
+                        WHERE state = '{LEASED}' AND lease_expires < ? AND attempts >= ?""",
+                    (now, self.max_attempts)
+                )
+            row = self.conn.execute(
+                f"""SELECT run_key, position, payload, attempts FROM tasks
+                    WHERE ((state = '{PENDING}' AND available_at <= :now)
+                           OR (state = '{LEASED}' AND lease_expires < :now))
+                      AND (:run_key IS NULL OR run_key = :run_key)
+                    ORDER BY available_at, position LIMIT 1""",
+                {'now': now, 'run_key': run_key}
+            ).fetchone()
+            if row is None:
+                return None
+
+            # The state check makes the claim atomic across processes; losing the race means try the next one
+            with self.conn:
+                claimed = self.conn.execute(
+                    f"""UPDATE tasks SET state = '{LEASED}', lease_token = ?, lease_owner = ?,
+                            lease_expires = ?, attempts = attempts + 1
+                        WHERE run_key = ? AND position = ?
+                          AND ((state = '{PENDING}' AND available_at <= ?)
+                               OR (state = '{LEASED}' AND lease_expires < ?))""",
+                    (token, worker_id, now + lease_seconds, row[0], row[1], now, now)
+                ).rowcount
+            if claimed:
+                return {
+                    'run_key': row[0],
+                    'position': row[1],
+                    'payload': Snapshot.loads(row[2]),
+                    'attempt': row[3] + 1,
+                    'token': token
+                }
+
+    def complete(self, task: Dict[str, Any], result: Any) -> bool:
+        with self.conn:
+            return bool(self.conn.execute(
+                f"""UPDATE tasks SET state = '{DONE}', result = ?, error = NULL, lease_token = NULL
+                    WHERE run_key = ? AND position = ? AND state != '{DONE}'""",
+                (Snapshot.dumps(result), task['run_key'], task['position'])
+            ).rowcount)
+
+    def fail(self, task: Dict[str, Any], error: str) -> None:
+        retry = task['attempt'] < self.max_attempts
+        delay = min(self.backoff_cap, self.backoff_base ** task['attempt'])
+        with self.conn:
+            # Only the current lease holder may requeue; a stale worker's failure changes nothing
+            self.conn.execute(
+                """UPDATE tasks SET state = ?, available_at = ?, error = ?, lease_token = NULL
+                   WHERE run_key = ? AND position = ? AND lease_token = ?""",
+                (PENDING if retry else FAILED, time.time() + delay, error,
+                 task['run_key'], task['position'], task['token'])
+            )
+
+    def results(self, run_key: str, start: int = 0, batch: int = 500) -> Iterator[Tuple[int, Any]]:
+        expected = start
+        while True:
+            rows = self.conn.execute(
+                f"""SELECT position, result FROM tasks
+                    WHERE run_key = ? AND position >= ? AND state = '{DONE}'
+                    ORDER BY position LIMIT ?""",
+                (run_key, expected, batch)
+            ).fetchall()
+            for position, result in rows:
+                if position != expected:
+                    return
+                yield position, Snapshot.loads(result)
+                expected += 1
+            if len(rows) < batch:
+                return
+
+    def failures(self, run_key: str) -> Dict[int, str]:
+        cursor = self.conn.execute(
+            f"SELECT position, error FROM tasks WHERE run_key = ? AND state = '{FAILED}'", (run_key,)
+        )
+        return dict(cursor.fetchall())
+
+    def counts(self, run_key: str) -> Dict[str, int]:
+        counts = dict.fromkeys((PENDING, LEASED, DONE, FAILED), 0)
+        counts.update(self.conn.execute(
+            "SELECT state, COUNT(*) FROM tasks WHERE run_key = ? GROUP BY state", (run_key,)
+        ).fetchall())
+        return counts
+
+    def clear(self, run_key: str) -> None:
+        with self.conn:
+            self.conn.execute("DELETE FROM tasks WHERE run_key = ?", (run_key,))
+
+    def close(self) -> None:
+        self.conn.close()
+
+
+def open_queue(url: str) -> TaskQueue:
+    """Queue backend for a URL: 'sqlite:///path/queue.sqlite' or a plain file path."""
+    scheme, separator, location = url.partition('://')
+    if not separator:
+        return SQLiteTaskQueue(url)
+    if scheme == 'sqlite':
+        return SQLiteTaskQueue(location)
+    raise Exception(f"Unsupported work queue backend: {scheme}")
@@ -1 +1,9 @@
-from .gdocs import GDocsReporter
\ No newline at end of file
+from src._lazy import lazy_exports
+
+__all__, __getattr__, __dir__ = lazy_exports(__name__, {
+    'GDocsReporter': '.gdocs',
+    'StreamRenderer': '.stream',
+    'ConsoleRenderer': '.stream',
+    'JsonLinesRenderer': '.stream',
+    'open_renderer': '.stream'
+})
@@ -0,0 +1,163 @@
+import re
+from typing import Dict, List, Any, Iterable, Tuple, Union
+
+# "Label: value" at the start of a line; bullet lines ("- ...") carry titles, not labels
+_LABEL = re.compile(r"(?!- )([^:\n]{1,48}):(?= |$)")
+
+
+def utf16_len(text: str) -> int:
+    """Length in UTF-16 code units, the unit of Docs API indices."""
+    return len(text.encode('utf-16-le')) // 2
+
+
+class Text(str):
+    """Free text (a description, a quoted block) inserted without heading or label styling."""
+
+
+class Table:
+    """A native table block; the first row is bolded as the header."""
+
+    def __init__(self, rows: List[List[Any]], header: bool = True):
+        self.rows = [[str(cell) for cell in row] for row in rows]
+        self.header = header
+        self.columns = max((len(row) for row in self.rows), default=0)
+
+
+Block = Union[Dict[str, Any], Text, Table]
+
+
+class DocumentBuilder:
+    """
+    One batchUpdate building a whole report from the document start.
+
+    Every insert goes at the running end index, counted locally in UTF-16
+    code units like the Docs API does, so headings, bold labels and tables
+    are styled in the same batch as the text they apply to and nothing has
+    to be read back. Inserts only ever append, so a style range stays valid
+    for the rest of the batch.
+
+    Formatters hand over blocks: section requests (insertText at the end
+    of the segment, whose first line is the section heading and whose
+    "Label: value" lines get bold labels), Text and Table. A list of blocks
+    is one section: only its first section request carries the heading.
+    """
+
+    def __init__(self, start_index: int = 1):
+        self.index = start_index
+        self.requests: List[Dict[str, Any]] = []
+        self.parts: List[str] = []
+
+    @property
+    def text(self) -> str:
+        """The document's text as inserted (tables as tab separated rows)."""
+        return ''.join(self.parts)
+
+    def add(self, blocks: Union[Block, Iterable[Block]]) -> None:
+        """Append a formatter's output: one block or a list forming one section."""
+        if isinstance(blocks, (dict, Text, Table)):
+            blocks = [blocks]
+        heading = True
+        for block in blocks:
+            if isinstance(block, Table):
+                self.table(block)
+            elif isinstance(block, Text):
+                self.insert(block)
+            else:
+                self.section(block['insertText']['text'], heading)
+                heading = False
+
+    def title(self, text: str) -> None:
+        """Centered HEADING_1 title followed by a blank line."""
+        start = self.insert(f"{text}\n\n")
+        self._paragraph_style(start, start + utf16_len(text) + 1, 'HEADING_1', alignment='CENTER')
+
+    def section(self, text: str, heading: bool = True) -> None:
+        """Insert section text; style its first line as HEADING_2 and bold its labels."""
+        start = self.insert(text)
+        offset = start
+        for number, line in enumerate(text.split('\n')):
+            length = utf16_len(line)
+            if heading and number == 0:
+                if line:
+                    self._paragraph_style(offset, offset + length + 1, 'HEADING_2')
+            elif line.endswith(':') and not line.startswith('- '):
+                # Sub-heading such as "Top Commenters:"
+                self._bold(offset, offset + length)
+            else:
+                match = _LABEL.match(line)
+                if match:
+                    self._bold(offset, offset + utf16_len(match.group(1)) + 1)
+            offset += length + 1
+
+    def insert(self, text: str) -> int:
+        """Insert plain text at the end index; returns where it starts."""
+        start = self.index
+        if text:
+            self.requests.append({'insertText': {'location': {'index': start}, 'text': text}})
+            self.index += utf16_len(text)
+            self.parts.append(text)
+        return start
+
+    def table(self, table: Table) -> None:
+        """
+        insertTable at the end index and fill its cells.
+
+        The API puts a newline before the table, so the table starts one
+        past the location. Each row takes one index plus two per cell (the
+        cell and its empty paragraph). Cells are filled last to first so
+        the computed positions of the ones still to fill do not move.
+        """
+        if not table.rows or not table.columns:
+            return
+        location = self.index
+        rows, columns = len(table.rows), table.columns
+        self.requests.append({
+            'insertTable': {'location': {'index': location}, 'rows': rows, 'columns': columns}
+        })
+
+        row_span = 2 * columns + 1
+        first_cell = location + 4
+
+        cells: List[Tuple[int, int, str]] = []
+        for r, row in enumerate(table.rows):
+            for c in range(columns):
+                text = row[c] if c < len(row) else ''
+                cells.append((r, c, text))
+        for r, c, text in reversed(cells):
+            if text:
+                self.requests.append({
+                    'insertText': {'location': {'index': first_cell + r * row_span + 2 * c}, 'text': text}
+                })
+
+        # Final positions: every earlier cell's text shifts the later ones
+        shift = 0
+        for r, c, text in cells:
+            length = utf16_len(text)
+            if table.header and r == 0 and length:
+                start = first_cell + r * row_span + 2 * c + shift
+                self._bold(start, start + length)
+            shift += length
+
+        self.index = location + 2 + rows * row_span + shift
+        self.parts.append('\n' + ''.join('\t'.join(row) + '\n' for row in table.rows))
+
+    def _paragraph_style(self, start: int, end: int, style: str, alignment: str = None) -> None:
+        paragraph_style = {'namedStyleType': style}
+        if alignment:
+            paragraph_style['alignment'] = alignment
+        self.requests.append({
+            'updateParagraphStyle': {
+                'range': {'startIndex': start, 'endIndex': end},
+                'paragraphStyle': paragraph_style,
+                'fields': ','.join(paragraph_style)
+            }
+        })
+
+    def _bold(self, start: int, end: int) -> None:
+        self.requests.append({
+            'updateTextStyle': {
+                'range': {'startIndex': start, 'endIndex': end},
+                'textStyle': {'bold': True},
+                'fields': 'bold'
+            }
+        })
@@ -1,8 +1,16 @@
-from .base_formatter import BaseDocFormatter
-from .channel_formatter import ChannelFormatter
-from .geography_formatter import GeographyFormatter
-from .peak_viewing_formatter import PeakViewingFormatter
-from .trend_formatter import TrendFormatter
-from .video_formatter import VideoFormatter
-from .gender_formatter import GenderFormatter
-from .age_formatter import AgeRangeFormatter
\ No newline at end of file
+from src._lazy import lazy_exports
+
+__all__, __getattr__, __dir__ = lazy_exports(__name__, {
+    'BaseDocFormatter': '.base_formatter',
+    'ChannelFormatter': '.channel_formatter',
+    'GeographyFormatter': '.geography_formatter',
+    'PeakViewingFormatter': '.peak_viewing_formatter',
+    'TrendFormatter': '.trend_formatter',
+    'VideoFormatter': '.video_formatter',
+    'GenderFormatter': '.gender_formatter',
+    'AgeRangeFormatter': '.age_formatter',
+    'AnomalyFormatter': '.anomaly_formatter',
+    'CommentFormatter': '.comment_formatter',
+    'ForecastFormatter': '.forecast_formatter',
+    'CohortFormatter': '.cohort_formatter'
+})
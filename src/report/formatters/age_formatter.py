@@ -2,10 +2,8 @@ from typing import Dict, List
 from .base_formatter import BaseDocFormatter
 
 class AgeRangeFormatter(BaseDocFormatter):
-    def format_age_breakdown(self, demographics_data: List[Dict]) -> Dict:
+    def format_age_breakdown(self, demographics_data: List[Dict]) -> List:
         """Format age range breakdown section."""
-        text = "Viewer Age Ranges\n"
-        
         # Initialize age ranges totals
         age_totals = {
             '13-17': 0.0,
@@ -32,9 +30,10 @@ class AgeRangeFormatter(BaseDocFormatter):
             for age_group in age_totals:
                 age_totals[age_group] /= count
         
-        # Format output
-        for age_group, percentage in age_totals.items():
-            if percentage > 0:  # Only show age ranges with viewers
-                text += f"{age_group}: {self.formatter.format_percentage(percentage)}\n"
-        
-        return self.create_section_request(text)
\ No newline at end of file
+        # Format output, only age ranges with viewers
+        rows = [
+            [age_group, self.formatter.format_percentage(percentage)]
+            for age_group, percentage in age_totals.items()
+            if percentage > 0
+        ]
+        return self.create_table_section("Viewer Age Ranges", ["Age Range", "Share"], rows)
\ No newline at end of file
@@ -0,0 +1,36 @@
+from typing import Dict, List
+from .base_formatter import BaseDocFormatter
+
+class AnomalyFormatter(BaseDocFormatter):
+    def format_anomalies(self, anomalies: Dict[str, List[Dict]], limit: int = 5) -> Dict:
+        """Format spikes and drops section."""
+        text = "Spikes & Drops\n"
+        spikes = anomalies.get('spikes', [])
+        drops = anomalies.get('drops', [])
+
+        if not spikes and not drops:
+            text += "No unusual daily views detected.\n"
+            return self.create_section_request(text)
+
+        text += "\nSpikes:\n"
+        text += self._format_alerts(spikes[:limit])
+        text += "\nDrops:\n"
+        text += self._format_alerts(drops[:limit])
+
+        return self.create_section_request(text)
+
+    def _format_alerts(self, alerts: List[Dict]) -> str:
+        """Format individual alert lines."""
+        if not alerts:
+            return "- None\n"
+
+        text = ""
+        for alert in alerts:
+            label = alert.get('title') or 'Channel'
+            text += (
+                f"- {alert['date']} {label}: "
+                f"{self.formatter.format_number(int(alert['value']))} views "
+                f"(expected ~{self.formatter.format_number(int(alert['expected']))}, "
+                f"score {alert['score']})\n"
+            )
+        return text
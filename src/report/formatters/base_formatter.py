@@ -1,6 +1,7 @@
-from typing import Dict, Any, Optional
+from typing import Dict, List, Any, Optional
 from src.utils.formatters import DataFormatter
 from src.utils.date_helper import DateHelper
+from ..document import Table, Text
 
 class BaseDocFormatter:
     """Base class for Google Doc section formatters."""
@@ -42,6 +43,24 @@ class BaseDocFormatter:
             }
         }
 
+    def create_table_section(self, heading: str, header: List[str], rows: List[List[Any]]) -> List:
+        """
+        Create a section whose body is a native table.
+
+        Args:
+            heading: Section heading
+            header: Column names (bolded as the table's first row)
+            rows: Cell values, one list per row
+
+        Returns:
+            Blocks for the DocumentBuilder: heading, table and spacing
+        """
+        return [
+            self.create_section_request(f"{heading}\n", add_newline=False),
+            Table([header] + rows),
+            Text("\n\n")
+        ]
+
     def create_styled_section_request(self, 
                                     text: str,
                                     bold: bool = False,
@@ -2,6 +2,14 @@ from typing import Dict
 from .base_formatter import BaseDocFormatter
 
 class ChannelFormatter(BaseDocFormatter):
+    COMPARISON_LABELS = {
+        'views': 'Views',
+        'watch_time_minutes': 'Watch Time',
+        'avg_view_duration': 'Average View Duration',
+        'likes': 'Likes',
+        'subscribers_gained': 'Subscribers Gained'
+    }
+
     def format_overview(self, stats: Dict) -> Dict:
         """Format channel overview section."""
         text = (
@@ -20,4 +28,23 @@ class ChannelFormatter(BaseDocFormatter):
             f"Watch Time: {self.formatter.format_time(stats.get('watch_time_hours', 0)*60)}\n"
             f"Average Daily Views: {self.formatter.format_number(stats.get('avg_daily_views', 0))}\n"
         )
-        return self.create_section_request(text)
\ No newline at end of file
+
+        # Period over period, one block per horizon
+        for horizon, metrics in stats.get('comparison', {}).items():
+            days = horizon.rstrip('d')
+            text += f"\nLast {days} Days vs Previous {days}:\n"
+            for metric, label in self.COMPARISON_LABELS.items():
+                if metric in metrics:
+                    entry = metrics[metric]
+                    text += (
+                        f"{label}: {self._format_metric(metric, entry['current'])} "
+                        f"({self.formatter.format_change(entry['change_pct'])})\n"
+                    )
+        return self.create_section_request(text)
+
+    def _format_metric(self, metric: str, value: float) -> str:
+        if metric == 'watch_time_minutes':
+            return self.formatter.format_time(value)
+        if metric == 'avg_view_duration':
+            return f"{round(value)}s"
+        return self.formatter.format_number(round(value))
\ No newline at end of file
@@ -0,0 +1,52 @@
+from typing import Dict, List, Any
+from ..document import Table, Text
+from .base_formatter import BaseDocFormatter
+
+class CohortFormatter(BaseDocFormatter):
+    def format_cohorts(self, cohorts: Dict[str, Any]) -> List:
+        """Format cumulative views by days since publish and each video's standing against same-age peers."""
+        text = "Cohort Curves\n"
+        if not cohorts:
+            text += "No daily views since publish stored yet.\n"
+            return [self.create_section_request(text)]
+
+        number = self.formatter.format_number
+        text += (
+            f"Videos Tracked: {number(cohorts.get('videos', 0))} "
+            f"(complete {cohorts.get('days', 0)}-day curves: {number(cohorts.get('complete', 0))})\n"
+            f"Fetched This Run: {number(cohorts.get('videos_fetched', 0))} videos, "
+            f"{number(cohorts.get('days_fetched', 0))} days "
+            f"(already current: {number(cohorts.get('videos_current', 0))})\n"
+        )
+
+        blocks = []
+        curve = cohorts.get('curve', [])
+        if curve:
+            text += "\nCumulative Views by Days Since Publish:\n"
+            header = ["Day", "Videos", "25th", "Median", "75th", "90th"]
+            rows = [
+                [point['day'], number(point['videos'])]
+                + [number(point[key]) for key in ('p25', 'p50', 'p75', 'p90')]
+                for point in curve
+            ]
+            blocks += [self.create_section_request(text, add_newline=False), Table([header] + rows), Text("\n")]
+            text = ""
+
+        for key, label in (('leaders', "Ahead of Same-Age Peers"), ('laggards', "Behind Same-Age Peers")):
+            videos = cohorts.get(key, [])
+            if not videos:
+                continue
+            text += f"\n{label}:\n"
+            header = ["Video", "Day", "Views", "Peer Median", "Percentile"]
+            rows = [
+                [video['title'], video['day'], number(video['views']),
+                 number(video['peer_median']), video['percentile']]
+                for video in videos
+            ]
+            blocks += [self.create_section_request(text, add_newline=False), Table([header] + rows), Text("\n")]
+            text = ""
+
+        if not blocks:
+            return [self.create_section_request(text)]
+        blocks[-1] = Text("\n\n")
+        return blocks
@@ -0,0 +1,27 @@
+from typing import Dict, Any
+from .base_formatter import BaseDocFormatter
+
+class CommentFormatter(BaseDocFormatter):
+    def format_comments(self, comments: Dict[str, Any]) -> Dict:
+        """Format comment volume and top commenters section."""
+        text = "Comments\n"
+        text += f"Stored Comment Threads: {self.formatter.format_number(comments.get('total_threads', 0))}\n"
+        text += f"New or Updated This Run: {self.formatter.format_number(comments.get('threads_changed', 0))}\n"
+        if comments.get('threads_removed'):
+            text += f"Removed This Run: {self.formatter.format_number(comments['threads_removed'])}\n"
+        text += (
+            f"Videos Synced: {self.formatter.format_number(comments.get('videos_synced', 0))} "
+            f"(full: {self.formatter.format_number(comments.get('full_syncs', 0))}, "
+            f"without comments: {self.formatter.format_number(comments.get('videos_skipped', 0))})\n"
+        )
+
+        top_commenters = comments.get('top_commenters', [])
+        if top_commenters:
+            text += "\nTop Commenters:\n"
+            for commenter in top_commenters:
+                text += (
+                    f"- {commenter['author']}: {self.formatter.format_number(commenter['threads'])} threads, "
+                    f"{self.formatter.format_number(commenter['likes'])} likes\n"
+                )
+
+        return self.create_section_request(text)
@@ -0,0 +1,41 @@
+from typing import Dict, List, Any
+from ..document import Table, Text
+from .base_formatter import BaseDocFormatter
+
+class ForecastFormatter(BaseDocFormatter):
+    def format_forecasts(self, forecasts: Dict[str, Any]) -> List:
+        """Format channel and per-video view projections with their intervals."""
+        text = "View Forecasts\n"
+        if not forecasts:
+            text += "Not enough daily history to forecast.\n"
+            return [self.create_section_request(text)]
+
+        horizons = [f"{days}d" for days in forecasts.get('horizons', [])]
+        level = f"{round(forecasts.get('interval', 0.95) * 100)}%"
+        for horizon in horizons:
+            entry = forecasts.get('channel', {}).get(horizon)
+            if entry:
+                text += f"Channel, Next {horizon.rstrip('d')} Days: {self._format_range(entry)}\n"
+        text += (
+            f"Videos Forecast: {self.formatter.format_number(forecasts.get('videos_forecast', 0))} "
+            f"(too little history: {self.formatter.format_number(forecasts.get('videos_skipped', 0))})\n"
+            f"Intervals: {level} prediction intervals\n"
+        )
+
+        videos = forecasts.get('videos', [])
+        if not videos:
+            return [self.create_section_request(text)]
+
+        text += "\nVideos Projected to Gain the Most Views:\n"
+        header = ["Video"] + [f"Next {horizon.rstrip('d')} Days" for horizon in horizons]
+        rows = [
+            [video['title']] + [self._format_range(video[horizon]) for horizon in horizons]
+            for video in videos
+        ]
+        return [self.create_section_request(text, add_newline=False), Table([header] + rows), Text("\n\n")]
+
+    def _format_range(self, entry: Dict[str, Any]) -> str:
+        return (
+            f"{self.formatter.format_number(entry['views'])} views "
+            f"({self.formatter.format_number(entry['low'])}–{self.formatter.format_number(entry['high'])})"
+        )
@@ -2,10 +2,8 @@ from typing import Dict, List
 from .base_formatter import BaseDocFormatter
 
 class GenderFormatter(BaseDocFormatter):
-    def format_gender_breakdown(self, demographics_data: List[Dict]) -> Dict:
+    def format_gender_breakdown(self, demographics_data: List[Dict]) -> List:
         """Format gender breakdown section."""
-        text = "Viewer Gender Breakdown\n"
-        
         # Group by gender and sum percentages
         gender_totals = {'Male': 0.0, 'Female': 0.0}
         for demo in demographics_data:
@@ -18,7 +16,8 @@ class GenderFormatter(BaseDocFormatter):
                 gender_totals[gender] /= len(demographics_data)
         
         # Format output
-        for gender, percentage in gender_totals.items():
-            text += f"{gender}: {self.formatter.format_percentage(percentage)}\n"
-        
-        return self.create_section_request(text)
\ No newline at end of file
+        rows = [
+            [gender, self.formatter.format_percentage(percentage)]
+            for gender, percentage in gender_totals.items()
+        ]
+        return self.create_table_section("Viewer Gender Breakdown", ["Gender", "Share"], rows)
\ No newline at end of file
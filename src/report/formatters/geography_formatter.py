@@ -1,19 +1,47 @@
-from typing import List, Dict
+from typing import List, Dict, Any
 from .base_formatter import BaseDocFormatter
 
 class GeographyFormatter(BaseDocFormatter):
-    def format_geography(self, geo_data: List[Dict]) -> Dict:
-        """Format geographic distribution section."""
-        text = "Geographic Distribution\n"
-        
-        # Take top 5 countries
-        top_countries = geo_data[:5]
-        
-        for country in top_countries:
-            text += (
-                f"{country['country']}: "
-                f"{self.formatter.format_number(country['views'])} views "
-                f"({self.formatter.format_time(country['watch_time_minutes'])} watch time)\n"
-            )
-        
+    def format_geography(self, geo_data: List[Dict]) -> List:
+        """Format geographic distribution section as a table of the top 5 countries."""
+        rows = [
+            [
+                country['country'],
+                self.formatter.format_number(country['views']),
+                self.formatter.format_time(country['watch_time_minutes'])
+            ]
+            for country in geo_data[:5]
+        ]
+        return self.create_table_section("Geographic Distribution", ["Country", "Views", "Watch Time"], rows)
+
+    def format_geographic_expansion(self, expansion: Dict[str, Any]) -> Dict:
+        """Format country share, concentration and growth section."""
+        text = "Geographic Expansion\n"
+
+        if not expansion:
+            text += "No geographic data available.\n"
+            return self.create_section_request(text)
+
+        text += f"Countries Reached: {self.formatter.format_number(expansion.get('country_count', 0))}\n"
+        text += f"Concentration (HHI): {expansion.get('concentration_hhi', 0)}"
+        if expansion.get('previous_hhi') is not None:
+            text += f" (previous period: {expansion['previous_hhi']})"
+        text += "\n"
+
+        if expansion.get('median_video_hhi') is not None:
+            text += f"Median Video Concentration (HHI): {expansion['median_video_hhi']}\n"
+
+        text += "\nTop Countries by Share:\n"
+        has_previous = expansion.get('previous_hhi') is not None
+        for country in expansion.get('countries', []):
+            text += f"- {country['country']}: {self.formatter.format_percentage(country['share'])} share"
+            if has_previous:
+                growth = country.get('growth')
+                text += " (new)" if growth is None else f" ({self.formatter.format_percentage(growth)} vs previous)"
+            text += "\n"
+
+        new_markets = expansion.get('new_markets', [])
+        if new_markets:
+            text += f"\nNew Markets: {', '.join(new_markets)}\n"
+
         return self.create_section_request(text)
\ No newline at end of file
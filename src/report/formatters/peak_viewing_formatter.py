@@ -1,17 +1,15 @@
-from typing import Dict
+from typing import Dict, List
 from .base_formatter import BaseDocFormatter
 
 class PeakViewingFormatter(BaseDocFormatter):
-    def format_peak_viewing(self, peak_data: Dict) -> Dict:
-        """Format peak viewing section."""
-        text = "Peak Viewing Times\n"
-        peak_times = peak_data.get('peak_times', [])[:5]
-        
-        for day in peak_times:
-            text += (
-                f"Date: {day['date']} - "
-                f"Views: {self.formatter.format_number(day['views'])} - "
-                f"Watch Time: {self.formatter.format_time(day['watch_time'])}\n"
-            )
-        
-        return self.create_section_request(text)
\ No newline at end of file
+    def format_peak_viewing(self, peak_data: Dict) -> List:
+        """Format peak viewing section as a table of the top 5 days."""
+        rows = [
+            [
+                day['date'],
+                self.formatter.format_number(day['views']),
+                self.formatter.format_time(day['watch_time'])
+            ]
+            for day in peak_data.get('peak_times', [])[:5]
+        ]
+        return self.create_table_section("Peak Viewing Times", ["Date", "Views", "Watch Time"], rows)
\ No newline at end of file
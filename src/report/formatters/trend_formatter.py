@@ -1,7 +1,16 @@
-from typing import Dict
+from typing import Dict, List
 from .base_formatter import BaseDocFormatter
 
 class TrendFormatter(BaseDocFormatter):
+    LEADERBOARD_LABELS = {
+        'likes': 'Most Liked',
+        'engagement_rate': 'Highest Engagement Rate',
+        'watch_time': 'Most Watch Time',
+        'avg_view_percentage': 'Highest Average View Percentage',
+        'views_per_day': 'Most Views per Day Since Publish',
+        'comment_velocity': 'Fastest Comment Velocity'
+    }
+
     def format_trends(self, trend_data: Dict) -> Dict:
         """Format trend analysis section."""
         text = "Performance Trends\n"
@@ -20,5 +29,77 @@ class TrendFormatter(BaseDocFormatter):
         top_videos = content_insights.get('best_performing_videos', [])
         for video in top_videos[:3]:
             text += f"- {video['title']}: {self.formatter.format_number(video['stats']['views'])} views\n"
+
+        # Tag and topic groups compared with the channel
+        content_types = content_insights.get('content_type_performance', {})
+        if content_types.get('tags') or content_types.get('terms'):
+            text += self._format_content_types(content_types)
+
+        # Near-duplicate description templates
+        templates = content_insights.get('description_similarity', {}).get('templates', [])
+        if templates:
+            text += self._format_description_templates(templates)
+
+        # Retention curve (streaming aggregation)
+        retention_curve = trend_data.get('audience_trends', {}).get('retention_curve', [])
+        if retention_curve:
+            text += "\nMedian Relative Retention:\n"
+            for point in retention_curve[::max(1, len(retention_curve) // 4)]:
+                text += f"- {self.formatter.format_percentage(point['position'] * 100, 0)} through: {round(point['median'], 2)}\n"
+
+        # Leaderboards for the other ranking metrics
+        leaderboards = content_insights.get('leaderboards', {})
+        for metric, label in self.LEADERBOARD_LABELS.items():
+            entries = leaderboards.get(metric)
+            if entries:
+                text += f"\n{label}:\n" + self._format_leaderboard(metric, entries)
         
-        return self.create_section_request(text)
\ No newline at end of file
+        return self.create_section_request(text)
+
+    def _format_content_types(self, content_types: Dict, limit: int = 5) -> str:
+        """Format the best tag and topic groups by median views lift."""
+        baseline = content_types.get('baseline', {})
+        text = (
+            f"\nContent Performance (channel median: "
+            f"{self.formatter.format_number(round(baseline.get('median_views', 0)))} views):\n"
+        )
+        for label, key in (('Tag', 'tags'), ('Topic', 'terms')):
+            for group in content_types.get(key, [])[:limit]:
+                text += (
+                    f"- {label} \"{group['group']}\": {group['videos']} videos, "
+                    f"median {self.formatter.format_number(round(group['median_views']))} views "
+                    f"({round(group['lift'], 2)}x), "
+                    f"{self.formatter.format_percentage(group['engagement_rate'])} engagement, "
+                    f"{self.formatter.format_time(group['avg_watch_time'])} avg watch time\n"
+                )
+        return text
+
+    def _format_description_templates(self, templates: List[Dict], limit: int = 5) -> str:
+        """Format the largest description templates with their performance."""
+        text = "\nDescription Templates:\n"
+        for template in templates[:limit]:
+            text += (
+                f"- {template['template']} (e.g. {template['sample_title']}): {template['videos']} videos, "
+                f"median {self.formatter.format_number(round(template['median_views']))} views "
+                f"({round(template['lift'], 2)}x), "
+                f"{self.formatter.format_percentage(template['engagement_rate'])} engagement\n"
+            )
+        return text
+
+    def _format_leaderboard(self, metric: str, entries: List[Dict]) -> str:
+        """Format leaderboard entries for a ranking metric."""
+        text = ""
+        for entry in entries:
+            value = entry['value']
+            if metric in ('engagement_rate', 'avg_view_percentage'):
+                formatted = self.formatter.format_percentage(value)
+            elif metric == 'watch_time':
+                formatted = self.formatter.format_time(value)
+            elif metric == 'views_per_day':
+                formatted = f"{self.formatter.format_number(round(value, 1))} views/day"
+            elif metric == 'comment_velocity':
+                formatted = f"{value} comments/day"
+            else:
+                formatted = self.formatter.format_number(value)
+            text += f"- {entry['title']}: {formatted}\n"
+        return text
\ No newline at end of file
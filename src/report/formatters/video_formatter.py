@@ -1,38 +1,76 @@
 # src/report/video_formatter.py
-from typing import Dict, List
+from typing import Dict, List, Optional
+from src.utils.formatters import DataFormatter
+from ..document import Text
 from .base_formatter import BaseDocFormatter
 
 class VideoFormatter(BaseDocFormatter):
-     def format_videos_section(self, videos: List[Dict]) -> Dict:
-         """Format video details section."""
+     def format_videos_section(self, videos: List[Dict], descriptions: Optional[Dict] = None) -> List:
+         """Format video details section, printing shared description blocks once."""
          if not videos:
-             return self.create_section_request("No videos found in the specified period.\n")
+             return [self.create_section_request("Video Performance\n\nNo videos found in the specified period.\n")]
 
-         text = "Video Performance\n\n"
+         descriptions = descriptions or {}
+         video_blocks = descriptions.get('video_blocks', {})
+         # Streaming runs store paragraph cluster ids on each video and their labels here
+         block_labels = descriptions.get('block_labels', {})
+         blocks = [self.create_section_request("Video Performance\n\n", add_newline=False)]
 
          # Format each video's details
          for video in videos:
-             text += self._format_single_video(video)
+             marks = video_blocks.get(str(video.get('id')))
+             if marks is None and block_labels and video.get('description_blocks'):
+                 marks = [block_labels.get(str(block)) for block in video['description_blocks']]
+             blocks.extend(self._format_single_video(video, marks if marks and any(marks) else None))
 
-         return self.create_section_request(text)
+         boilerplate = descriptions.get('boilerplate', [])
+         if boilerplate:
+             blocks.append(self.create_section_request("Shared Description Blocks:\n", add_newline=False))
+             for block in boilerplate:
+                 blocks.append(self.create_section_request(
+                     f"[{block['block']}] used by {block['videos']} videos:\n", add_newline=False
+                 ))
+                 blocks.append(Text(f"{block['text']}\n\n"))
 
-     def _format_single_video(self, video: Dict) -> str:
-         """Format individual video details."""
+         blocks.append(Text("\n\n"))
+         return blocks
+
+     def _format_description(self, video: Dict, blocks: Optional[List[Optional[str]]] = None) -> str:
+         """Description with boilerplate paragraphs replaced by their block label."""
+         description = video.get('description', 'No description available.')
+         if not blocks:
+             return description
+         paragraphs = DataFormatter.split_paragraphs(description)
+         if len(paragraphs) != len(blocks):
+             return description
+         return "\n\n".join(
+             f"[{label}]" if label else paragraph for paragraph, label in zip(paragraphs, blocks)
+         )
+
+     def _format_single_video(self, video: Dict, blocks: Optional[List[Optional[str]]] = None) -> List:
+         """Format individual video details; the description is free text between labeled lines."""
          stats = video.get('stats', {})
          impression_data = video.get('impressions', {})
 
+         if 'published_ts' in video:
+             upload_date = self.date_helper.format_epoch(video['published_ts'])
+         else:
+             upload_date = self.date_helper.format_timestamp(video.get('published_at', ''))
+
          text = (
              f"Title: {video.get('title', 'Untitled')}\n"
-             f"Upload Date: {self.date_helper.format_timestamp(video.get('published_at', ''))}\n"
+             f"Upload Date: {upload_date}\n"
              f"Views: {self.formatter.format_number(stats.get('views', 0))}\n"
              f"Likes: {self.formatter.format_number(stats.get('likes', 0))}\n"
+             f"Description: "
          )
          # Add description
-         text += f"Description: {video.get('description', 'No description available.')}\n"
+         description = Text(self._format_description(video, blocks))
+         labeled = self.create_section_request(text, add_newline=False)
      
          # Add impression metrics
-         text += (
-             f"Impressions: {self.formatter.format_number(impression_data.get('impressions', 0))}\n"
+         text = (
+             f"\nImpressions: {self.formatter.format_number(impression_data.get('impressions', 0))}\n"
              f"Click-through Rate: {self.formatter.format_percentage(impression_data.get('click_through_rate', 0))}\n"
          )
 
@@ -50,7 +88,17 @@ class VideoFormatter(BaseDocFormatter):
          if 'stats' in video and 'comments' in video['stats']:
              text += f"Comments: {self.formatter.format_number(video['stats']['comments'])}\n"
 
-         return text + "\n"
+         if 'comments_activity' in video:
+             text += f"Comment Velocity: {video['comments_activity']['velocity']}/day\n"
+
+         if video.get('comparison'):
+             changes = [
+                 f"{horizon} {self.formatter.format_change(metrics['views']['change_pct'])}"
+                 for horizon, metrics in video['comparison'].items() if 'views' in metrics
+             ]
+             text += f"Views vs Previous Period: {', '.join(changes)}\n"
+
+         return [labeled, description, self.create_section_request(text + "\n", add_newline=False)]
 
      def format_video_demographics(self, demographics: Dict) -> str:
          """Format video demographics information."""
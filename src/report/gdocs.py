@@ -1,6 +1,7 @@
 import os
+import time
+import logging
 from typing import Dict, List
-from googleapiclient.discovery import build
 from .formatters import (
     ChannelFormatter, 
     VideoFormatter, 
@@ -8,13 +9,24 @@ from .formatters import (
     PeakViewingFormatter, 
     TrendFormatter,
     GenderFormatter, 
-    AgeRangeFormatter
+    AgeRangeFormatter,
+    AnomalyFormatter,
+    CommentFormatter,
+    ForecastFormatter,
+    CohortFormatter
 )
+from src.api.limiter import AdaptiveLimiter
+from .document import DocumentBuilder
 
 class GDocsReporter:
-    def __init__(self, credentials):
-        """Initialize Google Docs client and formatters."""
-        self.docs_service = build('docs', 'v1', credentials=credentials)
+    def __init__(self, transports=None, limiter=None):
+        """Initialize the Google Docs client (on a TransportPool's shared transports) and formatters."""
+        self.docs_service = None
+        if transports is not None:
+            self.docs_service = transports.client('docs', 'v1')
+            if limiter is not None:
+                # Retries throttled and 5xx reads with backoff; publish() retries the batchUpdate itself
+                self.docs_service = limiter.wrap(self.docs_service, no_retry=('documents.batchUpdate',))
         self.channel_formatter = ChannelFormatter()
         self.video_formatter = VideoFormatter()
         self.geography_formatter = GeographyFormatter()
@@ -22,27 +34,80 @@ class GDocsReporter:
         self.trend_formatter = TrendFormatter()
         self.gender_formatter = GenderFormatter()
         self.age_formatter = AgeRangeFormatter()
+        self.anomaly_formatter = AnomalyFormatter()
+        self.comment_formatter = CommentFormatter()
+        self.forecast_formatter = ForecastFormatter()
+        self.cohort_formatter = CohortFormatter()
 
     def create_report(self, channel_stats: Dict, period_stats: Dict, videos: List[Dict], 
-                     peak_viewing: Dict, geo_data: Dict, trend_data: Dict = None) -> str:
+                     peak_viewing: Dict, geo_data: Dict, trend_data: Dict = None,
+                     anomalies: Dict = None, sections: List[str] = None,
+                     comments: Dict = None, forecasts: Dict = None,
+                     cohorts: Dict = None) -> str:
         """Create or update analytics report in Google Docs."""
         document_id = os.getenv('YOUTUBE_ANALYSIS_DOCS_ID')
         
         if not document_id:
             raise ValueError("YOUTUBE_ANALYSIS_DOCS_ID not found in environment variables")
         
-        # Clear existing content
-        self._clear_document(document_id)
+        # Generate new content sections
+        requests = self.build_requests(
+            channel_stats,
+            period_stats,
+            videos,
+            peak_viewing,
+            geo_data,
+            trend_data,
+            anomalies,
+            document_id=document_id,
+            sections=sections,
+            comments=comments,
+            forecasts=forecasts,
+            cohorts=cohorts
+        )
         
-        # Get demographics data from videos
-        demographics_data = [
-            video.get('demographics', {}).get('audience', [])
-            for video in videos
-            if video.get('demographics', {}).get('audience')
-        ]
+        self.publish(document_id, requests)
+        return document_id
+
+    def publish(self, document_id: str, requests: List[Dict], attempts: int = 3) -> None:
+        """
+        Replace the document's content with prebuilt requests in one batchUpdate.
+
+        A batchUpdate is applied whole or not at all, but a 5xx can arrive
+        after it was applied, so it is never retried blindly: each attempt
+        reads the document again and clears whatever it holds by then.
+        """
+        for attempt in range(1, attempts + 1):
+            # Clearing runs first in the same batch, so the report's indices start from an empty body
+            body = {'requests': self._clear_requests(document_id) + requests}
+            try:
+                self.docs_service.documents().batchUpdate(documentId=document_id, body=body).execute()
+                return
+            except Exception as e:
+                if attempt == attempts or not AdaptiveLimiter.is_transient(e):
+                    raise
+                logging.warning(f"Docs batchUpdate failed (attempt {attempt}): {e}; re-reading the document")
+                time.sleep(2 ** attempt)
+
+    def build_requests(self, channel_stats: Dict, period_stats: Dict, videos: List[Dict],
+                       peak_viewing: Dict, geo_data: Dict, trend_data: Dict = None,
+                       anomalies: Dict = None, document_id: str = None,
+                       sections: List[str] = None, comments: Dict = None,
+                       forecasts: Dict = None, cohorts: Dict = None) -> List[Dict]:
+        """Build the batchUpdate requests for a report without calling the API."""
+        # Get demographics data, preferring the already aggregated trend data
+        if trend_data and 'demographic_shifts' in trend_data.get('audience_trends', {}):
+            demographics_data = [
+                audience for audience in trend_data['audience_trends']['demographic_shifts'] if audience
+            ]
+        else:
+            demographics_data = [
+                video.get('demographics', {}).get('audience', [])
+                for video in videos
+                if video.get('demographics', {}).get('audience')
+            ]
         
-        # Generate new content sections
-        requests = self._generate_report_sections(
+        return self._generate_report_sections(
             document_id,
             channel_stats,
             period_stats,
@@ -50,42 +115,36 @@ class GDocsReporter:
             peak_viewing,
             geo_data,
             demographics_data,
-            trend_data
+            trend_data,
+            anomalies,
+            sections,
+            comments,
+            forecasts,
+            cohorts
         )
-        
-        # Execute update
-        self.docs_service.documents().batchUpdate(
-            documentId=document_id,
-            body={'requests': requests}
-        ).execute()
-        
-        return document_id
 
-    def _clear_document(self, doc_id: str) -> None:
-        """Clear all content from the document if it exists."""
+    def _clear_requests(self, doc_id: str) -> List[Dict]:
+        """Request deleting all content of the document, if it has any."""
         try:
-            document = self.docs_service.documents().get(documentId=doc_id).execute()
-            
-            if document.get('body', {}).get('content', []):
-                end_index = document['body']['content'][-1]['endIndex'] - 1
-                
-                if end_index > 1:
-                    self.docs_service.documents().batchUpdate(
-                        documentId=doc_id,
-                        body={
-                            'requests': [{
-                                'deleteContentRange': {
-                                    'range': {
-                                        'startIndex': 1,
-                                        'endIndex': end_index
-                                    }
-                                }
-                            }]
-                        }
-                    ).execute()
+            document = self.docs_service.documents().get(
+                documentId=doc_id, fields='body/content/endIndex'
+            ).execute()
         except Exception as e:
             raise Exception(f"Error clearing document: {str(e)}")
 
+        content = document.get('body', {}).get('content', [])
+        end_index = content[-1]['endIndex'] - 1 if content else 1
+        if end_index <= 1:
+            return []
+        return [{
+            'deleteContentRange': {
+                'range': {
+                    'startIndex': 1,
+                    'endIndex': end_index
+                }
+            }
+        }]
+
     def _generate_report_sections(
         self,
         document_id: str,
@@ -95,89 +154,72 @@ class GDocsReporter:
         peak_viewing: Dict,
         geo_data: Dict,
         demographics_data: List[Dict],
-        trend_data: Dict = None
+        trend_data: Dict = None,
+        anomalies: Dict = None,
+        sections: List[str] = None,
+        comments: Dict = None,
+        forecasts: Dict = None,
+        cohorts: Dict = None
     ) -> List[Dict]:
-        """Generate all sections of the report."""
-        requests = [
-            # Title
-            {
-                'insertText': {
-                    'location': {'index': 1},
-                    'text': 'YouTube Analytics Report\n\n'
-                }
-            },
-            
-            # Channel Overview
-            self.channel_formatter.format_overview(channel_stats),
+        """Generate all enabled sections of the report, styled, as one batch of requests."""
+        def enabled(section: str) -> bool:
+            return sections is None or section in sections
+
+        document = DocumentBuilder()
+        document.title('YouTube Analytics Report')
+
+        # Channel Overview
+        if enabled('channel_overview'):
+            document.add(self.channel_formatter.format_overview(channel_stats))
             
-            # Period Statistics
-            self.channel_formatter.format_period_stats(period_stats),
+        # Period Statistics
+        if enabled('period_stats'):
+            document.add(self.channel_formatter.format_period_stats(period_stats))
             
-            # Video Performance
-            self.video_formatter.format_videos_section(videos),
+        # Video Performance
+        if enabled('videos'):
+            descriptions = (trend_data or {}).get('content_insights', {}).get('description_similarity')
+            document.add(self.video_formatter.format_videos_section(videos, descriptions))
             
-            # Peak Viewing Times
-            self.peak_viewing_formatter.format_peak_viewing(peak_viewing),
+        # Peak Viewing Times
+        if enabled('peak_viewing'):
+            document.add(self.peak_viewing_formatter.format_peak_viewing(peak_viewing))
             
-            # Geographic Distribution
-            self.geography_formatter.format_geography(geo_data)
-        ]
+        # Geographic Distribution
+        if enabled('geography'):
+            document.add(self.geography_formatter.format_geography(geo_data))
 
         # Trend Analysis (if available)
         if trend_data:
-            requests.append(self.trend_formatter.format_trends(trend_data))
+            if enabled('trends'):
+                document.add(self.trend_formatter.format_trends(trend_data))
+
+            expansion = trend_data.get('audience_trends', {}).get('geographic_expansion')
+            if expansion and enabled('geographic_expansion'):
+                document.add(self.geography_formatter.format_geographic_expansion(expansion))
+
+        # View Forecasts (if the series were fetched)
+        if forecasts is not None and enabled('forecasts'):
+            document.add(self.forecast_formatter.format_forecasts(forecasts))
+
+        # Cohort Curves (if the since-publish series were fetched)
+        if cohorts is not None and enabled('cohorts'):
+            document.add(self.cohort_formatter.format_cohorts(cohorts))
+
+        # Spikes & Drops (if detector ran)
+        if anomalies is not None and enabled('anomalies'):
+            document.add(self.anomaly_formatter.format_anomalies(anomalies))
+
+        # Comments (if synced)
+        if comments is not None and enabled('comments'):
+            document.add(self.comment_formatter.format_comments(comments))
         
         # Gender Demographics
-        if demographics_data:
-            requests.append(self.gender_formatter.format_gender_breakdown(demographics_data))
+        if demographics_data and enabled('demographics'):
+            document.add(self.gender_formatter.format_gender_breakdown(demographics_data))
             
         # Age Range Demographics (new section)
-        if demographics_data:
-            requests.append(self.age_formatter.format_age_breakdown(demographics_data))
-
-        return requests
+        if demographics_data and enabled('demographics'):
+            document.add(self.age_formatter.format_age_breakdown(demographics_data))
 
-    def _create_section_styles(self, requests: List[Dict], doc_id: str) -> None:
-        """Apply consistent styling to document sections."""
-        try:
-            # Apply title styling
-            requests.append({
-                'updateParagraphStyle': {
-                    'range': {
-                        'startIndex': 1,
-                        'endIndex': 25  # Approximate length of title
-                    },
-                    'paragraphStyle': {
-                        'namedStyleType': 'HEADING_1',
-                        'alignment': 'CENTER'
-                    },
-                    'fields': 'namedStyleType,alignment'
-                }
-            })
-
-            # Apply section header styling
-            sections = self.docs_service.documents().get(
-                documentId=doc_id
-            ).execute().get('body', {}).get('content', [])
-
-            for section in sections:
-                if 'paragraph' in section:
-                    paragraph = section.get('paragraph', {})
-                    if paragraph.get('paragraphStyle', {}).get('namedStyleType') == 'NORMAL_TEXT':
-                        start_index = section.get('startIndex', 0)
-                        end_index = section.get('endIndex', 0)
-                        
-                        requests.append({
-                            'updateParagraphStyle': {
-                                'range': {
-                                    'startIndex': start_index,
-                                    'endIndex': end_index
-                                },
-                                'paragraphStyle': {
-                                    'namedStyleType': 'HEADING_2'
-                                },
-                                'fields': 'namedStyleType'
-                            }
-                        })
-        except Exception as e:
-            raise Exception(f"Error applying styles: {str(e)}")
\ No newline at end of file
+        return document.requests
@@ -0,0 +1,235 @@
+import sys
+import json
+from abc import ABC, abstractmethod
+from typing import Dict, List, Any, Callable, Optional, TextIO, Tuple
+from src.api.rows import ReportTable
+from src.utils.formatters import DataFormatter
+from .document import Table, Text
+from .formatters import (
+    ChannelFormatter,
+    GeographyFormatter,
+    PeakViewingFormatter,
+    TrendFormatter,
+    GenderFormatter,
+    AgeRangeFormatter,
+    AnomalyFormatter,
+    CommentFormatter,
+    ForecastFormatter,
+    CohortFormatter
+)
+
+OUTPUT_MODES = ('docs', 'console', 'jsonl')
+
+
+def _audience_trends(data: Dict[str, Any]) -> Dict[str, Any]:
+    return (data.get('trend_analysis') or {}).get('audience_trends', {})
+
+
+# Channel-level sections in report order, each with the payload it renders from a
+# gathered-data dict; a missing key means the payload is not ready yet
+SECTION_PAYLOADS: Dict[str, Callable[[Dict[str, Any]], Any]] = {
+    'channel_overview': lambda data: data.get('channel_stats') or None,
+    'period_stats': lambda data: data.get('period_stats') or None,
+    'peak_viewing': lambda data: data.get('peak_viewing'),
+    'geography': lambda data: data.get('geo_distribution'),
+    'trends': lambda data: data.get('trend_analysis') or None,
+    'geographic_expansion': lambda data: _audience_trends(data).get('geographic_expansion') or None,
+    'forecasts': lambda data: data.get('forecasts'),
+    'cohorts': lambda data: data.get('cohorts'),
+    'anomalies': lambda data: data.get('anomalies'),
+    'comments': lambda data: data.get('comments'),
+    'demographics': lambda data: [
+        audience for audience in _audience_trends(data).get('demographic_shifts', []) if audience
+    ] or None
+}
+
+
+class StreamRenderer(ABC):
+    """
+    Writes a report to a local stream while it is being gathered.
+
+    gather hands over each video as soon as it is enriched and the gathered
+    data so far whenever a stage finishes; every channel-level section is
+    written once, the first time its payload is there. Each write is
+    flushed, so a pipe or terminal sees results during a long run.
+    Subclasses implement write_video and write_section.
+    """
+
+    def __init__(self, stream: Optional[TextIO] = None):
+        self.stream = stream or sys.stdout
+        self.videos = 0
+        self.emitted: List[str] = []
+
+    def video(self, video: Dict[str, Any]) -> None:
+        """Write one enriched video."""
+        self.write_video(self.videos, video)
+        self.videos += 1
+        self.stream.flush()
+
+    def update(self, data: Dict[str, Any]) -> None:
+        """Write the enabled sections whose payloads became available in data."""
+        sections = data.get('sections')
+        for name, payload_of in SECTION_PAYLOADS.items():
+            if name in self.emitted or (sections is not None and name not in sections):
+                continue
+            payload = payload_of(data)
+            if payload is None:
+                continue
+            self.emitted.append(name)
+            self.write_section(name, payload)
+            self.stream.flush()
+
+    def replay(self, data: Dict[str, Any]) -> None:
+        """Write a whole snapshot: the channel sections around its videos, as gather would."""
+        try:
+            self.update({key: data.get(key) for key in ('sections', 'channel_stats', 'period_stats')})
+            for video in data.get('videos', []):
+                self.video(video)
+            self.update(data)
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        self.stream.flush()
+
+    @abstractmethod
+    def write_video(self, position: int, video: Dict[str, Any]) -> None:
+        """Write the video at a position in the listing."""
+
+    @abstractmethod
+    def write_section(self, name: str, payload: Any) -> None:
+        """Write one channel-level section from its payload."""
+
+
+class JsonLinesRenderer(StreamRenderer):
+    """One JSON object per line: a record per video, per section and a final summary."""
+
+    def write_video(self, position: int, video: Dict[str, Any]) -> None:
+        self._write({'type': 'video', 'position': position, 'video': video})
+
+    def write_section(self, name: str, payload: Any) -> None:
+        self._write({'type': 'section', 'section': name, 'data': payload})
+
+    def close(self) -> None:
+        self._write({'type': 'end', 'videos': self.videos, 'sections': self.emitted})
+        super().close()
+
+    def _write(self, record: Dict[str, Any]) -> None:
+        self.stream.write(json.dumps(record, default=self._encode, separators=(',', ':')))
+        self.stream.write('\n')
+
+    @staticmethod
+    def _encode(value: Any) -> Any:
+        if isinstance(value, ReportTable):
+            return list(value.records())
+        raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+class ConsoleRenderer(StreamRenderer):
+    """
+    Plain-text report for a terminal.
+
+    Videos print as rows of one aligned table, its header before the first
+    one; sections go through the Docs formatters and print their text with
+    tables as aligned columns.
+    """
+
+    # (header, width, right aligned) of the video rows
+    VIDEO_COLUMNS = (('#', 4, True), ('Published', 10, False), ('Title', 40, False), ('Views', 11, True),
+                     ('Likes', 9, True), ('Watch Time', 11, True), ('CTR', 6, True))
+
+    def __init__(self, stream: Optional[TextIO] = None):
+        super().__init__(stream)
+        self.formatter = DataFormatter()
+        channel, geography = ChannelFormatter(), GeographyFormatter()
+        # Each section's formatters; demographics prints as two sections, like in the Docs report
+        self.formatters: Dict[str, Tuple[Callable[[Any], Any], ...]] = {
+            'channel_overview': (channel.format_overview,),
+            'period_stats': (channel.format_period_stats,),
+            'peak_viewing': (PeakViewingFormatter().format_peak_viewing,),
+            'geography': (geography.format_geography,),
+            'trends': (TrendFormatter().format_trends,),
+            'geographic_expansion': (geography.format_geographic_expansion,),
+            'forecasts': (ForecastFormatter().format_forecasts,),
+            'cohorts': (CohortFormatter().format_cohorts,),
+            'anomalies': (AnomalyFormatter().format_anomalies,),
+            'comments': (CommentFormatter().format_comments,),
+            'demographics': (GenderFormatter().format_gender_breakdown, AgeRangeFormatter().format_age_breakdown)
+        }
+
+    def write_video(self, position: int, video: Dict[str, Any]) -> None:
+        if position == 0:
+            self._row([header for header, _, _ in self.VIDEO_COLUMNS])
+            self._row(['-' * width for _, width, _ in self.VIDEO_COLUMNS])
+        stats = video.get('stats', {})
+        watch_time = video.get('performance', {}).get('watch_time')
+        ctr = video.get('impressions', {}).get('click_through_rate')
+        self._row([
+            position + 1,
+            (video.get('published_at') or '')[:10],
+            video.get('title', 'Untitled'),
+            self.formatter.format_number(stats.get('views', 0)),
+            self.formatter.format_number(stats.get('likes', 0)),
+            self.formatter.format_time(watch_time) if watch_time is not None else '-',
+            self.formatter.format_percentage(ctr) if ctr is not None else '-'
+        ])
+
+    def write_section(self, name: str, payload: Any) -> None:
+        for format_section in self.formatters[name]:
+            # Docs sections end in blank lines for spacing; one blank line separates them here
+            self.stream.write('\n' + self._text(format_section(payload)).rstrip('\n') + '\n')
+
+    def close(self) -> None:
+        if self.videos:
+            self.stream.write(f"\n{self.videos} videos\n")
+        super().close()
+
+    def _text(self, blocks: Any) -> str:
+        """A formatter's output as text; its first section request starts with the heading."""
+        if isinstance(blocks, (dict, Text, Table)):
+            blocks = [blocks]
+        parts, heading = [], True
+        for block in blocks:
+            if isinstance(block, Table):
+                parts.append(self._table(block))
+            elif isinstance(block, Text):
+                parts.append(block)
+            else:
+                text = block['insertText']['text']
+                if heading:
+                    title, _, text = text.partition('\n')
+                    parts.append(f"{title}\n{'=' * len(title)}\n")
+                    heading = False
+                parts.append(text)
+        return ''.join(parts)
+
+    def _row(self, cells: List[Any]) -> None:
+        parts = []
+        for cell, (_, width, right) in zip(cells, self.VIDEO_COLUMNS):
+            cell = str(cell)
+            if len(cell) > width:
+                cell = cell[:width - 1] + '…'
+            parts.append(cell.rjust(width) if right else cell.ljust(width))
+        self.stream.write('  '.join(parts).rstrip() + '\n')
+
+    @staticmethod
+    def _table(table: Table) -> str:
+        widths = [
+            max((len(row[column]) for row in table.rows if column < len(row)), default=0)
+            for column in range(table.columns)
+        ]
+        lines = ['  '.join(cell.ljust(width) for cell, width in zip(row, widths)).rstrip() for row in table.rows]
+        if table.header and lines:
+            lines.insert(1, '  '.join('-' * width for width in widths))
+        return '\n'.join(lines) + '\n'
+
+
+def open_renderer(mode: str, stream: Optional[TextIO] = None) -> Optional[StreamRenderer]:
+    """Renderer for an output mode; None for 'docs', which publishes once the run is done."""
+    if mode == 'console':
+        return ConsoleRenderer(stream)
+    if mode == 'jsonl':
+        return JsonLinesRenderer(stream)
+    if mode != 'docs':
+        raise ValueError(f"Unknown output mode: {mode} (expected one of {', '.join(OUTPUT_MODES)})")
+    return None
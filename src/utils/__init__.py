@@ -1,7 +1,12 @@
 from .date_helper import DateHelper
 from .formatters import DataFormatter
+from .snapshot import Snapshot, VideoSpool
+from .profiler import StageProfiler
 
 __all__ = [
     'DateHelper', 
-    'DataFormatter'
+    'DataFormatter',
+    'Snapshot',
+    'VideoSpool',
+    'StageProfiler'
 ]
\ No newline at end of file
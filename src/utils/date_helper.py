@@ -1,6 +1,10 @@
+import re
+import calendar
 from datetime import datetime, timedelta
 from typing import Tuple, Dict
 
+_ISO_DURATION = re.compile(r'P(?:(\d+)D)?(?:T(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?)?')
+
 class DateHelper:
     @staticmethod
     def get_date_range(days: int = 30) -> Tuple[str, str]:
@@ -36,4 +40,32 @@ class DateHelper:
     def format_timestamp(timestamp: str) -> str:
         """Format ISO timestamp to readable format."""
         dt = datetime.strptime(timestamp, '%Y-%m-%dT%H:%M:%SZ')
-        return dt.strftime('%B %d, %Y %I:%M %p')
\ No newline at end of file
+        return dt.strftime('%B %d, %Y %I:%M %p')
+
+    @staticmethod
+    def parse_duration(duration: str) -> int:
+        """ISO 8601 duration (e.g. PT1H2M3S) to seconds."""
+        match = _ISO_DURATION.fullmatch(duration or '')
+        if not match:
+            return 0
+        days, hours, minutes, seconds = (int(part or 0) for part in match.groups())
+        return ((days * 24 + hours) * 60 + minutes) * 60 + seconds
+
+    @staticmethod
+    def format_seconds(total: int) -> str:
+        """Seconds to H:MM:SS (or M:SS under an hour)."""
+        hours, rest = divmod(int(total), 3600)
+        minutes, seconds = divmod(rest, 60)
+        if hours:
+            return f"{hours}:{minutes:02d}:{seconds:02d}"
+        return f"{minutes}:{seconds:02d}"
+
+    @staticmethod
+    def parse_timestamp(timestamp: str) -> int:
+        """ISO UTC timestamp to epoch seconds."""
+        return calendar.timegm(datetime.strptime(timestamp, '%Y-%m-%dT%H:%M:%SZ').timetuple())
+
+    @staticmethod
+    def format_epoch(epoch: int) -> str:
+        """Epoch seconds to the same readable format as format_timestamp."""
+        return datetime.utcfromtimestamp(epoch).strftime('%B %d, %Y %I:%M %p')
@@ -1,4 +1,7 @@
-from typing import Dict, Any, Union
+import re
+from typing import Dict, List, Any, Optional, Union
+
+_PARAGRAPH_BREAK = re.compile(r"\n\s*\n")
 
 class DataFormatter:
     @staticmethod
@@ -11,6 +14,13 @@ class DataFormatter:
         """Format percentage with specified decimal places."""
         return f"{round(value, decimal_places)}%"
 
+    @staticmethod
+    def format_change(value: Optional[float], decimal_places: int = 1) -> str:
+        """Format a signed percentage change; n/a when there is no base to compare with."""
+        if value is None:
+            return "n/a"
+        return f"{'+' if value >= 0 else ''}{round(value, decimal_places)}%"
+
     @staticmethod
     def format_time(minutes: float) -> str:
         """Format minutes into hours and minutes."""
@@ -40,4 +50,9 @@ class DataFormatter:
             'YT_CHANNEL': 'Channel',
             'YT_OTHER_PAGE': 'Other Pages'
         }
-        return replacements.get(source, source.title())
\ No newline at end of file
+        return replacements.get(source, source.title())
+
+    @staticmethod
+    def split_paragraphs(text: str) -> List[str]:
+        """Non-empty blank-line separated blocks of a text, stripped."""
+        return [block.strip() for block in _PARAGRAPH_BREAK.split(text or '') if block.strip()]
@@ -0,0 +1,94 @@
+import os
+import json
+from typing import Dict, Any, Iterator
+from src.api.rows import ReportTable
+
+class VideoSpool:
+    """Append-only JSON Lines file of enriched videos, iterated lazily."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._count = None
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, 'r') as f:
+            for line in f:
+                yield json.loads(line, object_hook=Snapshot._decode)
+
+    def __len__(self) -> int:
+        if self._count is None:
+            self._count = sum(1 for _ in self)
+        return self._count
+
+    def writer(self) -> 'VideoSpoolWriter':
+        """Open the spool for writing, replacing previous contents."""
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._count = None
+        return VideoSpoolWriter(self.path)
+
+
+class VideoSpoolWriter:
+    def __init__(self, path: str):
+        self.file = open(path, 'w')
+        self.count = 0
+
+    def write(self, video: Dict[str, Any]) -> None:
+        self.file.write(json.dumps(video, default=Snapshot._encode) + '\n')
+        self.count += 1
+
+    def close(self) -> None:
+        self.file.close()
+
+    def __enter__(self) -> 'VideoSpoolWriter':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class Snapshot:
+    """Read and write gathered analytics data as local JSON snapshots."""
+
+    @staticmethod
+    def save(data: Dict[str, Any], path: str) -> None:
+        """Write gathered data to a JSON file (spooled videos are kept by reference)."""
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, 'w') as f:
+            json.dump(data, f, default=Snapshot._encode)
+
+    @staticmethod
+    def load(path: str) -> Dict[str, Any]:
+        """Load gathered data from a JSON file."""
+        with open(path, 'r') as f:
+            return json.load(f, object_hook=Snapshot._decode)
+
+    @staticmethod
+    def dumps(value: Any) -> str:
+        """Serialize one value the way snapshots do."""
+        return json.dumps(value, default=Snapshot._encode)
+
+    @staticmethod
+    def loads(text: str) -> Any:
+        return json.loads(text, object_hook=Snapshot._decode)
+
+    @staticmethod
+    def _encode(value: Any) -> Any:
+        if isinstance(value, VideoSpool):
+            return {'__video_spool__': value.path}
+        if isinstance(value, ReportTable):
+            return {'__report_table__': value.to_json()}
+        raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+    @staticmethod
+    def _decode(value: Dict[str, Any]) -> Any:
+        if '__video_spool__' in value:
+            return VideoSpool(value['__video_spool__'])
+        if '__report_table__' in value:
+            return ReportTable.from_json(value['__report_table__'])
+        return value
@@ -0,0 +1,88 @@
+import os
+import sys
+import zlib
+from datetime import date, timedelta
+from typing import Dict, List, Any
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+COUNTRIES = ['US', 'IN', 'BR', 'GB', 'DE', 'FR']
+INTEGER_METRICS = ('views', 'likes', 'comments', 'subscribersGained', 'estimatedMinutesWatched')
+
+
+class FakeRequest:
+    def __init__(self, response: Any):
+        self.response = response
+
+    def execute(self) -> Any:
+        if isinstance(self.response, Exception):
+            raise self.response
+        return self.response
+
+
+class FakeAnalytics:
+    """
+    YouTube Analytics client answering reports().query() from deterministic rows.
+
+    Every query is recorded in `calls`. A metric's value depends on the
+    metric, the dimension value and the video filter only, so merged and
+    separate queries must agree cell for cell. Server-side sort and
+    maxResults are applied like the API does.
+    """
+
+    def __init__(self):
+        self.calls: List[Dict[str, Any]] = []
+
+    def reports(self) -> 'FakeAnalytics':
+        return self
+
+    def query(self, **params) -> FakeRequest:
+        self.calls.append(params)
+        return FakeRequest(self.respond(params))
+
+    def respond(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        dimensions = [name for name in (params.get('dimensions') or '').split(',') if name]
+        metrics = [name for name in params['metrics'].split(',') if name]
+        headers = [{'name': name, 'columnType': 'DIMENSION', 'dataType': 'STRING'} for name in dimensions]
+        headers += [
+            {'name': name, 'columnType': 'METRIC',
+             'dataType': 'INTEGER' if name in INTEGER_METRICS else 'FLOAT'}
+            for name in metrics
+        ]
+
+        keys = [[]]
+        for dimension in dimensions:
+            keys = [key + [value] for key in keys for value in self.values(dimension, params)]
+        rows = [key + [self.value(metric, key, params.get('filters', '')) for metric in metrics] for key in keys]
+
+        for field in reversed([name for name in (params.get('sort') or '').split(',') if name]):
+            position = [header['name'] for header in headers].index(field.lstrip('-'))
+            rows.sort(key=lambda row: row[position], reverse=field.startswith('-'))
+        if params.get('maxResults'):
+            rows = rows[:int(params['maxResults'])]
+
+        response = {'kind': 'youtubeAnalytics#resultTable', 'columnHeaders': headers}
+        if rows:
+            response['rows'] = rows
+        return response
+
+    @staticmethod
+    def values(dimension: str, params: Dict[str, Any]) -> List[str]:
+        if dimension == 'day':
+            first, last = date.fromisoformat(params['startDate']), date.fromisoformat(params['endDate'])
+            return [(first + timedelta(days=offset)).isoformat() for offset in range((last - first).days + 1)]
+        if dimension == 'country':
+            return list(COUNTRIES)
+        return [f"{dimension}{index}" for index in range(3)]
+
+    @staticmethod
+    def value(metric: str, key: List[str], filters: str) -> Any:
+        seed = zlib.crc32(f"{metric}|{'|'.join(key)}|{filters}".encode()) % 1000
+        return seed if metric in INTEGER_METRICS else round(seed / 7, 3)
+
+
+@pytest.fixture
+def analytics() -> FakeAnalytics:
+    return FakeAnalytics()
@@ -0,0 +1,92 @@
+import random
+
+import numpy as np
+
+from benchmarks.synthetic import synthetic_video, BOILERPLATE
+from src.analytics.aggregation import ContentSketch, DescriptionSketch, ViewsDistribution
+from src.analytics.content_index import ContentIndex
+from src.analytics.similarity import DescriptionIndex
+
+
+def _videos(count, seed=0):
+    rng = random.Random(seed)
+    return [synthetic_video(rng, position) for position in range(count)]
+
+
+def test_views_distribution_is_exact_then_within_a_bin():
+    values = [float(value) for value in random.Random(1).sample(range(1, 10 ** 6), 5000)]
+    small, large = ViewsDistribution(exact=32), ViewsDistribution(exact=32)
+    for value in values[:31]:
+        small.add(value)
+    for value in values:
+        large.add(value)
+
+    assert small.median() == np.median(values[:31])
+    assert large.histogram is not None and not len(large.values)
+    assert abs(large.median() / np.median(values) - 1) < 0.05
+
+
+def test_views_distribution_merge_matches_adding_everything():
+    left, right, both = ViewsDistribution(exact=8), ViewsDistribution(exact=8), ViewsDistribution(exact=8)
+    for value in range(1, 21):
+        (left if value % 2 else right).add(float(value * 100))
+        both.add(float(value * 100))
+    left.merge(right)
+
+    assert left.count == both.count == 20
+    assert left.median() == both.median()
+
+
+def test_content_sketch_matches_content_index_on_small_groups():
+    videos = _videos(30)
+    index, sketch = ContentIndex(), ContentSketch()
+    for video in videos:
+        index.add(video)
+        sketch.add(video)
+
+    exact, approximate = index.analyze(limit=None), sketch.analyze(limit=None)
+    assert approximate['baseline'] == exact['baseline']
+    for kind in ('tags', 'terms'):
+        assert {group['group']: group['videos'] for group in approximate[kind]} == \
+            {group['group']: group['videos'] for group in exact[kind]}
+
+
+def test_content_sketch_stays_within_max_groups():
+    sketch = ContentSketch(max_groups=50)
+    for position, video in enumerate(_videos(400)):
+        video['tags'] = video['tags'] + [f"unique{position}"]
+        sketch.add(video)
+
+    assert all(len(groups) <= 50 for groups in sketch.groups_by_kind.values())
+    # Evictions take single-video groups, so recurring tags survive the unique ones
+    assert {group['group'] for group in sketch.groups('tag', limit=None)} <= set(sketch.groups_by_kind['tag'])
+    assert sketch.groups('tag', limit=None)
+
+
+def test_description_sketch_finds_boilerplate_and_labels_videos():
+    videos = _videos(200)
+    index, sketch = DescriptionIndex(), DescriptionSketch()
+    for video in videos:
+        index.add(video)
+        sketch.add(video)
+
+    exact, approximate = index.analyze(), sketch.analyze()
+    assert [(block['videos'], block['text']) for block in approximate['boilerplate']] == \
+        [(block['videos'], block['text']) for block in exact['boilerplate']]
+    assert {block['text'] for block in approximate['boilerplate']} <= set(BOILERPLATE)
+
+    labels = approximate['block_labels']
+    for video in videos:
+        marks = [labels.get(str(block)) for block in video['description_blocks']]
+        assert marks == exact['video_blocks'].get(str(video['id']), [None] * len(marks))
+
+
+def test_description_sketch_stays_within_its_caps():
+    sketch = DescriptionSketch(max_templates=20, max_blocks=30)
+    for video in _videos(300):
+        sketch.add(video)
+
+    assert len(sketch.templates.clusters) <= 20
+    assert len(sketch.blocks.clusters) <= 30
+    assert len(sketch.templates.signatures) <= 20 * sketch.templates.representatives
+    assert sketch.analyze()['boilerplate']
@@ -0,0 +1,70 @@
+import pytest
+
+from benchmarks import compare, load_baseline, missing, save_baseline
+import main
+
+RESULTS = {'hot_paths': {'trends_1000': {'ms': 20.0, 'peak_kib': 100.0}, 'format_1000': {'ms': 5.0}}}
+
+
+def test_missing_lists_suites_and_cases_without_measurements():
+    assert missing(RESULTS, {}) == ['hot_paths']
+    assert missing(RESULTS, {'hot_paths': {'trends_1000': {'ms': 20.0}}}) == ['hot_paths/format_1000']
+    assert missing(RESULTS, RESULTS) == []
+
+
+def test_compare_flags_regressions_past_threshold_and_noise_floor():
+    baseline = {'hot_paths': {'trends_1000': {'ms': 10.0, 'peak_kib': 90.0}, 'format_1000': {'ms': 4.5}}}
+    regressions = compare(RESULTS, baseline)
+    assert [(r['case'], r['metric'], r['change_pct']) for r in regressions] == [('trends_1000', 'ms', 100.0)]
+
+
+@pytest.fixture
+def bench(monkeypatch, tmp_path):
+    monkeypatch.setattr('benchmarks.SUITES', {'hot_paths': lambda repeat, **options: RESULTS['hot_paths']})
+    path = str(tmp_path / 'baseline.json')
+
+    def run(*flags):
+        return main.main(['bench', '--baseline', path, *flags])
+    return path, run
+
+
+def test_missing_baseline_warns_and_fails_only_when_required(bench, capsys):
+    path, run = bench
+    run()
+    assert 'no baseline' in capsys.readouterr().err
+    with pytest.raises(SystemExit) as exit_info:
+        run('--require-baseline')
+    assert exit_info.value.code == 1
+
+    save_baseline(path, {'hot_paths': {'trends_1000': RESULTS['hot_paths']['trends_1000']}})
+    with pytest.raises(SystemExit):
+        run('--require-baseline')
+    assert 'hot_paths/format_1000' in capsys.readouterr().err
+
+    save_baseline(path, RESULTS)
+    run('--require-baseline')
+    assert load_baseline(path) == RESULTS
+
+
+def test_regression_from_a_zero_baseline_is_reported(bench, capsys):
+    path, run = bench
+    save_baseline(path, {'hot_paths': {
+        'trends_1000': {'ms': 0.0, 'peak_kib': 100.0}, 'format_1000': {'ms': 5.0}
+    }})
+    regressions = compare(RESULTS, load_baseline(path))
+    assert [(r['metric'], r['change_pct']) for r in regressions] == [('ms', None)]
+
+    with pytest.raises(SystemExit) as exit_info:
+        run()
+    assert exit_info.value.code == 1
+    assert "REGRESSION hot_paths trends_1000 ms: 0.0 -> 20.0 (new)" in capsys.readouterr().err
+
+
+def test_hot_paths_cover_every_report_formatter():
+    from benchmarks.hot_paths import bench_hot_paths
+    from src.report.stream import SECTION_PAYLOADS
+
+    cases = bench_hot_paths(repeat=1, sizes=(20,))
+    for section in ('anomalies', 'comments', 'forecasts', 'cohorts'):
+        assert section in SECTION_PAYLOADS
+        assert f"formatters.{section}@20" in cases
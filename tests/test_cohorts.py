@@ -0,0 +1,76 @@
+import numpy as np
+
+from src.analytics.cohorts import CohortMatrix
+
+PUBLISHED = 20000
+
+
+def _sync(matrix, video_id, published_day, today, daily_views, lag_days=3):
+    """Fetch what pending() asks for from a full daily series, as CohortAnalytics does."""
+    window = matrix.pending(video_id, published_day, today, lag_days)
+    if window is None:
+        return None
+    first, last, settled = window
+    days = [published_day + column for column in range(first, last + 1) if daily_views[column]]
+    views = [daily_views[day - published_day] for day in days]
+    matrix.update(video_id, video_id.upper(), published_day, first, last, settled, days, views)
+    return window
+
+
+def test_pending_fetches_new_videos_from_publish_and_then_only_unsettled_days():
+    matrix = CohortMatrix(days=10)
+    assert matrix.pending('a', PUBLISHED, PUBLISHED - 1) is None
+    assert matrix.pending('a', PUBLISHED, PUBLISHED + 5) == (0, 5, 3)
+
+    _sync(matrix, 'a', PUBLISHED, PUBLISHED + 5, [10] * 10)
+    assert matrix.pending('a', PUBLISHED, PUBLISHED + 7) == (3, 7, 5)
+    # The curve ends at `days`; once all of it is settled nothing is fetched
+    assert matrix.pending('a', PUBLISHED, PUBLISHED + 30) == (3, 9, 10)
+    _sync(matrix, 'a', PUBLISHED, PUBLISHED + 30, [10] * 10)
+    assert matrix.pending('a', PUBLISHED, PUBLISHED + 31) is None
+
+
+def test_update_zero_fills_days_without_rows_and_leaves_later_days_unreached():
+    matrix = CohortMatrix(days=6)
+    matrix.update('a', 'A', PUBLISHED, 0, 3, 1, [PUBLISHED, PUBLISHED + 2], [5, 7])
+    row = matrix.views[matrix.rows['a']]
+    np.testing.assert_array_equal(row[:4], [5, 0, 7, 0])
+    assert np.isnan(row[4:]).all()
+    assert matrix.settled[matrix.rows['a']] == 1
+
+    # A later publish date starts the curve over
+    matrix.update('a', 'A', PUBLISHED + 1, 0, 1, 0, [PUBLISHED + 1], [9])
+    row = matrix.views[matrix.rows['a']]
+    assert row[0] == 9 and row[1] == 0 and np.isnan(row[2:]).all()
+    assert matrix.pending('a', PUBLISHED + 1, PUBLISHED + 10) == (0, 5, 6)
+
+
+def test_analyze_ignores_the_zero_filled_unsettled_tail():
+    matrix = CohortMatrix(days=10)
+    today = PUBLISHED + 20
+    for number in range(5):
+        _sync(matrix, f"old{number}", PUBLISHED, today, [100 + number] * 10)
+    # Six days old: days 4-6 are not reported yet, so update() stores them as zeros
+    young = PUBLISHED + 15
+    _sync(matrix, 'young', young, today, [200, 200, 0, 0, 0] + [0] * 5)
+
+    analysis = matrix.analyze(min_peers=5)
+    # Ranked at its last settled day (day 3), where it leads its peers, not at day 6 behind them
+    entry = next(entry for entry in analysis['leaders'] if entry['id'] == 'young')
+    assert (entry['day'], entry['views'], entry['percentile']) == (3, 400, 100)
+    assert 'young' not in [entry['id'] for entry in analysis['laggards']]
+    # Cohort percentiles at day 7 only count videos settled there
+    assert [entry['videos'] for entry in analysis['curve']] == [6, 5]
+
+
+def test_save_and_load_round_trip(tmp_path):
+    path = str(tmp_path / 'cohorts.npz')
+    matrix = CohortMatrix(days=10)
+    _sync(matrix, 'a', PUBLISHED, PUBLISHED + 5, [10] * 10)
+    matrix.save(path)
+
+    loaded = CohortMatrix.load(path, days=10)
+    assert loaded.video_ids == ['a'] and loaded.titles == ['A']
+    np.testing.assert_array_equal(loaded.views[:1], matrix.views[:1])
+    # A longer curve keeps the stored days and leaves the new ones to fetch
+    assert CohortMatrix.load(path, days=20).pending('a', PUBLISHED, PUBLISHED + 5) == (3, 5, 3)
@@ -0,0 +1,131 @@
+import pytest
+
+from src.analytics.comments import CommentAnalytics, CommentStore
+from tests.conftest import FakeRequest
+
+
+class FakeYouTube:
+    """commentThreads().list over one video's threads, newest published first, in pages of page_size."""
+
+    def __init__(self, page_size=2):
+        self.threads = {}
+        self.page_size = page_size
+        self.calls = []
+
+    def add(self, thread_id, published_at, text='hi', updated_at=None):
+        self.threads[thread_id] = {
+            'id': thread_id,
+            'snippet': {
+                'totalReplyCount': 0,
+                'topLevelComment': {'snippet': {
+                    'authorDisplayName': 'fan', 'textDisplay': text, 'likeCount': 1,
+                    'publishedAt': published_at, 'updatedAt': updated_at or published_at
+                }}
+            }
+        }
+
+    def edit(self, thread_id, text, updated_at):
+        self.threads[thread_id]['snippet']['topLevelComment']['snippet'].update(
+            textDisplay=text, updatedAt=updated_at
+        )
+
+    def commentThreads(self):
+        return self
+
+    def list(self, videoId, pageToken=None, **params):
+        self.calls.append(pageToken)
+        items = sorted(
+            self.threads.values(),
+            key=lambda item: item['snippet']['topLevelComment']['snippet']['publishedAt'], reverse=True
+        )
+        start = int(pageToken or 0)
+        response = {'items': items[start:start + self.page_size]}
+        if start + self.page_size < len(items):
+            response['nextPageToken'] = str(start + self.page_size)
+        return FakeRequest(response)
+
+
+@pytest.fixture
+def youtube():
+    youtube = FakeYouTube()
+    for day in range(1, 7):
+        youtube.add(f"t{day}", f"2026-01-0{day}T00:00:00Z")
+    return youtube
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = CommentStore(str(tmp_path / 'comments.sqlite'))
+    yield store
+    store.close()
+
+
+def _sync(youtube, store, comments=6):
+    youtube.calls = []
+    sync = CommentAnalytics(lambda: youtube, store, workers=1)
+    list(sync.iter_sync([{'id': 'v', 'stats': {'comments': comments}}]))
+    return sync.stats
+
+
+def _texts(store):
+    return dict(store.conn.execute("SELECT id, text FROM threads").fetchall())
+
+
+def test_first_sync_is_full_and_sets_the_watermark(youtube, store):
+    stats = _sync(youtube, store)
+    assert youtube.calls == [None, '2', '4']
+    assert stats['full_syncs'] == 1 and stats['threads_changed'] == 6
+    assert store.sync_state('v')[0] == '2026-01-06T00:00:00Z'
+
+
+def test_delete_and_add_with_unchanged_count_is_picked_up(youtube, store):
+    _sync(youtube, store)
+    del youtube.threads['t2']
+    youtube.add('t7', '2026-01-07T00:00:00Z')
+
+    stats = _sync(youtube, store)
+    # Paging stops at the first page with a thread older than the watermark, well before the end
+    assert youtube.calls == [None, '2']
+    assert stats['full_syncs'] == 0 and stats['threads_changed'] == 1
+    assert 't7' in _texts(store)
+    assert store.sync_state('v')[0] == '2026-01-07T00:00:00Z'
+
+
+def test_edits_on_fetched_pages_are_stored(youtube, store):
+    _sync(youtube, store)
+    youtube.edit('t6', 'edited', '2026-01-08T00:00:00Z')
+    youtube.add('t7', '2026-01-07T00:00:00Z')
+
+    stats = _sync(youtube, store)
+    assert stats['threads_changed'] == 2
+    assert _texts(store)['t6'] == 'edited'
+
+
+def test_full_sync_catches_old_edits_and_removes_deleted_threads(youtube, store):
+    _sync(youtube, store)
+    youtube.edit('t1', 'edited', '2026-01-08T00:00:00Z')
+    del youtube.threads['t3']
+
+    # Past the watermark pages, an old edit waits for the next full sync
+    _sync(youtube, store)
+    assert _texts(store)['t1'] == 'hi'
+
+    with store.conn:
+        store.conn.execute("UPDATE sync_state SET full_sync_at = '2000-01-01T00:00:00Z'")
+    stats = _sync(youtube, store)
+    assert stats['full_syncs'] == 1 and stats['threads_removed'] == 1
+    texts = _texts(store)
+    assert texts['t1'] == 'edited' and 't3' not in texts
+
+
+def test_videos_without_comments_are_skipped_unless_threads_are_stored(youtube, store):
+    empty = FakeYouTube()
+    stats = _sync(empty, store, comments=0)
+    assert stats['videos_skipped'] == 1 and empty.calls == []
+
+    _sync(youtube, store)
+    youtube.threads.clear()
+    with store.conn:
+        store.conn.execute("UPDATE sync_state SET full_sync_at = '2000-01-01T00:00:00Z'")
+    stats = _sync(youtube, store, comments=0)
+    assert stats['threads_removed'] == 6 and store.total_threads() == 0
@@ -0,0 +1,61 @@
+from array import array
+from datetime import datetime
+
+from src.analytics.channel import ChannelAnalytics
+from src.analytics.comparison import PeriodComparison, SETTLE_DAYS, fetch_span, settled_day
+from src.analytics.video import VideoAnalytics
+from src.api.query_merger import QueryMerger
+from src.api.rows import ReportTable, to_epoch_day
+
+TODAY = 20000
+
+
+def _lagging_history(days=200, views=100):
+    """Steady daily views whose last SETTLE_DAYS days the API has not reported yet."""
+    first = TODAY - days + 1
+    return ReportTable({
+        'day': array('l', range(first, TODAY + 1)),
+        'views': array('q', (views if day <= TODAY - SETTLE_DAYS else 0 for day in range(first, TODAY + 1)))
+    }, ['day'])
+
+
+def test_settled_anchor_compares_complete_equal_windows():
+    history = _lagging_history()
+    settled = PeriodComparison(history, settled_day(TODAY)).compare(7)['views']
+    assert (settled['current'], settled['previous'], settled['change_pct']) == (700, 700, 0)
+
+    # Anchored at today, the unreported days read as a drop
+    assert PeriodComparison(history, TODAY).compare(7)['views']['change_pct'] < -40
+
+
+def test_fetch_span_covers_both_windows_before_the_settled_day():
+    span = fetch_span((7, 28, 90))
+    first_needed = settled_day(TODAY) - 2 * 90 + 1
+    assert TODAY - span <= first_needed
+
+
+def test_video_comparison_and_history_still_share_one_query(analytics):
+    merger = QueryMerger(analytics)
+    video = VideoAnalytics(None, merger)
+    comparison = video.get_period_comparison('a')
+    history = video.get_view_history('a', fetch_span((7, 28, 90)))
+
+    assert merger.stats == {'requested': 2, 'issued': 1, 'merged': 1}
+    # Both are fetched through today; the history is cut at the settled day afterwards
+    assert analytics.calls[0]['endDate'] == datetime.now().strftime('%Y-%m-%d')
+    today = to_epoch_day(datetime.now().strftime('%Y-%m-%d'))
+    assert max(history['day']) == settled_day(today)
+    views = dict(zip(history['day'], history['views']))
+    current = sum(views.get(day, 0) for day in range(settled_day(today) - 6, settled_day(today) + 1))
+    assert comparison['7d']['views']['current'] == current
+
+
+def test_channel_period_ends_on_the_settled_day(analytics):
+    stats = ChannelAnalytics(None, analytics).get_period_analytics(days=30)
+    today = to_epoch_day(datetime.now().strftime('%Y-%m-%d'))
+    days = list(stats['daily_data']['day'])
+    assert len(days) == 31 and days[-1] == settled_day(today)
+    assert max(stats['history']['day']) == settled_day(today)
+    assert stats['total_views'] == stats['comparison']['28d']['views']['current'] + sum(
+        stats['daily_data']['views'][:3]
+    )
@@ -0,0 +1,109 @@
+import logging
+
+import main
+from config.settings import Settings
+from src.pipeline import FetchPlanner
+from tests.conftest import FakeRequest
+
+
+class NotModified(Exception):
+    """googleapiclient's HttpError for a 304 as ConditionalCache reads it."""
+
+    def __init__(self):
+        super().__init__("HTTP 304")
+        self.resp = type('Response', (), {'status': 304})()
+
+
+class HttpRequest:
+    """An API request with a URI and headers; answers 304 when If-None-Match holds the current ETag."""
+
+    def __init__(self, youtube, uri, response):
+        self.youtube = youtube
+        self.uri = uri
+        self.headers = {}
+        self.response = response
+
+    def execute(self):
+        sent = self.headers.get('If-None-Match')
+        modified = sent != self.response['etag']
+        self.youtube.calls.append((self.uri, sent, modified))
+        if not modified:
+            raise NotModified()
+        return self.response
+
+
+class FakeYouTube:
+    """Data API over a one-video channel; a listing's ETag changes with its content, as the API's does."""
+
+    def __init__(self):
+        self.subscribers = 5
+        self.views = 10
+        self.title = 'First'
+        self.calls = []
+
+    @staticmethod
+    def _resource(**content):
+        return {'etag': repr(sorted(content.items())), **content}
+
+    def channels(self):
+        return self
+
+    def videos(self):
+        return self
+
+    def search(self):
+        return self
+
+    def list(self, part, **params):
+        if 'forMine' in params:
+            return FakeRequest({'items': [{'id': {'videoId': 'a'}}]})
+        if 'mine' in params:
+            return HttpRequest(self, 'channels?part=statistics', self._resource(items=[{'statistics': {
+                'subscriberCount': str(self.subscribers), 'viewCount': '100', 'videoCount': '1'
+            }}]))
+        if part == 'statistics':
+            self.calls.append(('videos?part=statistics', None, True))
+            return FakeRequest({'items': [{'id': 'a', 'statistics': {'viewCount': str(self.views)}}]})
+        return HttpRequest(self, f"videos?part={part}&id={params['id']}", self._resource(items=[{
+            'id': 'a',
+            'snippet': {'title': self.title, 'publishedAt': '2026-01-01T00:00:00Z', 'description': 'about'},
+            'contentDetails': {'duration': 'PT1M'}
+        }]))
+
+
+def _gather(youtube, analytics, tmp_path):
+    config = Settings.load()
+    config.update(state_dir=str(tmp_path), max_videos=1, streaming=False)
+    plan = FetchPlanner(['channel_overview'], ['video_metrics']).plan()
+    youtube.calls = []
+    return main.gather_analytics_data(youtube, analytics, config, plan)
+
+
+def test_second_gather_serves_unchanged_resources_from_the_cache(analytics, tmp_path, caplog):
+    youtube = FakeYouTube()
+    first = _gather(youtube, analytics, tmp_path)
+    assert [modified for _, _, modified in youtube.calls] == [True, True, True]
+
+    youtube.views = 12
+    with caplog.at_level(logging.INFO):
+        second = _gather(youtube, analytics, tmp_path)
+
+    # Channel statistics and the page's snippets come back 304; counts are always fetched
+    assert [(uri, bool(sent), modified) for uri, sent, modified in youtube.calls] == [
+        ('channels?part=statistics', True, False),
+        ('videos?part=snippet,contentDetails&id=a', True, False),
+        ('videos?part=statistics', False, True)
+    ]
+    assert second['channel_stats'] == first['channel_stats']
+    assert second['videos'][0]['title'] == 'First' and second['videos'][0]['stats']['views'] == 12
+    assert 'Conditional fetches: 2/2 not modified' in caplog.text
+
+
+def test_changed_resources_are_fetched_again(analytics, tmp_path):
+    youtube = FakeYouTube()
+    _gather(youtube, analytics, tmp_path)
+    youtube.subscribers, youtube.title = 6, 'Renamed'
+
+    data = _gather(youtube, analytics, tmp_path)
+    assert [modified for _, _, modified in youtube.calls] == [True, True, True]
+    assert data['channel_stats']['subscriber_count'] == 6 and data['videos'][0]['title'] == 'Renamed'
@@ -0,0 +1,57 @@
+import statistics
+
+from src.analytics.content_index import ContentIndex, content_keys, tokenize
+
+
+def _video(index, tags, title, views, likes=10, description='No description available.'):
+    return {'id': f"v{index}", 'title': title, 'tags': tags, 'description': description,
+            'stats': {'views': views, 'likes': likes}, 'performance': {'watch_time': views / 10}}
+
+
+VIDEOS = [
+    _video(0, ['Tutorial', 'python'], 'Python tutorial basics', 900),
+    _video(1, ['tutorial '], 'Another tutorial', 700),
+    _video(2, ['TUTORIAL', 'vlog'], 'Tutorial day', 800),
+    _video(3, ['vlog'], 'Weekend vlog', 100),
+    _video(4, ['vlog'], 'Morning vlog', 200),
+    _video(5, ['vlog', 'python'], 'Evening vlog', 150),
+    _video(6, [], 'Unboxing', 300, description='A quick unboxing of the new camera'),
+]
+
+
+def test_tokenize_drops_stopwords_numbers_and_short_words():
+    assert tokenize("The 10 best Python tips, and why it's OK") == ['best', 'python', 'tips']
+    assert content_keys(VIDEOS[1]) == {'tag': {'tutorial'}, 'term': {'another', 'tutorial'}}
+    assert 'camera' in content_keys(VIDEOS[6])['term']
+
+
+def test_groups_match_a_brute_force_aggregate():
+    index = ContentIndex()
+    for video in VIDEOS:
+        index.add(video)
+    median = statistics.median(video['stats']['views'] for video in VIDEOS)
+
+    groups = {group['group']: group for group in index.groups('tag', min_videos=3)}
+    # vlog is on 4 of 7 videos, above the boilerplate share
+    assert set(groups) == {'tutorial'}
+    tutorial = [video for video in VIDEOS if 'tutorial' in {tag.strip().lower() for tag in video['tags']}]
+    assert groups['tutorial']['videos'] == 3
+    assert groups['tutorial']['median_views'] == statistics.median(video['stats']['views'] for video in tutorial)
+    assert groups['tutorial']['engagement_rate'] == 30 / 2400 * 100
+    assert groups['tutorial']['avg_watch_time'] == 80.0
+    assert groups['tutorial']['lift'] == 800 / median
+
+
+def test_groups_are_ranked_by_lift_and_respect_min_videos():
+    index = ContentIndex(max_share=1.0)
+    for video in VIDEOS:
+        index.add(video)
+
+    tags = index.groups('tag', min_videos=2)
+    assert [group['group'] for group in tags] == ['tutorial', 'python', 'vlog']
+    assert index.positions('Python') == [0, 5]
+    assert [group['group'] for group in index.groups('term', min_videos=3)] == ['tutorial', 'vlog']
+
+
+def test_empty_index_has_no_section():
+    assert ContentIndex().analyze() == {}
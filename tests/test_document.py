@@ -0,0 +1,117 @@
+from src.report.document import DocumentBuilder, Table, Text, utf16_len
+
+# Structural elements of a table take one index each, like in a Docs body
+TABLE, ROW, CELL = '\x00T', '\x00R', '\x00C'
+
+
+class FakeDocument:
+    """
+    Docs body applying a batchUpdate's requests in order, indexed in UTF-16 code units.
+
+    A character outside the BMP takes two units; insertTable adds a newline,
+    then the table, each row and each cell as one unit, each cell holding an
+    empty paragraph. Style requests record the text of their range as it is
+    when they are applied.
+    """
+
+    def __init__(self):
+        # Index 0 is the body's section break; content starts at 1
+        self.units = ['\x00S']
+        self.bold = []
+        self.headings = []
+
+    def apply(self, requests):
+        for request in requests:
+            if 'insertText' in request:
+                self._insert(request['insertText']['location']['index'], self._split(request['insertText']['text']))
+            elif 'insertTable' in request:
+                table = request['insertTable']
+                units = ['\n', TABLE]
+                for _ in range(table['rows']):
+                    units.append(ROW)
+                    for _ in range(table['columns']):
+                        units += [CELL, '\n']
+                self._insert(table['location']['index'], units)
+            elif 'updateTextStyle' in request:
+                self.bold.append(self.text(request['updateTextStyle']['range']))
+            elif 'updateParagraphStyle' in request:
+                style = request['updateParagraphStyle']['paragraphStyle']['namedStyleType']
+                self.headings.append((style, self.text(request['updateParagraphStyle']['range'])))
+        return self
+
+    def text(self, span=None):
+        units = self.units[span['startIndex']:span['endIndex']] if span else self.units[1:]
+        return ''.join(units)
+
+    def _insert(self, index, units):
+        assert 1 <= index <= len(self.units), f"insert at {index} past the end ({len(self.units)})"
+        self.units[index:index] = units
+
+    @staticmethod
+    def _split(text):
+        # A surrogate pair keeps the character in its first unit and an empty second one
+        units = []
+        for char in text:
+            units.append(char)
+            if utf16_len(char) == 2:
+                units.append('')
+        return units
+
+
+def test_utf16_len_counts_surrogate_pairs():
+    assert utf16_len('abc') == 3
+    assert utf16_len('é') == 1
+    assert utf16_len('📈') == 2
+
+
+def test_labels_and_headings_land_on_their_text_after_emoji():
+    builder = DocumentBuilder()
+    builder.title('📊 Channel Report')
+    builder.add({'insertText': {'text': "📈 Overview\nViews: 1,234 👀\nTop Commenters:\n- 🎉 Fan: hi\n"}})
+    builder.add(Text("Quoted 🎬 description: not a label\n"))
+    builder.add({'insertText': {'text': "Subscribers: 56\n\n"}})
+    document = FakeDocument().apply(builder.requests)
+
+    assert document.text() == builder.text
+    assert builder.index == 1 + utf16_len(builder.text)
+    assert document.headings == [('HEADING_1', '📊 Channel Report\n'), ('HEADING_2', '📈 Overview\n'),
+                                 ('HEADING_2', 'Subscribers: 56\n')]
+    # Bullet lines and free text get no bold label
+    assert document.bold == ['Views:', 'Top Commenters:']
+
+
+def test_only_first_section_request_of_a_list_is_a_heading():
+    builder = DocumentBuilder()
+    builder.add([
+        {'insertText': {'text': "Comments\n"}},
+        {'insertText': {'text': "Likes: 3\n"}}
+    ])
+    document = FakeDocument().apply(builder.requests)
+    assert document.headings == [('HEADING_2', 'Comments\n')]
+    assert document.bold == ['Likes:']
+
+
+def test_table_cells_and_header_bold_use_final_offsets():
+    builder = DocumentBuilder()
+    builder.add({'insertText': {'text': "🌍 Geography\n"}})
+    builder.add(Table([['Country', 'Views 👀', 'Share'], ['🇺🇸 US', '1,000', ''], ['BR', '5']]))
+    builder.add({'insertText': {'text': "After: table\n"}})
+    document = FakeDocument().apply(builder.requests)
+
+    cells = document.text().split(TABLE, 1)[1]
+    rows = [
+        [cell.rstrip('\n') for cell in row.split(CELL)[1:]]
+        for row in cells.split('After')[0].split(ROW)[1:]
+    ]
+    assert rows == [['Country', 'Views 👀', 'Share'], ['🇺🇸 US', '1,000', ''], ['BR', '5', '']]
+    assert document.bold == ['Country', 'Views 👀', 'Share']
+    assert document.headings[-1] == ('HEADING_2', 'After: table\n')
+    # The running index continues right after the table
+    assert document.text().endswith('\nAfter: table\n')
+    assert builder.index == len(document.units)
+
+
+def test_empty_table_is_skipped():
+    builder = DocumentBuilder()
+    builder.add(Table([]))
+    assert builder.requests == [] and builder.index == 1
@@ -0,0 +1,126 @@
+import json
+
+from src.analytics.channel import ChannelAnalytics
+from src.analytics.comments import CommentAnalytics
+from src.analytics.video import VideoAnalytics
+from src.api.fields import FIELDS
+from tests.conftest import FakeRequest
+
+CHANNEL = {
+    'kind': 'youtube#channelListResponse', 'etag': 'c1', 'pageInfo': {'totalResults': 1},
+    'items': [{'kind': 'youtube#channel', 'etag': 'i1', 'id': 'UC1', 'statistics': {
+        'viewCount': '1000', 'subscriberCount': '50', 'hiddenSubscriberCount': False, 'videoCount': '4'
+    }}]
+}
+
+VIDEO = {
+    'kind': 'youtube#video', 'etag': 'v1', 'id': 'a',
+    'snippet': {
+        'title': 'First', 'publishedAt': '2026-01-01T00:00:00Z', 'description': 'about', 'tags': ['tag'],
+        'channelId': 'UC1', 'thumbnails': {'default': {'url': 'https://i.ytimg.com/a.jpg'}},
+        'localized': {'title': 'First', 'description': 'about'}
+    },
+    'contentDetails': {'duration': 'PT1M5S', 'definition': 'hd', 'caption': 'false'},
+    'statistics': {'viewCount': '10', 'likeCount': '2', 'commentCount': '1', 'favoriteCount': '0'}
+}
+
+THREAD = {
+    'kind': 'youtube#commentThread', 'etag': 't1', 'id': 't1',
+    'snippet': {
+        'videoId': 'a', 'totalReplyCount': 2, 'canReply': True,
+        'topLevelComment': {'id': 'c1', 'snippet': {
+            'authorDisplayName': 'Ann', 'authorChannelUrl': 'https://youtube.com/ann', 'textDisplay': 'Nice',
+            'textOriginal': 'Nice', 'likeCount': 3, 'publishedAt': '2026-01-02T00:00:00Z',
+            'updatedAt': '2026-01-03T00:00:00Z'
+        }}
+    }
+}
+
+
+def _mask(fields, position=0):
+    """Parse a fields mask ('a/b,c(d,e)') into a tree of selected keys; None selects everything below."""
+    tree = {}
+    while position < len(fields):
+        node = tree
+        while True:
+            end = position
+            while end < len(fields) and fields[end] not in ',/()':
+                end += 1
+            name, position = fields[position:end], end
+            if fields[position:position + 1] == '/':
+                node, position = node.setdefault(name, {}), position + 1
+                continue
+            if fields[position:position + 1] == '(':
+                selected, position = _mask(fields, position + 1)
+                node.setdefault(name, {}).update(selected)
+            else:
+                node[name] = None
+            break
+        if fields[position:position + 1] == ')':
+            return tree, position + 1
+        if fields[position:position + 1] == ',':
+            position += 1
+    return tree, position
+
+
+def _prune(value, tree):
+    """What the API returns for a resource under a partial-response mask."""
+    if tree is None:
+        return value
+    if isinstance(value, list):
+        return [_prune(item, tree) for item in value]
+    return {key: _prune(value[key], selected) for key, selected in tree.items() if key in value}
+
+
+def partial(response, endpoint):
+    return _prune(response, _mask(FIELDS[endpoint])[0])
+
+
+class YouTube:
+    """Data API answering channels/videos list calls with the partial response their mask selects."""
+
+    def __init__(self):
+        self.calls = []
+
+    def channels(self):
+        return self
+
+    def videos(self):
+        return self
+
+    def list(self, part, fields, **params):
+        self.calls.append((part, fields))
+        endpoint = next(name for name, mask in FIELDS.items() if mask == fields)
+        response = CHANNEL if 'mine' in params else {'kind': 'youtube#videoListResponse', 'items': [VIDEO]}
+        return FakeRequest(partial(response, endpoint))
+
+
+def test_masks_keep_only_what_the_parsers_read():
+    assert partial(CHANNEL, 'channels.list') == {
+        'etag': 'c1', 'items': [{'statistics': {'viewCount': '1000', 'subscriberCount': '50', 'videoCount': '4'}}]
+    }
+    assert partial({'items': [VIDEO]}, 'videos.list.statistics') == {'items': [{
+        'id': 'a', 'statistics': {'viewCount': '10', 'likeCount': '2', 'commentCount': '1'}
+    }]}
+    for endpoint, response in (('videos.list', {'items': [VIDEO]}), ('commentThreads.list', {'items': [THREAD]})):
+        assert len(json.dumps(partial(response, endpoint))) < len(json.dumps(response)) * 0.75
+
+
+def test_parsers_read_the_same_values_from_partial_responses():
+    videos = VideoAnalytics(YouTube(), None)
+    item = partial({'items': [VIDEO]}, 'videos.list')['items'][0]
+    assert videos._process_video_item(item, False, False) == videos._process_video_item(VIDEO, False, False)
+    assert CommentAnalytics._parse_thread(partial({'items': [THREAD]}, 'commentThreads.list')['items'][0]) == \
+        CommentAnalytics._parse_thread(THREAD)
+    assert ChannelAnalytics(YouTube(), None).get_basic_stats() == {
+        'subscriber_count': 50, 'view_count': 1000, 'video_count': 4
+    }
+
+
+def test_split_listing_merges_fresh_statistics_into_cached_details():
+    youtube = YouTube()
+    cache = type('Cache', (), {'execute': staticmethod(lambda request: request.execute())})()
+    page = VideoAnalytics(youtube, None, cache=cache)._list_videos(['a'])
+
+    assert [part for part, _ in youtube.calls] == ['snippet,contentDetails', 'statistics']
+    assert page == partial({'items': [VIDEO]}, 'videos.list')
@@ -0,0 +1,49 @@
+import math
+from array import array
+
+import numpy as np
+
+from src.analytics.comparison import SETTLE_DAYS, settled_day, through_day
+from src.analytics.forecast import ForecastIndex
+from src.api.rows import ReportTable
+
+TODAY = 20000
+
+
+def _seasonal(days=84, partial=0):
+    """Weekly seasonal daily views through TODAY; the last `partial` days only 30% reported."""
+    first = TODAY - days + 1
+    views = [
+        round((1000 + 300 * math.sin(2 * math.pi * day / 7)) * (0.3 if day > TODAY - partial else 1.0))
+        for day in range(first, TODAY + 1)
+    ]
+    return ReportTable({'day': array('l', range(first, TODAY + 1)), 'views': array('q', views)}, ['day'])
+
+
+def _next_week(day_after):
+    return sum(1000 + 300 * math.sin(2 * math.pi * day / 7) for day in range(day_after + 1, day_after + 8))
+
+
+def test_seasonal_series_is_projected_with_its_weekly_shape():
+    forecasts = ForecastIndex(horizons=(7,)).analyze(_seasonal())
+    week = forecasts['channel']['7d']
+    assert abs(week['views'] / _next_week(TODAY) - 1) < 0.02
+    assert week['low'] <= week['views'] <= week['high']
+    # The daily projection keeps the weekly swing
+    daily = np.asarray(week['daily'])
+    assert daily.max() - daily.min() > 400
+
+
+def test_unsettled_days_are_cut_before_they_drag_the_forecast_down():
+    lagging = _seasonal(partial=SETTLE_DAYS)
+    settled = through_day(lagging, settled_day(TODAY))
+    assert max(settled['day']) == settled_day(TODAY)
+
+    def next_week(history):
+        index = ForecastIndex(horizons=(7,))
+        index.add({'id': 'a', 'title': 'A', 'history': history})
+        return index.analyze()['videos'][0]['7d']['views']
+
+    expected = _next_week(settled_day(TODAY))
+    assert abs(next_week(settled) / expected - 1) < 0.05
+    assert next_week(lagging) < 0.8 * expected
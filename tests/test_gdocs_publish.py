@@ -0,0 +1,131 @@
+import pytest
+
+from src.api.limiter import AdaptiveLimiter
+from src.report import gdocs
+from src.report.gdocs import GDocsReporter
+
+
+class Response(dict):
+    def __init__(self, status):
+        super().__init__()
+        self.status = status
+
+
+class HttpError(Exception):
+    """googleapiclient's HttpError as the limiter reads it: a resp with a status and headers."""
+
+    def __init__(self, status):
+        super().__init__(f"HTTP {status}")
+        self.resp = Response(status)
+
+
+class Request:
+    """An API request doing its work on each execute(), as a retried HttpRequest resends."""
+
+    def __init__(self, send):
+        self.send = send
+
+    def execute(self):
+        return self.send()
+
+
+class FakeDocs:
+    """
+    Docs API over one document body held as text.
+
+    batchUpdate applies deleteContentRange and insertText, rejecting a
+    range past the end like the API does; lost_responses makes the next
+    batches apply and then fail with a 503, as when the response is lost.
+    """
+
+    def __init__(self, text='old report\n', lost_responses=0):
+        self.text = text
+        self.lost_responses = lost_responses
+        self.calls = []
+
+    def documents(self):
+        return self
+
+    def get(self, documentId, fields=None):
+        return Request(self._get)
+
+    def batchUpdate(self, documentId, body):
+        return Request(lambda: self._batch_update(body))
+
+    def _get(self):
+        self.calls.append('get')
+        return {'body': {'content': [{'endIndex': 1}, {'endIndex': len(self.text) + 1}]}}
+
+    def _batch_update(self, body):
+        self.calls.append('batchUpdate')
+        text = self.text
+        for request in body['requests']:
+            if 'deleteContentRange' in request:
+                span = request['deleteContentRange']['range']
+                if span['endIndex'] > len(text) + 1:
+                    raise HttpError(400)
+                text = text[:span['startIndex'] - 1] + text[span['endIndex'] - 1:]
+            else:
+                index = request['insertText']['location']['index'] - 1
+                text = text[:index] + request['insertText']['text'] + text[index:]
+        self.text = text
+        if self.lost_responses:
+            self.lost_responses -= 1
+            raise HttpError(503)
+        return {}
+
+
+def _reporter(docs):
+    reporter = GDocsReporter()
+    reporter.docs_service = AdaptiveLimiter().wrap(docs, no_retry=('documents.batchUpdate',))
+    return reporter
+
+
+REPORT = [{'insertText': {'location': {'index': 1}, 'text': 'new report, much longer than before\n'}}]
+
+
+@pytest.fixture(autouse=True)
+def no_sleep(monkeypatch):
+    monkeypatch.setattr(gdocs.time, 'sleep', lambda seconds: None)
+    monkeypatch.setattr('src.api.limiter.time.sleep', lambda seconds: None)
+
+
+def test_applied_batch_with_a_lost_response_is_cleared_again_not_duplicated():
+    docs = FakeDocs(lost_responses=1)
+    _reporter(docs).publish('doc', REPORT)
+    # The body's final newline always stays; resending the stale batch would have cut into the new text
+    assert docs.text == 'new report, much longer than before\n\n'
+    # The limiter does not resend the batch; publish re-reads the document first
+    assert docs.calls == ['get', 'batchUpdate', 'get', 'batchUpdate']
+
+
+def test_publish_gives_up_after_its_attempts():
+    docs = FakeDocs(lost_responses=5)
+    with pytest.raises(HttpError):
+        _reporter(docs).publish('doc', REPORT, attempts=2)
+    assert docs.calls.count('batchUpdate') == 2
+
+
+def test_client_errors_are_not_retried():
+    docs = FakeDocs()
+    reporter = _reporter(docs)
+    with pytest.raises(HttpError):
+        reporter.docs_service.documents().batchUpdate(documentId='doc', body={'requests': [
+            {'deleteContentRange': {'range': {'startIndex': 1, 'endIndex': 500}}}
+        ]}).execute()
+    assert docs.calls == ['batchUpdate']
+
+
+def test_reads_are_still_retried_by_the_limiter():
+    docs = FakeDocs()
+    read = docs._get
+    failures = [HttpError(503)]
+
+    def flaky_get():
+        if failures:
+            docs.calls.append('get')
+            raise failures.pop()
+        return read()
+    docs._get = flaky_get
+    assert _reporter(docs)._clear_requests('doc')[0]['deleteContentRange']['range']['endIndex'] == 11
+    assert docs.calls == ['get', 'get']
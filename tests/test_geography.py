@@ -0,0 +1,77 @@
+from array import array
+from datetime import datetime
+
+import numpy as np
+
+from src.analytics.comparison import settled_day
+from src.analytics.geo_cube import GeographyCube
+from src.analytics.geography import GeographyAnalytics
+from src.api.rows import ReportTable, to_epoch_day
+
+
+def _rows(views):
+    return ReportTable({
+        'country': list(views),
+        'watch_time_minutes': array('d', (value * 2.0 for value in views.values())),
+        'views': array('q', views.values())
+    })
+
+
+def _window(call):
+    return to_epoch_day(call['startDate']), to_epoch_day(call['endDate'])
+
+
+def test_current_and_previous_windows_are_disjoint_and_end_on_the_settled_day(analytics):
+    geography = GeographyAnalytics(analytics)
+    geography.get_watch_time_by_country(days=30, limit=None)
+    geography.get_watch_time_by_country(days=30, offset_days=30, limit=None)
+
+    (current_first, current_last), (previous_first, previous_last) = map(_window, analytics.calls)
+    assert current_last == settled_day(to_epoch_day(datetime.now().strftime('%Y-%m-%d')))
+    assert current_last - current_first + 1 == previous_last - previous_first + 1 == 30
+    assert previous_last == current_first - 1
+    assert 'maxResults' not in analytics.calls[0]
+
+
+def test_growth_and_new_markets_from_channel_rows():
+    cube = GeographyCube()
+    cube.add_rows(_rows({'US': 200, 'BR': 50}), period='previous')
+    cube.add_rows(_rows({'US': 300, 'BR': 25, 'IN': 40}))
+    # Video rows do not count towards the totals when channel-wide rows are there
+    cube.add_rows(_rows({'US': 1000, 'JP': 1000}), 'a')
+
+    analysis = cube.analyze()
+    growth = {entry['country']: entry['growth'] for entry in analysis['countries']}
+    assert growth == {'US': 50.0, 'BR': -50.0, 'IN': None}
+    assert analysis['new_markets'] == ['IN'] and analysis['country_count'] == 3
+    assert analysis['concentration_hhi'] == round((300 ** 2 + 25 ** 2 + 40 ** 2) / 365 ** 2, 4)
+
+
+def test_totals_fall_back_to_videos_and_repeated_rows_are_summed():
+    cube = GeographyCube()
+    cube.add_rows(_rows({'US': 30, 'BR': 10}), 'a')
+    cube.add_rows(_rows({'US': 10}), 'a')
+    cube.add_rows(_rows({'BR': 60}), 'b')
+
+    totals = dict(zip(cube.countries, cube.country_totals()))
+    assert totals == {'US': 40, 'BR': 70}
+    # Video a is 40 US + 10 BR once its two US rows are one cell; b is all BR
+    assert cube.video_hhi() == {'a': (40 ** 2 + 10 ** 2) / 50 ** 2, 'b': 1.0}
+    assert np.isnan(cube.growth()).all()
+
+
+def test_video_hhi_matches_a_dense_matrix():
+    rng = np.random.default_rng(0)
+    cube = GeographyCube()
+    countries = [f"C{index}" for index in range(20)]
+    for video in range(50):
+        chosen = rng.choice(countries, size=rng.integers(1, 10), replace=False)
+        cube.add_rows(_rows({country: int(rng.integers(1, 1000)) for country in chosen}), f"v{video}")
+
+    dense = np.zeros((len(cube.countries), len(cube.videos)))
+    countries, videos, values = cube.rows()
+    np.add.at(dense, (countries, videos), values)
+    shares = dense / dense.sum(axis=0)
+    expected = np.square(shares).sum(axis=0)
+    hhi = cube.video_hhi()
+    assert np.allclose([hhi[video] for video in cube.videos], expected)
@@ -0,0 +1,96 @@
+import pytest
+
+from src.pipeline.journal import RunJournal
+
+KEY = RunJournal.make_key(plan='full', day='2026-01-31')
+
+
+class FakeListing:
+    """Pages of a channel's uploads; raises once after fail_after pages to simulate an interruption."""
+
+    def __init__(self, total, page_size=3, fail_after=None):
+        self.videos = [{'id': f"v{position}"} for position in range(total)]
+        self.page_size = page_size
+        self.fail_after = fail_after
+        self.tokens = []
+
+    def fetch_pages(self, remaining, page_token):
+        self.tokens.append(page_token)
+        offset = int(page_token) if page_token else 0
+        pages = 0
+        while offset < len(self.videos) and remaining > 0:
+            if self.fail_after is not None and pages == self.fail_after:
+                self.fail_after = None
+                raise ConnectionError("listing interrupted")
+            size = min(self.page_size, remaining)
+            page = self.videos[offset:offset + size]
+            offset += len(page)
+            remaining -= len(page)
+            pages += 1
+            yield page, str(offset) if offset < len(self.videos) else None
+
+
+def _ids(videos):
+    return [video['id'] for video in videos]
+
+
+def test_steps_are_computed_once_and_replayed_on_resume(tmp_path):
+    path = str(tmp_path / 'journal.sqlite')
+    calls = []
+    journal = RunJournal(path, KEY)
+    assert journal.step('channel_stats', lambda: calls.append(1) or {'views': 10}) == {'views': 10}
+    journal.close()
+
+    resumed = RunJournal(path, KEY, resume=True)
+    assert resumed.step('channel_stats', lambda: calls.append(1) or {'views': 99}) == {'views': 10}
+    assert calls == [1]
+    assert resumed.completed_steps() == ['channel_stats']
+
+
+def test_interrupted_listing_resumes_from_the_saved_page_token(tmp_path):
+    path = str(tmp_path / 'journal.sqlite')
+    listing = FakeListing(10, fail_after=2)
+    journal = RunJournal(path, KEY)
+    with pytest.raises(ConnectionError):
+        list(journal.iter_listing(listing.fetch_pages, 10))
+    assert journal.listed_count() == 6
+    journal.close()
+
+    resumed = RunJournal(path, KEY, resume=True)
+    videos = list(resumed.iter_listing(listing.fetch_pages, 10))
+    assert _ids(videos) == _ids(listing.videos)
+    # Only the pages after the last journaled one are fetched again
+    assert listing.tokens == [None, '6']
+
+    # A finished listing is replayed without fetching
+    assert _ids(resumed.iter_listing(listing.fetch_pages, 10, start=8)) == ['v8', 'v9']
+    assert listing.tokens == [None, '6']
+
+
+def test_enriched_videos_replay_in_order_and_other_runs_are_dropped(tmp_path):
+    path = str(tmp_path / 'journal.sqlite')
+    journal = RunJournal(path, KEY)
+    for position in (2, 0, 1):
+        journal.record_video(position, {'id': f"v{position}", 'stats': {'views': position}})
+    journal.close()
+
+    assert _ids(RunJournal(path, KEY, resume=True).iter_enriched()) == ['v0', 'v1', 'v2']
+    # Another plan or day cannot resume this journal
+    other = RunJournal(path, RunJournal.make_key(plan='full', day='2026-02-01'), resume=True)
+    assert other.enriched_count() == 0
+    other.close()
+    assert RunJournal(path, KEY, resume=True).enriched_count() == 0
+
+
+def test_fresh_run_and_finish_clear_the_journal(tmp_path):
+    path = str(tmp_path / 'journal.sqlite')
+    journal = RunJournal(path, KEY)
+    journal.record_video(0, {'id': 'v0'})
+    journal.record_step('channel_stats', {'views': 1})
+    journal.close()
+
+    fresh = RunJournal(path, KEY)
+    assert fresh.enriched_count() == 0 and fresh.completed_steps() == []
+    fresh.record_video(0, {'id': 'v0'})
+    fresh.finish()
+    assert RunJournal(path, KEY, resume=True).enriched_count() == 0
@@ -0,0 +1,105 @@
+import pytest
+
+from src.api import limiter as limiter_module
+from src.api.limiter import AdaptiveLimiter
+from tests.conftest import FakeRequest
+
+
+class HttpError(Exception):
+    """googleapiclient's HttpError as the limiter reads it: resp.status and content."""
+
+    def __init__(self, status, content=b''):
+        super().__init__(f"HTTP {status}")
+        self.resp = type('Response', (dict,), {'status': status})()
+        self.content = content
+
+
+class Flaky:
+    """A request failing with each of `errors` in turn, then succeeding."""
+
+    def __init__(self, *errors):
+        self.errors = list(errors)
+        self.attempts = 0
+
+    def execute(self):
+        self.attempts += 1
+        if self.errors:
+            raise self.errors.pop(0)
+        return {'ok': True}
+
+
+@pytest.fixture(autouse=True)
+def no_sleep(monkeypatch):
+    delays = []
+    monkeypatch.setattr(limiter_module.time, 'sleep', delays.append)
+    return delays
+
+
+def test_window_grows_additively_while_saturated():
+    limiter = AdaptiveLimiter(initial_limit=1, max_limit=4)
+    limits = []
+    for _ in range(6):
+        # One slot and one caller: every call uses the whole window
+        limiter.call('videos.list', FakeRequest({}).execute)
+        limits.append(limiter.endpoints['videos.list'].limit)
+
+    assert limits == sorted(limits) and limits[0] == 2
+    assert limits[-1] - limits[-2] < 1
+    assert limiter.summary()['videos.list']['peak_limit'] == int(limits[-1])
+
+
+def test_window_stops_at_the_maximum():
+    limiter = AdaptiveLimiter(initial_limit=1, max_limit=2)
+    for _ in range(10):
+        limiter.call('videos.list', FakeRequest({}).execute)
+    assert limiter.endpoints['videos.list'].limit == 2
+
+
+@pytest.mark.parametrize('status', [429, 500, 503])
+def test_throttled_and_server_errors_halve_the_window_and_retry(status, no_sleep):
+    limiter = AdaptiveLimiter(initial_limit=8, min_limit=1)
+    request = Flaky(HttpError(status), HttpError(status))
+
+    assert limiter.call('commentThreads.list', request.execute) == {'ok': True}
+    stats = limiter.summary()['commentThreads.list']
+    assert request.attempts == 3 and len(no_sleep) == 2
+    assert stats['limit'] == 2 and stats['throttled'] == 2 and stats['retries'] == 2 and stats['errors'] == 0
+
+
+def test_rate_limited_403_is_throttling_but_other_403s_are_not():
+    limiter = AdaptiveLimiter(initial_limit=4)
+    rate_limited = HttpError(403, b'{"error": {"errors": [{"reason": "userRateLimitExceeded"}]}}')
+    assert limiter.call('search.list', Flaky(rate_limited).execute) == {'ok': True}
+    assert limiter.endpoints['search.list'].limit == 2
+
+    with pytest.raises(HttpError):
+        limiter.call('videos.list', Flaky(HttpError(403, b'{"error": {"errors": [{"reason": "forbidden"}]}}')).execute)
+    assert limiter.summary()['videos.list']['limit'] == 4 and limiter.summary()['videos.list']['errors'] == 1
+
+
+def test_window_never_drops_below_the_minimum_and_retries_run_out(no_sleep):
+    limiter = AdaptiveLimiter(initial_limit=4, min_limit=1, max_retries=3)
+    request = Flaky(*[HttpError(429)] * 10)
+
+    with pytest.raises(HttpError):
+        limiter.call('videos.list', request.execute)
+    assert request.attempts == 4 and len(no_sleep) == 3
+    assert limiter.endpoints['videos.list'].limit == 1
+
+
+def test_no_retry_endpoints_fail_fast_and_not_modified_is_not_an_error():
+    limiter = AdaptiveLimiter(initial_limit=4)
+    client = limiter.wrap(type('Docs', (), {
+        'documents': lambda self: self,
+        'batchUpdate': lambda self, **kwargs: Flaky(HttpError(503)),
+        'get': lambda self, **kwargs: Flaky(HttpError(304))
+    })(), no_retry=['documents.batchUpdate'])
+
+    with pytest.raises(HttpError):
+        client.documents().batchUpdate(body={}).execute()
+    assert limiter.summary()['documents.batchUpdate']['retries'] == 0
+
+    with pytest.raises(HttpError):
+        client.documents().get(documentId='d').execute()
+    stats = limiter.summary()['documents.get']
+    assert stats['errors'] == 0 and stats['throttled'] == 0 and stats['limit'] == 4
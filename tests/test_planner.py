@@ -0,0 +1,56 @@
+import pytest
+
+from src.api.query_merger import QueryMerger
+from src.pipeline import FetchPlanner
+from src.pipeline.enrichment import VideoEnricher
+
+
+def _video_queries(plan, videos):
+    return sum(
+        row['queries'] for row in plan.estimate(videos)
+        if row['api'] == 'analytics' and row['call'].startswith('video.')
+    )
+
+
+def test_sections_select_their_calls_and_dependencies():
+    plan = FetchPlanner(['forecasts']).plan()
+    assert plan.calls == ['channel.period_analytics', 'video.search', 'video.details', 'video.history']
+    assert FetchPlanner(['channel_overview']).plan().calls == ['channel.basic_stats']
+    # Demographics stay opt-in
+    assert 'video.demographics' not in FetchPlanner().plan().calls
+    assert FetchPlanner(['demographics']).plan().includes('video.demographics')
+    with pytest.raises(ValueError):
+        FetchPlanner(['nope'])
+
+
+def test_estimate_totals_count_pages_videos_and_merged_queries():
+    plan = FetchPlanner(['videos', 'forecasts', 'comments']).plan()
+    rows = {row['call']: row for row in plan.estimate(120)}
+
+    assert (rows['video.search']['queries'], rows['video.search']['quota']) == (3, 300)
+    assert rows['video.comments']['quota'] == 120
+    # History is answered from the comparison query
+    assert rows['video.history']['queries'] == 0 and rows['video.history']['merged_with'] == 'video.comparison'
+    assert rows['video.comparison']['queries'] == 120
+    assert sum(row['quota'] for row in rows.values()) == 300 + rows['video.details']['quota'] + 120
+    # Without the comparison, history issues its own queries
+    assert FetchPlanner(['forecasts']).plan().estimate(120)[-1]['queries'] == 120
+
+
+def test_estimate_matches_the_queries_enrichment_issues(analytics):
+    plan = FetchPlanner(['videos', 'forecasts', 'trends', 'anomalies', 'demographics'], ['video_metrics']).plan()
+    merger = QueryMerger(analytics)
+    enricher = VideoEnricher(None, merger, plan.calls)
+    for number in range(3):
+        enricher.enrich({'id': f"v{number}"})
+    assert merger.stats['issued'] == _video_queries(plan, 3)
+
+
+def test_describe_sizes_columns_to_the_longest_endpoint():
+    lines = FetchPlanner(['comments']).plan().describe(10).splitlines()
+    table = lines[lines.index('') + 1:lines.index('', lines.index('') + 1)]
+    header, rows = table[0], table[1:]
+    comments = next(row for row in rows if row.startswith('video.comments'))
+    assert 'commentThreads.list ' in comments
+    # Every numeric column ends where the header's does
+    assert all(len(row) == len(header) for row in rows)
@@ -0,0 +1,63 @@
+import os
+import time
+
+from src.utils.profiler import StageProfiler
+
+
+def _busy(seconds):
+    end = time.process_time() + seconds
+    total = 0
+    while time.process_time() < end:
+        total += sum(range(200))
+    return total
+
+
+def _profile(**options):
+    profiler = StageProfiler(enabled=True, sample_interval=0.005, **options)
+    profiler.start()
+    with profiler.stage('compute'):
+        _busy(0.3)
+        with profiler.stage('wait'):
+            time.sleep(0.15)
+    profiler.stop()
+    return profiler
+
+
+def test_stages_are_timed_exclusively_and_sampled():
+    profiler = _profile()
+    compute, wait = profiler.stages['compute'], profiler.stages['wait']
+
+    assert compute.calls == wait.calls == 1
+    # Nested stages pause the enclosing one: the sleep is charged to wait only
+    assert compute.cpu > 0.25 and compute.wall >= compute.cpu - 0.01
+    assert wait.wall >= 0.14 and wait.cpu < 0.05
+
+    assert any(stack.startswith('compute;') and '_busy' in stack for stack in profiler.stacks)
+    assert any(stack.startswith('wait;') for stack in profiler.stacks)
+    assert profiler.top_sampled('compute')[0].split(' (')[0] in ('_busy', '<genexpr>')
+    assert compute.profile is None and compute.top_functions() == []
+
+
+def test_sampled_summary_and_output_without_cprofile(tmp_path):
+    profiler = _profile(output_dir=str(tmp_path))
+    summary = profiler.summary()
+    assert '[compute]' in summary and 'samples' in summary
+
+    written = sorted(os.path.basename(path) for path in profiler.write())
+    assert written == ['stacks.collapsed', 'summary.txt']
+
+
+def test_full_profile_adds_cprofile_functions_and_pstats(tmp_path):
+    profiler = _profile(output_dir=str(tmp_path), deterministic=True)
+    assert any('_busy' in entry for entry in profiler.stages['compute'].top_functions())
+    written = sorted(os.path.basename(path) for path in profiler.write())
+    assert written == ['compute.pstats', 'stacks.collapsed', 'summary.txt', 'wait.pstats']
+
+
+def test_disabled_profiler_records_nothing():
+    profiler = StageProfiler()
+    profiler.start()
+    with profiler.stage('compute'):
+        pass
+    profiler.stop()
+    assert profiler.stages == {} and profiler.stacks == {}
@@ -0,0 +1,61 @@
+from src.api.query_merger import QueryMerger
+
+PERIOD = {'ids': 'channel==MINE', 'startDate': '2026-01-01', 'endDate': '2026-01-10', 'dimensions': 'day'}
+
+
+def _query(merger, **params):
+    return merger.reports().query(**params).execute()
+
+
+def test_compatible_queries_are_answered_from_one_request(analytics):
+    merger = QueryMerger(analytics)
+    performance = dict(PERIOD, metrics='estimatedMinutesWatched,averageViewDuration', filters='video==a')
+    engagement = dict(PERIOD, metrics='views,estimatedMinutesWatched', filters='video==a')
+
+    _query(merger, **performance)
+    _query(merger, **engagement)
+    # The union is learned per shape: the next video fetches every metric up front
+    _query(merger, **dict(performance, filters='video==b'))
+    merged = _query(merger, **dict(engagement, filters='video==b'))
+
+    assert merger.stats == {'requested': 4, 'issued': 3, 'merged': 1}
+    assert analytics.calls[2]['metrics'] == 'estimatedMinutesWatched,averageViewDuration,views'
+    assert merged == analytics.respond(dict(engagement, filters='video==b'))
+
+
+def test_projection_keeps_requested_columns_order_sort_and_limit(analytics):
+    merger = QueryMerger(analytics)
+    _query(merger, **dict(PERIOD, metrics='estimatedMinutesWatched,views,likes', sort='day'))
+    peak = dict(PERIOD, metrics='views,estimatedMinutesWatched', sort='-views,day', maxResults=3)
+
+    assert _query(merger, **peak) == analytics.respond(peak)
+    assert merger.stats['issued'] == 1
+
+
+def test_different_windows_and_filters_do_not_merge(analytics):
+    merger = QueryMerger(analytics)
+    _query(merger, **dict(PERIOD, metrics='views', filters='video==a'))
+    _query(merger, **dict(PERIOD, metrics='views', filters='video==b'))
+    _query(merger, **dict(PERIOD, metrics='views', filters='video==a', endDate='2026-01-11'))
+
+    assert merger.stats['issued'] == 3
+
+
+def test_truncated_response_is_not_reused(analytics):
+    merger = QueryMerger(analytics)
+    top = dict(PERIOD, metrics='views', sort='-views', maxResults=2)
+    assert len(_query(merger, **top)['rows']) == 2
+
+    everything = _query(merger, **dict(PERIOD, metrics='views'))
+    assert len(everything['rows']) == 10
+    assert merger.stats['issued'] == 2
+
+
+def test_empty_response_keeps_requested_headers(analytics):
+    merger = QueryMerger(analytics)
+    empty = dict(PERIOD, metrics='views,likes', startDate='2026-01-11')
+    _query(merger, **dict(empty, metrics='views,likes,comments'))
+
+    projected = _query(merger, **empty)
+    assert [header['name'] for header in projected['columnHeaders']] == ['day', 'views', 'likes']
+    assert 'rows' not in projected
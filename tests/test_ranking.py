@@ -0,0 +1,48 @@
+import random
+
+import pytest
+
+from src.analytics.ranking import RankingIndex
+
+
+def _videos(count=200, seed=7):
+    rng = random.Random(seed)
+    return [
+        {
+            'id': f"v{index}",
+            'title': f"Video {index}",
+            'published_ts': 1.7e9 - rng.randint(1, 400) * 86400,
+            'stats': {'views': rng.randint(0, 50) * 100, 'likes': rng.randint(0, 300)},
+            'performance': {'watch_time': rng.random() * 1000, 'avg_percentage_watched': rng.random() * 100},
+            'comments_activity': {'velocity': rng.random() * 5}
+        }
+        for index in range(count)
+    ]
+
+
+@pytest.mark.parametrize('metric', sorted(RankingIndex.METRICS))
+@pytest.mark.parametrize('k', [1, 5, 50, 500])
+def test_top_and_bottom_match_a_full_sort(metric, k):
+    videos = _videos()
+    index = RankingIndex(videos)
+    value = RankingIndex.METRICS[metric]
+
+    # A stable sort keeps ties in insertion order, as the heap selection does
+    top = sorted(videos, key=value, reverse=True)[:k]
+    bottom = sorted(videos, key=value)[:k]
+    assert [video['id'] for video in index.top(metric, k)] == [video['id'] for video in top]
+    assert [video['id'] for video in index.bottom(metric, k)] == [video['id'] for video in bottom]
+
+
+def test_adding_a_known_video_refreshes_its_values():
+    videos = _videos(count=20)
+    index = RankingIndex(videos)
+    leader = dict(videos[3], stats={'views': 10 ** 6, 'likes': 0})
+    index.add(leader)
+
+    assert len(index) == 20
+    assert index.top('views', 1) == [leader]
+    assert index.value(leader, 'engagement_rate') == 0.0
+    assert index.leaderboards(['views'], k=1) == {
+        'views': [{'id': 'v3', 'title': 'Video 3', 'value': 10 ** 6}]
+    }
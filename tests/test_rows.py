@@ -0,0 +1,75 @@
+from array import array
+
+from src.analytics.impressions import ImpressionAnalytics
+from src.api.rows import ReportTable, to_epoch_day
+from tests.conftest import FakeRequest
+
+
+def _headers(*columns):
+    return [
+        {'name': name, 'columnType': 'DIMENSION' if data_type == 'STRING' else 'METRIC', 'dataType': data_type}
+        for name, data_type in columns
+    ]
+
+
+class StubAnalytics:
+    """Analytics client answering every query with one fixed response."""
+
+    def __init__(self, response):
+        self.response = response
+
+    def reports(self):
+        return self
+
+    def query(self, **params):
+        return FakeRequest(self.response)
+
+
+def test_columns_are_found_by_header_and_decoded_by_type():
+    table = ReportTable.from_response({
+        'columnHeaders': _headers(('views', 'INTEGER'), ('country', 'STRING'),
+                                  ('averageViewPercentage', 'FLOAT'), ('day', 'STRING')),
+        'rows': [[10, 'US', 41.5, '2026-03-01'], [7, 'IN', 38.0, '2026-03-02']]
+    })
+
+    assert table.names() == ['views', 'country', 'averageViewPercentage', 'day']
+    assert table['views'] == array('q', [10, 7])
+    assert table['averageViewPercentage'] == array('d', [41.5, 38.0])
+    assert table['country'] == ['US', 'IN']
+    assert table['day'] == array('l', [to_epoch_day('2026-03-01'), to_epoch_day('2026-03-02')])
+    assert table.row(1) == {'views': 7, 'country': 'IN', 'averageViewPercentage': 38.0, 'day': '2026-03-02'}
+
+
+def test_rename_convert_and_json_round_trip():
+    table = ReportTable.from_response({
+        'columnHeaders': _headers(('insightTrafficSourceType', 'STRING'), ('views', 'INTEGER')),
+        'rows': [['YT_SEARCH', 5], ['EXT_URL', 2]]
+    }, rename={'insightTrafficSourceType': 'source'}, convert={'views': lambda value: value * 10})
+
+    assert list(table) == [{'source': 'YT_SEARCH', 'views': 50}, {'source': 'EXT_URL', 'views': 20}]
+    assert ReportTable.from_json(table.to_json()) == table
+    assert table[1:] == ReportTable({'source': ['EXT_URL'], 'views': [20]})
+
+
+def test_response_without_rows_is_an_empty_table_with_its_columns():
+    table = ReportTable.from_response({'columnHeaders': _headers(('day', 'STRING'), ('views', 'INTEGER'))})
+    assert not table and len(table) == 0
+    assert table.names() == ['day', 'views'] and table.column('likes') == []
+
+
+def test_impressions_read_metrics_after_the_video_dimension():
+    # The video dimension is the first column; positional reads would take its id as the views
+    analytics = StubAnalytics({
+        'columnHeaders': _headers(('video', 'STRING'), ('views', 'INTEGER'), ('likes', 'INTEGER')),
+        'rows': [['a', 200, 10]]
+    })
+    assert ImpressionAnalytics(analytics).get_impression_metrics('a') == {
+        'impressions': 200, 'click_through_rate': 5.0
+    }
+
+
+def test_impressions_default_to_zero_without_rows():
+    analytics = StubAnalytics({'columnHeaders': _headers(('video', 'STRING'), ('views', 'INTEGER'))})
+    assert ImpressionAnalytics(analytics).get_impression_metrics('a') == {
+        'impressions': 0, 'click_through_rate': 0.0
+    }
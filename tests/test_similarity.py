@@ -0,0 +1,66 @@
+import random
+
+from src.analytics.similarity import DescriptionIndex, MinHasher, shingle_hashes
+
+WORDS = ("river mountain coffee camera travel recipe garden guitar lesson review city night winter "
+         "market street train ocean forest bread engine island museum song paint drone").split()
+
+TEMPLATE = ("In this episode we walk through the full build from start to finish and explain "
+            "every step so you can follow along at home with the same tools we used")
+
+FOOTER = "Subscribe for a new video every week and follow us on social media for behind the scenes clips"
+
+
+def _random_text(rng, words=30):
+    return ' '.join(rng.choice(WORDS) for _ in range(words))
+
+
+def _video(index, description, views=100):
+    return {'id': f"v{index}", 'title': f"Video {index}", 'description': description,
+            'stats': {'views': views, 'likes': 10}}
+
+
+def test_minhash_estimates_jaccard_similarity():
+    hasher = MinHasher(num_perm=256)
+    left = shingle_hashes(TEMPLATE)
+    right = shingle_hashes(TEMPLATE.replace('tools', 'gear'))
+    jaccard = len(set(left) & set(right)) / len(set(left) | set(right))
+    estimate = MinHasher.similarity(hasher.signature(left), hasher.signature(right))
+    assert abs(estimate - jaccard) < 0.1
+    assert MinHasher.similarity(hasher.signature(left), hasher.signature(shingle_hashes(FOOTER))) < 0.1
+
+
+def test_near_duplicate_descriptions_cluster_into_one_template():
+    rng = random.Random(3)
+    index = DescriptionIndex()
+    # Five videos share a template with one word swapped; the rest are unrelated
+    for number in range(5):
+        index.add(_video(number, TEMPLATE.replace('home', WORDS[number]), views=1000))
+    for number in range(5, 40):
+        index.add(_video(number, _random_text(rng)))
+
+    templates = index.templates()
+    assert len(templates) == 1
+    assert templates[0]['videos'] == 5 and templates[0]['sample_title'] == 'Video 0'
+    assert templates[0]['lift'] == 10.0
+
+
+def test_shared_paragraphs_are_boilerplate_once_enough_videos_use_them():
+    rng = random.Random(5)
+    index = DescriptionIndex(min_videos=3)
+    for number in range(6):
+        footer = FOOTER if number % 2 else FOOTER.replace('clips', 'footage')
+        index.add(_video(number, f"{_random_text(rng)}\n\n{footer}" if number < 4 else _random_text(rng)))
+
+    result = index.analyze()
+    assert [(block['block'], block['videos']) for block in result['boilerplate']] == [('B1', 4)]
+    assert result['video_blocks'] == {f"v{number}": [None, 'B1'] for number in range(4)}
+    assert result['templates'] == []
+
+
+def test_placeholder_and_empty_descriptions_are_not_indexed():
+    index = DescriptionIndex()
+    for number, description in enumerate(['No description available.', '', None, 'No description available.']):
+        index.add(_video(number, description))
+    assert len(index) == 4
+    assert index.templates() == [] and index.analyze()['boilerplate'] == []
@@ -0,0 +1,54 @@
+import io
+import json
+
+import pytest
+
+import main
+from config.settings import Settings
+from src.report.stream import JsonLinesRenderer, StreamRenderer
+
+
+def _records(text):
+    return [json.loads(line) for line in text.splitlines()]
+
+
+def test_stream_renderer_requires_both_writers():
+    with pytest.raises(TypeError):
+        StreamRenderer()
+
+    class VideosOnly(StreamRenderer):
+        def write_video(self, position, video):
+            pass
+    with pytest.raises(TypeError):
+        VideosOnly()
+
+
+def test_replay_ends_the_stream_even_when_a_section_fails():
+    stream = io.StringIO()
+    renderer = JsonLinesRenderer(stream)
+    with pytest.raises(TypeError):
+        renderer.replay({'videos': [{'id': 'a'}], 'comments': {'unserializable': object()}})
+    assert [record['type'] for record in _records(stream.getvalue())] == ['video', 'end']
+
+
+def test_gather_writes_the_end_record_when_the_snapshot_cannot_be_saved(monkeypatch, tmp_path, capsys):
+    config = Settings.load()
+    config.update(state_dir=str(tmp_path), output_mode='jsonl', work_queue=None, local_workers=0)
+
+    def gather(youtube, youtube_analytics, config, plan, renderer=None, **kwargs):
+        renderer.video({'id': 'a'})
+        return {'videos': [{'id': 'a'}]}
+
+    def save(data, path):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(main, 'initialize_apis', lambda config, profiler, meter: (object(), object(), None))
+    monkeypatch.setattr(main, 'gather_analytics_data', gather)
+    monkeypatch.setattr('src.utils.Snapshot.save', save)
+    args = main.build_parser(config).parse_args(['gather', '--output', str(tmp_path / 'snapshot.json')])
+
+    with pytest.raises(OSError):
+        main.run_command(config, args, profiler=None)
+    records = _records(capsys.readouterr().out)
+    assert [record['type'] for record in records] == ['video', 'end']
+    assert records[-1]['videos'] == 1
@@ -0,0 +1,44 @@
+from src.api.transport import MeteredHttp, TransportMeter, endpoint_name
+
+
+class Connection:
+    def __init__(self):
+        self.sock = object()
+
+
+class Http:
+    """httplib2.Http stand-in: one kept-alive connection per host, gzip bodies decoded."""
+
+    def __init__(self):
+        self.connections = {}
+
+    def request(self, uri, method='GET', body=None, headers=None, **kwargs):
+        host = uri.split('/')[2]
+        self.connections.setdefault(host, Connection())
+        response = {'status': '200', '-content-encoding': 'gzip'} if 'youtube' in uri else {'status': '200'}
+        return response, b'x' * 100
+
+
+def test_endpoint_names():
+    assert endpoint_name('https://youtube.googleapis.com/youtube/v3/videos?part=statistics') == 'youtube.videos'
+    assert endpoint_name('https://youtubeanalytics.googleapis.com/v2/reports?ids=channel') == \
+        'youtubeanalytics.reports'
+    assert endpoint_name('https://docs.googleapis.com/v1/documents/d1:batchUpdate') == 'docs.documents'
+
+
+def test_metered_http_records_size_compression_and_connection_reuse():
+    meter = TransportMeter()
+    http = MeteredHttp(Http(), meter)
+    meter.transport_opened()
+    for uri in ('https://youtube.googleapis.com/youtube/v3/videos', 'https://youtube.googleapis.com/youtube/v3/videos',
+                'https://docs.googleapis.com/v1/documents/d1'):
+        assert http.request(uri) == ({'status': '200', '-content-encoding': 'gzip'} if 'youtube' in uri
+                                     else {'status': '200'}, b'x' * 100)
+
+    # The docs host is new to the transport: a fresh connection
+    assert {name: (stats['responses'], stats['bytes'], stats['compressed'], stats['reused'])
+            for name, stats in meter.endpoints.items()} == {
+        'youtube.videos': (2, 200, 2, 1), 'docs.documents': (1, 100, 0, 0)
+    }
+    assert meter.describe()[0] == "1 pooled transports, 2 connections opened, 1/3 responses on reused connections"
+    assert http.connections is http.http.connections
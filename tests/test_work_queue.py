@@ -0,0 +1,119 @@
+import time
+
+import pytest
+
+from src.pipeline.distributed import Coordinator, QueueStalledError, Worker
+from src.pipeline.work_queue import TaskQueue, SQLiteTaskQueue, open_queue, DONE, FAILED, LEASED, PENDING
+
+RUN = 'run-1'
+
+
+@pytest.fixture
+def queue(tmp_path):
+    queue = SQLiteTaskQueue(str(tmp_path / 'queue.sqlite'), max_attempts=2, backoff_base=0.0)
+    yield queue
+    queue.close()
+
+
+class FakeEnricher:
+    def __init__(self, failing=()):
+        self.failing = set(failing)
+
+    def enrich(self, video):
+        if video['id'] in self.failing:
+            raise ConnectionError(f"backend error for {video['id']}")
+        return dict(video, enriched=True)
+
+
+def test_task_queue_is_abstract():
+    with pytest.raises(TypeError):
+        TaskQueue()
+
+
+def test_lease_complete_and_results_in_position_order(queue):
+    assert queue.submit(RUN, [(position, {'n': position}) for position in range(3)]) == 3
+    first, second = queue.lease('a'), queue.lease('b')
+    assert (first['position'], second['position']) == (0, 1)
+    assert queue.counts(RUN) == {PENDING: 1, LEASED: 2, DONE: 0, FAILED: 0}
+
+    assert queue.complete(second, 'r1')
+    # Results stop at the first gap
+    assert list(queue.results(RUN)) == []
+    assert queue.complete(first, 'r0')
+    assert list(queue.results(RUN)) == [(0, 'r0'), (1, 'r1')]
+
+
+def test_expired_lease_is_taken_over_and_first_result_wins(queue):
+    queue.submit(RUN, [(0, 'payload')])
+    stale = queue.lease('a', lease_seconds=0)
+    time.sleep(0.01)
+    fresh = queue.lease('b')
+    assert fresh['position'] == 0 and fresh['attempt'] == 2
+
+    assert queue.complete(fresh, 'fresh')
+    assert not queue.complete(stale, 'stale')
+    # The stale worker's failure does not requeue the completed task
+    queue.fail(stale, 'too late')
+    assert list(queue.results(RUN)) == [(0, 'fresh')]
+
+
+def test_failures_retry_until_max_attempts_and_resubmit_requeues(queue):
+    queue.submit(RUN, [(0, 'payload')])
+    queue.fail(queue.lease('a'), 'first')
+    queue.fail(queue.lease('a'), 'second')
+    assert queue.lease('a') is None
+    assert queue.failures(RUN) == {0: 'second'}
+
+    # Submitting the run again requeues only failed tasks
+    assert queue.submit(RUN, [(0, 'payload')]) == 1
+    queue.complete(queue.lease('a'), 'done')
+    assert queue.submit(RUN, [(0, 'payload')]) == 0
+
+
+def test_open_queue_urls(tmp_path):
+    assert isinstance(open_queue(f"sqlite://{tmp_path / 'a.sqlite'}"), SQLiteTaskQueue)
+    assert isinstance(open_queue(str(tmp_path / 'b.sqlite')), SQLiteTaskQueue)
+    with pytest.raises(Exception, match="Unsupported"):
+        open_queue('redis://localhost')
+
+
+def test_coordinator_and_worker_enrich_every_video(tmp_path):
+    path = str(tmp_path / 'queue.sqlite')
+    # One video per batch, so each is queued before the listing moves on
+    coordinator = Coordinator(SQLiteTaskQueue(path), RUN, ['stats'], [7], batch_size=1, poll_interval=0.01)
+    worker = Worker(SQLiteTaskQueue(path), lambda calls, horizons: FakeEnricher(), poll_interval=0.01,
+                    idle_exit=0)
+    videos = [(position, {'id': f"v{position}"}) for position in range(5)]
+
+    def listing():
+        for item in videos:
+            yield item
+            # Work through whatever is queued so far, as a worker on another host would
+            worker.run(RUN)
+
+    enriched = list(coordinator.run(listing()))
+    assert [position for position, _ in enriched] == list(range(5))
+    assert all(video['enriched'] for _, video in enriched)
+    assert worker.stats == {'completed': 5, 'duplicates': 0, 'failed': 0}
+
+
+def test_coordinator_fails_the_run_on_exhausted_tasks(tmp_path):
+    path = str(tmp_path / 'queue.sqlite')
+    queue = SQLiteTaskQueue(path, max_attempts=1)
+    coordinator = Coordinator(queue, RUN, ['stats'], [7], batch_size=1, poll_interval=0.01)
+    worker = Worker(SQLiteTaskQueue(path, max_attempts=1), lambda calls, horizons: FakeEnricher({'v1'}),
+                    poll_interval=0.01, idle_exit=0)
+
+    def listing():
+        yield 0, {'id': 'v0'}
+        yield 1, {'id': 'v1'}
+        worker.run(RUN)
+
+    with pytest.raises(Exception, match="video #1: backend error for v1"):
+        list(coordinator.run(listing()))
+
+
+def test_coordinator_without_workers_raises_queue_stalled(queue):
+    coordinator = Coordinator(queue, RUN, ['stats'], [7], poll_interval=0.01, stall_timeout=0.05)
+    with pytest.raises(QueueStalledError, match="is a worker running"):
+        list(coordinator.run([(0, {'id': 'v0'})]))